@@ -20,16 +20,17 @@ Questions:
 
 import json
 import re
+import sys
 from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.translation_columns import load_translation
 
 
 def load_translations():
-    """Load translations"""
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        data = json.load(f)
-        return data["translations"]
+    """Load translations (sentence-level fields, shared columnar cache)"""
+    return load_translation("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json").sentence_records()
 
 
 def extract_all_suffixes(translations):
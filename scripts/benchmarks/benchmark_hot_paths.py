@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Benchmark Suite
+Times the translation and validation hot paths on the bundled
+transcriptions and on synthetic corpora scaled 1x/10x/100x, and writes
+the results as JSON so runs can be compared for regressions.
+
+Per benchmark and corpus:
+    seconds     wall time of every timed repeat
+    best_s      fastest repeat (least noisy; used to compare runs)
+    median_s    median of the repeats (used for throughput)
+    tokens/s    corpus tokens processed per second
+    peak_mb     peak traced Python/NumPy allocation, from one extra run
+                under tracemalloc (kept out of the timed repeats)
+
+Synthetic corpora resample whole lines of the Takahashi transcription
+with a fixed seed, so word frequencies stay Zipfian while the token
+count scales. Translation benchmarks start from a cold translation
+cache on every run.
+
+Usage:
+    python scripts/benchmarks/benchmark_hot_paths.py
+    python scripts/benchmarks/benchmark_hot_paths.py --scales 1 10 --only translate_sentence
+    python scripts/benchmarks/benchmark_hot_paths.py --compare results/benchmarks/BASELINE.json
+"""
+
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import is_ivtff, load_corpus
+from common.null_models import NullModel
+from common.transform_index import AnagramIndex
+from phase3.full_manuscript_translation import generate_variants_smart
+from phase4.find_compound_and_partial_matches import find_partial_matches
+from phase10.validate_phase10_candidates import (
+    get_validated_elements,
+    load_voynich_text,
+    validate_candidates,
+)
+from translator import complete_manuscript_translator as translator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+TRANSCRIPTIONS = {
+    "takahashi": REPO_ROOT / "data" / "voynich" / "eva_transcription" / "voynich_eva_takahashi.txt",
+    "zl3b": REPO_ROOT / "data" / "voynich" / "eva_transcription" / "ZL3b-n.txt",
+}
+ME_VOCABULARY = REPO_ROOT / "results" / "phase4" / "expanded_medical_vocabulary.json"
+RESULTS_DIR = REPO_ROOT / "results" / "benchmarks"
+
+SCALES = [1, 10, 100]
+SEED = 42
+REPEATS = 3
+NULL_REPLICATES = 20
+NULL_BATCH_SIZE = 10
+# Phase 10 candidate list
+CANDIDATES = [
+    "kchy",
+    "kaiin",
+    "kar",
+    "kain",
+    "kedy",
+    "teey",
+    "keol",
+    "oiin",
+    "olchedy",
+    "olkedy",
+    "cthor",
+    "otchol",
+]
+
+
+class Corpus:
+    """One benchmark input: a transcription file and its parsed forms."""
+
+    def __init__(self, name: str, path: Path, scale: int = 1):
+        self.name = name
+        self.path = path
+        self.scale = scale
+        parsed = load_corpus(path, cache_dir=None)
+        # The translator's own loader only reads plain (Takahashi-style) text
+        self.plain = not is_ivtff(path)
+        self.words: List[str] = parsed.words()
+        self.sentences: List[Tuple[str, str]] = [
+            (folio, " ".join(words)) for folio, _, words in parsed.iter_lines() if words
+        ]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def describe(self) -> Dict:
+        return {
+            "path": str(self.path),
+            "scale": self.scale,
+            "sentences": len(self.sentences),
+            "tokens": len(self.words),
+            "types": len(set(self.words)),
+        }
+
+
+def write_synthetic_corpus(source: Path, scale: int, out_dir: Path, seed: int = SEED) -> Path:
+    """Plain-text corpus of scale x the source's lines, resampled with replacement."""
+    with open(source, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f if line.strip() and not line.startswith("#")]
+    rng = np.random.default_rng(seed + scale)
+    picks = rng.integers(0, len(lines), size=len(lines) * scale)
+    path = out_dir / f"synthetic_{scale}x.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines[i] + "\n" for i in picks.tolist())
+    return path
+
+
+def morpheme_scorer(word: str) -> Tuple[int, int]:
+    """(morphemes, recognized morphemes) of a word under the current translator."""
+    glosses = translator.segment_morphology(word)["translation"]
+    return len(glosses), sum(1 for g in glosses if not g.startswith("[?"))
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+# Each setup takes a Corpus and a work directory and returns the callable
+# to time (or (callable, tokens) when it does not process the corpus
+# tokens), or None when the benchmark does not apply to that corpus.
+
+
+def bench_load_manuscript(corpus: Corpus, work_dir: Path):
+    if not corpus.plain:
+        return None
+    return lambda: translator.load_manuscript(corpus.path)
+
+
+def bench_load_corpus(corpus: Corpus, work_dir: Path):
+    return lambda: load_corpus(corpus.path, cache_dir=None)
+
+
+def bench_translate_word(corpus: Corpus, work_dir: Path):
+    def run():
+        translator.invalidate_translation_cache()
+        for word in corpus.words:
+            translator.translate_word(word.lower())
+
+    return run
+
+
+def bench_translate_sentence(corpus: Corpus, work_dir: Path):
+    def run():
+        translator.invalidate_translation_cache()
+        for folio, text in corpus.sentences:
+            translator.translate_sentence(text, folio)
+
+    return run
+
+
+def translate_manuscript_bench(output_format: str, max_scale: int):
+    def setup(corpus: Corpus, work_dir: Path):
+        if not corpus.plain or corpus.scale > max_scale:
+            return None
+        output = work_dir / f"translation.{output_format}"
+
+        def run():
+            translator.invalidate_translation_cache()
+            with redirect_stdout(io.StringIO()):
+                translator.translate_manuscript(corpus.path, output, output_format=output_format)
+
+        return run
+
+    return setup
+
+
+def bench_apply_e_o_substitution(corpus: Corpus, work_dir: Path):
+    def run():
+        for word in corpus.words:
+            translator.apply_e_o_substitution(word)
+
+    return run
+
+
+def bench_generate_variants_smart(corpus: Corpus, work_dir: Path):
+    def run():
+        for word in corpus.words:
+            generate_variants_smart(word)
+
+    return run
+
+
+def bench_scramble_matches(corpus: Corpus, work_dir: Path):
+    with open(ME_VOCABULARY, "r", encoding="utf-8") as f:
+        vocab = list(json.load(f))
+
+    def run():
+        index = AnagramIndex(vocab)
+        for word in corpus.words:
+            index.scramble_eo_matches(word)
+
+    return run
+
+
+def bench_find_partial_matches(corpus: Corpus, work_dir: Path):
+    with open(ME_VOCABULARY, "r", encoding="utf-8") as f:
+        vocab = json.load(f)
+    freqs = {}
+    for word in corpus.words:
+        freqs[word] = freqs.get(word, 0) + 1
+
+    def run():
+        with redirect_stdout(io.StringIO()):
+            find_partial_matches(vocab, freqs)
+
+    return run
+
+
+def bench_validate_candidate(corpus: Corpus, work_dir: Path):
+    # The framework needs folio sections, which only ZL3b carries; synthetic
+    # corpora use its word entries repeated scale times
+    if corpus.name == "takahashi":
+        return None
+    words_list = load_voynich_text(TRANSCRIPTIONS["zl3b"]) * corpus.scale
+    validated = get_validated_elements()
+    return lambda: validate_candidates(CANDIDATES, words_list, validated), len(words_list)
+
+
+def null_scoring_bench(replicates: int):
+    def setup(corpus: Corpus, work_dir: Path):
+        def run():
+            model = NullModel(corpus.words, seed=SEED)
+            model.observed_rate(morpheme_scorer)
+            model.char_scramble_null(morpheme_scorer, replicates, batch_size=NULL_BATCH_SIZE)
+            model.random_text_null(morpheme_scorer, replicates, batch_size=NULL_BATCH_SIZE)
+
+        return run
+
+    return setup
+
+
+def benchmark_suite(null_replicates: int = NULL_REPLICATES) -> Dict[str, Callable]:
+    """Benchmark name -> setup(corpus, work_dir), in reporting order."""
+    return {
+        "load_manuscript": bench_load_manuscript,
+        "load_corpus": bench_load_corpus,
+        "translate_word": bench_translate_word,
+        "translate_sentence": bench_translate_sentence,
+        # A 100x JSON document is ~2 GB; the streaming path covers that scale
+        "translate_manuscript[json]": translate_manuscript_bench("json", max_scale=10),
+        "translate_manuscript[jsonl]": translate_manuscript_bench("jsonl", max_scale=100),
+        "apply_e_o_substitution": bench_apply_e_o_substitution,
+        "generate_variants_smart": bench_generate_variants_smart,
+        "scramble_eo_matches": bench_scramble_matches,
+        "find_partial_matches": bench_find_partial_matches,
+        "validate_candidates": bench_validate_candidate,
+        "null_scoring": null_scoring_bench(null_replicates),
+    }
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+
+def measure(run: Callable, tokens: int, repeats: int, trace_memory: bool = True) -> Dict:
+    """Time repeats of run(); one further traced run gives the peak memory."""
+    seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - start)
+    median = statistics.median(seconds)
+
+    peak_mb = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "tokens": tokens,
+        "seconds": [round(s, 6) for s in seconds],
+        "best_s": round(min(seconds), 6),
+        "median_s": round(median, 6),
+        "tokens_per_s": round(tokens / median, 1) if median > 0 else None,
+        "peak_mb": round(peak_mb, 2) if peak_mb is not None else None,
+    }
+
+
+def environment() -> Dict:
+    """Interpreter, library and checkout details recorded with every run."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(
+    scales: List[int],
+    only: Optional[List[str]] = None,
+    repeats: int = REPEATS,
+    null_replicates: int = NULL_REPLICATES,
+    trace_memory: bool = True,
+) -> Dict:
+    """Run every selected benchmark on every corpus; returns the results document."""
+    suite = benchmark_suite(null_replicates)
+    if only:
+        unknown = sorted(set(only) - set(suite))
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+        suite = {name: setup for name, setup in suite.items() if name in only}
+
+    results = []
+    corpora_info = {}
+    with tempfile.TemporaryDirectory(prefix="voynich_bench_") as tmp:
+        work_dir = Path(tmp)
+        sources = [(name, path, 1) for name, path in TRANSCRIPTIONS.items()]
+        sources += [
+            (f"synthetic_{scale}x", write_synthetic_corpus(TRANSCRIPTIONS["takahashi"], scale, work_dir), scale)
+            for scale in scales
+        ]
+
+        for name, path, scale in sources:
+            corpus = Corpus(name, path, scale)
+            corpora_info[name] = corpus.describe()
+            print(f"\n{name}: {len(corpus):,} tokens, {len(corpus.sentences):,} sentences")
+            for bench_name, setup in suite.items():
+                run = setup(corpus, work_dir)
+                if run is None:
+                    continue
+                run, tokens = run if isinstance(run, tuple) else (run, len(corpus))
+                result = measure(run, tokens, repeats, trace_memory)
+                results.append({"benchmark": bench_name, "corpus": name, **result})
+                peak = f"{result['peak_mb']:9.1f} MB" if result["peak_mb"] is not None else ""
+                print(
+                    f"  {bench_name:30s} {result['median_s']:9.3f} s "
+                    f"{result['tokens_per_s'] or 0:14,.0f} tok/s {peak}"
+                )
+            del corpus
+
+    return {
+        "metadata": {
+            **environment(),
+            "scales": scales,
+            "repeats": repeats,
+            "seed": SEED,
+            "null_replicates": null_replicates,
+        },
+        "corpora": corpora_info,
+        "results": results,
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Best-time change of every (benchmark, corpus) present in both runs.
+    A change above threshold (fraction) is flagged as a regression.
+    """
+    previous = {(r["benchmark"], r["corpus"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        old = previous.get((result["benchmark"], result["corpus"]))
+        if old is None or not old["best_s"]:
+            continue
+        change = result["best_s"] / old["best_s"] - 1
+        rows.append(
+            {
+                "benchmark": result["benchmark"],
+                "corpus": result["corpus"],
+                "baseline_s": old["best_s"],
+                "current_s": result["best_s"],
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return rows
+
+
+def print_comparison(rows: List[Dict], threshold: float):
+    print("\n" + "=" * 80)
+    print(f"COMPARISON WITH BASELINE (regression: > {threshold * 100:.0f}% slower)")
+    print("=" * 80)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"  {row['benchmark']:30s} {row['corpus']:15s} "
+            f"{row['baseline_s']:9.3f} -> {row['current_s']:9.3f} s "
+            f"({row['change'] * 100:+6.1f}%) {flag}"
+        )
+    regressions = sum(row["regression"] for row in rows)
+    print(f"\n{regressions} regression(s) in {len(rows)} comparable measurements")
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the translation and validation hot paths"
+    )
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=SCALES, help="Synthetic corpus scales"
+    )
+    parser.add_argument(
+        "--only", nargs="+", help="Run only these benchmarks (see benchmark_suite())"
+    )
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--null-replicates", type=int, default=NULL_REPLICATES)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the traced peak-memory run"
+    )
+    parser.add_argument("--output", help="Results JSON (default: results/benchmarks/)")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Regression threshold (fraction)"
+    )
+    args = parser.parse_args()
+
+    report = run_suite(
+        args.scales,
+        only=args.only,
+        repeats=args.repeats,
+        null_replicates=args.null_replicates,
+        trace_memory=not args.no_memory,
+    )
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = RESULTS_DIR / f"BENCHMARK_{stamp}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {output_path}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, report, args.threshold)
+        print_comparison(rows, args.threshold)
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
@@ -0,0 +1,9 @@
+"""
+Shared helpers for the Voynich analysis scripts.
+
+Scripts in sibling folders import these modules after adding the
+scripts/ directory to sys.path:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from common.eva_corpus import load_corpus
+"""
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick Multi-Pattern Matcher
+Builds one automaton over a whole pattern list (e.g. every Middle English
+variant) and reports every embedded occurrence in a single left-to-right
+pass over a text, so substring search costs O(len(text) + matches) per
+word instead of O(patterns x len(text)).
+
+Usage:
+    matcher = AhoCorasick(["root", "toor", "flor"])
+    for start, pattern_id in matcher.iter_matches("qoroote"):
+        ...
+    matcher.first_occurrences("qoroote")   # {pattern_id: first start}
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over a fixed list of string patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: Patterns to match; a pattern's id is its index in
+                this sequence. Empty patterns are ignored.
+        """
+        self.patterns: List[str] = list(patterns)
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(pattern_id)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """Breadth-first failure links; outputs inherit their fallback's outputs."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                if self.output[self.fail[child]]:
+                    self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, pattern_id) for every occurrence, in order of end position."""
+        goto, fail, output, patterns = self.goto, self.fail, self.output, self.patterns
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                yield end - len(patterns[pattern_id]), pattern_id
+
+    def first_occurrences(self, text: str) -> Dict[int, int]:
+        """Map each pattern found in text to its leftmost start (like str.index)."""
+        found: Dict[int, int] = {}
+        for start, pattern_id in self.iter_matches(text):
+            if pattern_id not in found or start < found[pattern_id]:
+                found[pattern_id] = start
+        return found
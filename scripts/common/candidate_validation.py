@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Batch Candidate Validation Aggregates
+Corpus-wide counts behind the 10-point validation framework (phase10,
+phase11), computed in one pass for a whole candidate list instead of
+several full passes per candidate.
+
+One sweep over the word entries collects exact counts, pseudo-sentence
+positions, per-section counts and neighbour co-occurrence with validated
+elements for every word type; compound counts for the candidates come
+from one Aho-Corasick pass over the distinct types. Scoring a candidate
+is then a handful of dictionary lookups.
+
+Usage:
+    aggregates = CandidateAggregates(words, validated, candidates)
+    aggregates.exact[word], aggregates.compound[word]
+    aggregates.position_counts(word)   # {"initial": .., "medial": .., "final": ..}
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Set
+
+from common.aho_corasick import AhoCorasick
+
+SENTENCE_MAX_WORDS = 8
+SENTENCE_MIN_WORDS = 3
+
+
+def chunk_sentences(words_list: List[Dict]) -> List[List[str]]:
+    """
+    Pseudo-sentences as used by the framework: chunks of up to 8 words,
+    also cut where the section changes; chunks under 3 words are dropped.
+    """
+    sentences = []
+    current_sentence = []
+    for i, entry in enumerate(words_list):
+        current_sentence.append(entry["word"])
+        if len(current_sentence) >= SENTENCE_MAX_WORDS or (
+            i > 0 and entry["section"] != words_list[i - 1]["section"]
+        ):
+            if len(current_sentence) >= SENTENCE_MIN_WORDS:
+                sentences.append(current_sentence)
+            current_sentence = []
+    return sentences
+
+
+def compound_counts(candidates: Iterable[str], exact: Counter) -> Counter:
+    """
+    Tokens that contain each candidate as a proper substring
+    (candidate in word and word != candidate), counted over word types.
+    """
+    candidates = list(dict.fromkeys(candidates))
+    matcher = AhoCorasick(candidates)
+    counts = Counter({candidate: 0 for candidate in candidates})
+    for word, count in exact.items():
+        for candidate_id in matcher.first_occurrences(word):
+            candidate = candidates[candidate_id]
+            if candidate != word:
+                counts[candidate] += count
+    return counts
+
+
+class CandidateAggregates:
+    """Shared corpus aggregates for scoring many candidates at once."""
+
+    def __init__(
+        self,
+        words_list: List[Dict],
+        validated_elements: Set[str],
+        candidates: Iterable[str],
+    ):
+        """
+        Args:
+            words_list: Word entries with "word" and "section" keys, in text order
+            validated_elements: Elements counted as co-occurrence partners
+            candidates: Words whose compound counts are needed
+        """
+        word_strings = [w["word"] for w in words_list]
+        self.exact = Counter(word_strings)
+        self.compound = compound_counts(candidates, self.exact)
+
+        # Pseudo-sentence positions: word -> [initial, medial, final]
+        self.positions = defaultdict(lambda: [0, 0, 0])
+        for sentence in chunk_sentences(words_list):
+            last = len(sentence) - 1
+            for i, word in enumerate(sentence):
+                slot = 0 if i == 0 else (2 if i == last else 1)
+                self.positions[word][slot] += 1
+
+        # Section counts per word, and section sizes
+        self.section_counts: Dict[str, Counter] = defaultdict(Counter)
+        self.section_totals = Counter()
+        for entry in words_list:
+            if entry["section"]:
+                self.section_counts[entry["word"]][entry["section"]] += 1
+                self.section_totals[entry["section"]] += 1
+        self.total_words = sum(self.section_totals.values())
+
+        # Tokens with a validated element immediately before or after
+        self.cooccur = Counter()
+        for i in range(1, len(word_strings) - 1):
+            if (
+                word_strings[i - 1] in validated_elements
+                or word_strings[i + 1] in validated_elements
+            ):
+                self.cooccur[word_strings[i]] += 1
+
+    def position_counts(self, word: str) -> Dict[str, int]:
+        """Pseudo-sentence position counts of word."""
+        initial, medial, final = self.positions.get(word, (0, 0, 0))
+        return {"initial": initial, "medial": medial, "final": final}
+
+    def section_split(self, word: str, section: str):
+        """
+        2x2 contingency counts for word in section versus the rest:
+        (word in section, word elsewhere, section size, rest size).
+        """
+        counts = self.section_counts.get(word, Counter())
+        in_section = counts[section]
+        return (
+            in_section,
+            sum(counts.values()) - in_section,
+            self.section_totals[section],
+            self.total_words - self.section_totals[section],
+        )
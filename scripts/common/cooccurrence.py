@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Windowed Co-occurrence Engine
+Builds a sparse label x label matrix of windowed co-occurrence in one
+vectorized pass, instead of rescanning the corpus for every root pair.
+
+Entry (a, b) counts the instances of a that have at least one b within
++/- window positions in the same sentence. This is the quantity behind
+"root1 appears near root2 in X% of its instances", so any pair's rate is
+a lookup once the matrix is built.
+
+Usage:
+    cooc = CooccurrenceMatrix.from_translations(translations, window=5)
+    pct, instances = cooc.rate("che", "qok")
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def translation_roots(translations: Iterable[Dict]) -> Iterable[List]:
+    """Per-sentence lists of morphology roots from translator output."""
+    for sentence in translations:
+        yield [
+            word.get("morphology", {}).get("root")
+            for word in sentence.get("words", [])
+        ]
+
+
+class CooccurrenceMatrix:
+    """Sparse windowed co-occurrence counts over sentence-bounded sequences."""
+
+    def __init__(self, sequences: Iterable[Sequence[Hashable]], window: int = 5):
+        """
+        Args:
+            sequences: One sequence of labels (roots, words, ...) per sentence;
+                windows never cross sentence boundaries. None is a valid label.
+            window: Number of positions on each side of an instance to inspect
+        """
+        self.window = window
+        self.index: Dict[Hashable, int] = {}
+        ids: List[int] = []
+        sentence_ids: List[int] = []
+        for sentence_id, sequence in enumerate(sequences):
+            for label in sequence:
+                ids.append(self.index.setdefault(label, len(self.index)))
+                sentence_ids.append(sentence_id)
+
+        self.labels = list(self.index)
+        self.tokens = np.asarray(ids, dtype=np.int64)
+        self.sentence = np.asarray(sentence_ids, dtype=np.int64)
+
+        n_labels = len(self.labels)
+        self.instances = np.bincount(self.tokens, minlength=n_labels)
+        self.matrix = self._build(n_labels)
+        coo = self.matrix.tocoo()
+        self._pairs = dict(
+            zip(
+                (coo.row.astype(np.int64) * n_labels + coo.col).tolist(),
+                coo.data.tolist(),
+            )
+        )
+
+    def _build(self, n_labels: int) -> sparse.csr_matrix:
+        """One pass over all offsets in [-window, window], deduplicated per instance."""
+        n = len(self.tokens)
+        positions = []
+        neighbours = []
+        for offset in range(1, self.window + 1):
+            if offset >= n:
+                break
+            left = np.arange(n - offset)
+            right = left + offset
+            same = self.sentence[left] == self.sentence[right]
+            left, right = left[same], right[same]
+            # Both directions: left sees right, right sees left
+            positions.extend((left, right))
+            neighbours.extend((self.tokens[right], self.tokens[left]))
+
+        if not positions:
+            return sparse.csr_matrix((n_labels, n_labels), dtype=np.int64)
+
+        positions = np.concatenate(positions)
+        neighbours = np.concatenate(neighbours)
+
+        # An instance counts once per neighbouring label, however many times
+        # that label occurs in its window
+        instance_keys = np.unique(positions * n_labels + neighbours)
+        rows = self.tokens[instance_keys // n_labels]
+        cols = instance_keys % n_labels
+
+        pair_keys, counts = np.unique(rows * n_labels + cols, return_counts=True)
+        return sparse.csr_matrix(
+            (counts, (pair_keys // n_labels, pair_keys % n_labels)),
+            shape=(n_labels, n_labels),
+        )
+
+    @classmethod
+    def from_translations(
+        cls, translations: Iterable[Dict], window: int = 5
+    ) -> "CooccurrenceMatrix":
+        """Build over the morphology roots of translator output sentences."""
+        return cls(translation_roots(translations), window)
+
+    def instance_count(self, label: Hashable) -> int:
+        """Number of instances of label."""
+        i = self.index.get(label)
+        return int(self.instances[i]) if i is not None else 0
+
+    def count(self, label: Hashable, partner: Hashable) -> int:
+        """Instances of label with partner within the window."""
+        i, j = self.index.get(label), self.index.get(partner)
+        if i is None or j is None:
+            return 0
+        return self._pairs.get(i * len(self.labels) + j, 0)
+
+    def rate(self, label: Hashable, partner: Hashable) -> Tuple[float, int]:
+        """
+        Percentage of label's instances with partner nearby.
+        Returns (percentage, instances of label).
+        """
+        instances = self.instance_count(label)
+        if instances == 0:
+            return 0, 0
+        return self.count(label, partner) / instances * 100, instances
+
+    def top_partners(
+        self, label: Hashable, limit: Optional[int] = 10
+    ) -> List[Tuple[Hashable, int]]:
+        """Most frequent window partners of label, as (partner, count)."""
+        i = self.index.get(label)
+        if i is None:
+            return []
+        row = self.matrix.getrow(i).tocoo()
+        order = np.argsort(-row.data, kind="stable")[:limit]
+        return [(self.labels[row.col[k]], int(row.data[k])) for k in order]
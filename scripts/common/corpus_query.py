@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Query Engine over the Translated Corpus
+Answers the questions the root investigations ask ("every token whose
+root is X", "what comes right before them", "which tokens with root X
+have a root Y within N words") from per-field posting lists instead of
+a hand-written scan over the nested JSON per question.
+
+Posting lists are built lazily, one stable argsort per field, over the
+TranslationColumns of a translator output. For every value of a field
+they hold the sorted token indices carrying it, so a filter is a slice
+(or a union of slices) and a conjunction is a membership mask over the
+queried tokens.
+
+Fields:
+    word, prefix, root, confidence, method, final    token fields
+    suffix                                           any suffix of the token
+    position                                         index in the sentence;
+                                                     negative counts from the end
+    folio, section                                   of the token's sentence
+
+A filter value is a string (equality), None (field unset; for suffix, no
+suffixes at all), a list/tuple/set (any of) or a callable (predicate
+over the set values, e.g. lambda f: "[?ch]" in f).
+
+Counts from count_by() list values in order of first occurrence in the
+queried tokens, so most_common() tie-breaks like a Counter filled by a
+scan over the sentences.
+
+Usage:
+    index = CorpusIndex(load_translation())
+    ch = index.query(root="ch")
+    ch.near(index.query(root="sh"), window=3)         # proximity join
+    ch.neighbours(-1).count_by("final")               # words before [?ch]
+    index.query(final=lambda f: "[?al]" in f).count_by("section")
+"""
+
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from common.token_array import UNKNOWN_SECTION
+from common.translation_columns import TOKEN_FIELDS, TranslationColumns
+
+SENTENCE_FIELDS = ("folio", "section")
+
+
+def build_postings(ids: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSR posting lists of an id column with values in [-1, size).
+    The tokens with id v are order[offsets[v + 1]:offsets[v + 2]], sorted
+    (slot 0 holds the tokens with id -1).
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    order = np.argsort(ids, kind="stable")
+    counts = np.bincount(ids + 1, minlength=size + 1)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    return offsets, order
+
+
+class CorpusIndex:
+    """Posting lists over a TranslationColumns, built on first use."""
+
+    def __init__(
+        self,
+        columns: TranslationColumns,
+        section_of: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        Args:
+            columns: Columnar translator output (load_translation())
+            section_of: Folio -> section name (None = unassigned); without
+                it every sentence is in section "unknown"
+        """
+        self.columns = columns
+        self.sentence = np.asarray(columns.sentence)
+        self.offsets = np.asarray(columns.sentence_offsets, dtype=np.int64)
+        self.position = np.asarray(columns.position)
+        lengths = np.diff(self.offsets)
+        self.position_from_end = lengths[self.sentence] - 1 - self.position
+
+        folio_section = [
+            section_of(folio) if section_of else UNKNOWN_SECTION
+            for folio in columns.folios
+        ]
+        self.sections: List[str] = list(dict.fromkeys(s for s in folio_section if s is not None))
+        section_id = {s: i for i, s in enumerate(self.sections)}
+        self.folio_section = np.asarray(
+            [section_id.get(s, -1) for s in folio_section], dtype=np.int64
+        )
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        """Number of tokens."""
+        return len(self.columns)
+
+    # ------------------------------------------------------------------
+    # Columns and posting lists
+    # ------------------------------------------------------------------
+
+    def vocab(self, field: str) -> List[str]:
+        """Values of a filterable field, indexed by id."""
+        if field == "folio":
+            return self.columns.folios
+        if field == "section":
+            return self.sections
+        return self.columns.vocab(field)
+
+    def column(self, field: str) -> np.ndarray:
+        """Per-token id column of a token or sentence field."""
+        if field == "folio":
+            return np.asarray(self.columns.folio)[self.sentence]
+        if field == "section":
+            return self.folio_section[np.asarray(self.columns.folio)][self.sentence]
+        if field in ("position", "position_from_end"):
+            return getattr(self, field)
+        return np.asarray(getattr(self.columns, field))
+
+    def postings(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(offsets, tokens) posting lists of a field, built once."""
+        if field not in self._postings:
+            if field == "suffix":
+                n = len(self)
+                owner = np.repeat(
+                    np.arange(n, dtype=np.int64), np.diff(self.columns.suffix_offsets)
+                )
+                # (suffix, token) pairs, sorted and without repeats
+                pairs = np.unique(np.asarray(self.columns.suffix_ids, dtype=np.int64) * n + owner)
+                counts = np.bincount(pairs // n, minlength=len(self.vocab(field)))
+                # Slot 0: tokens with no suffix at all
+                bare = np.flatnonzero(self.columns.suffix_count() == 0)
+                offsets = np.concatenate(([0], len(bare) + np.cumsum(np.concatenate(([0], counts)))))
+                self._postings[field] = (offsets, np.concatenate((bare, pairs % n)))
+            elif field in ("position", "position_from_end"):
+                values = self.column(field)
+                size = int(values.max()) + 1 if len(values) else 0
+                self._postings[field] = build_postings(values, size)
+            else:
+                self._postings[field] = build_postings(self.column(field), len(self.vocab(field)))
+        return self._postings[field]
+
+    def posting(self, field: str, type_id: int) -> np.ndarray:
+        """Sorted tokens whose field has id type_id (-1 = unset)."""
+        offsets, tokens = self.postings(field)
+        if type_id + 2 >= len(offsets):
+            return np.empty(0, dtype=np.int64)
+        return tokens[offsets[type_id + 1] : offsets[type_id + 2]]
+
+    def _union(self, field: str, type_ids: Iterable[int]) -> np.ndarray:
+        """Sorted tokens carrying any of the ids (a token listed once)."""
+        parts = [self.posting(field, i) for i in type_ids]
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        if len(parts) == 1:
+            return parts[0]
+        return np.unique(np.concatenate(parts))
+
+    def lookup(self, field: str, value) -> np.ndarray:
+        """Sorted tokens matching one filter (see the module docstring)."""
+        if field == "position":
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if not values:
+                return np.empty(0, dtype=np.int64)
+            parts = [
+                self.posting("position", v) if v >= 0 else self.posting("position_from_end", -v - 1)
+                for v in values
+            ]
+            return np.unique(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+        if field not in TOKEN_FIELDS and field not in SENTENCE_FIELDS and field != "suffix":
+            raise ValueError(f"Unknown query field: {field}")
+        if callable(value):
+            hit = np.flatnonzero(
+                np.fromiter((bool(value(v)) for v in self.vocab(field)), dtype=bool)
+            )
+            return self._union(field, hit.tolist())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            ids = [(v, self.type_id(field, v)) for v in value]
+            return self._union(field, [i for v, i in ids if i >= 0 or v is None])
+        type_id = self.type_id(field, value)
+        if type_id < 0 and value is not None:
+            return np.empty(0, dtype=np.int64)
+        return self.posting(field, type_id)
+
+    def type_id(self, field: str, value) -> int:
+        """Id of a value in a field's vocabulary (-1 for None or unseen)."""
+        if field in SENTENCE_FIELDS:
+            if value is None:
+                return -1
+            try:
+                return self.vocab(field).index(value)
+            except ValueError:
+                return -1
+        return self.columns.id_of(field, value)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def all(self) -> "Query":
+        """Every token."""
+        return Query(self, np.arange(len(self), dtype=np.int64))
+
+    def query(self, **filters) -> "Query":
+        """Tokens matching every filter (all tokens if none given)."""
+        return self.all().where(**filters) if filters else self.all()
+
+    def sentences(self, sentences: Iterable[int]) -> "Query":
+        """Every token of the given sentences."""
+        sentences = np.unique(np.asarray(list(sentences), dtype=np.int64))
+        starts, ends = self.offsets[sentences], self.offsets[sentences + 1]
+        lengths = ends - starts
+        tokens = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        return Query(self, tokens + np.arange(int(lengths.sum()), dtype=np.int64))
+
+
+class Query:
+    """
+    A sequence of token indices with filters, joins and group-bys.
+    Filter and index queries hold sorted unique tokens; context() keeps
+    one entry per (token, offset) pair, so it can repeat tokens and is
+    ordered by source token. Filters, &, - and near() keep that order
+    and those repeats; | and sentences() return sorted unique tokens.
+    """
+
+    def __init__(self, index: CorpusIndex, tokens: np.ndarray):
+        self.index = index
+        self.tokens = np.asarray(tokens, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __iter__(self):
+        return iter(self.tokens.tolist())
+
+    def __and__(self, other: "Query") -> "Query":
+        return self._keep(np.isin(self.tokens, other.tokens))
+
+    def __or__(self, other: "Query") -> "Query":
+        return Query(self.index, np.union1d(self.tokens, other.tokens))
+
+    def __sub__(self, other: "Query") -> "Query":
+        return self._keep(~np.isin(self.tokens, other.tokens))
+
+    def _keep(self, mask: np.ndarray) -> "Query":
+        """The tokens where mask is set, in order (repeats kept)."""
+        return Query(self.index, self.tokens[mask])
+
+    # ------------------------------------------------------------------
+    # Filters and joins
+    # ------------------------------------------------------------------
+
+    def where(self, **filters) -> "Query":
+        """Tokens that also match every filter, in order (repeats kept)."""
+        keep = np.ones(len(self.tokens), dtype=bool)
+        for field, value in filters.items():
+            keep &= np.isin(self.tokens, self.index.lookup(field, value))
+        return self._keep(keep)
+
+    def near(self, other: "Query", window: Optional[int] = None, side: str = "both") -> "Query":
+        """
+        Tokens with at least one other token (not themselves) in the same
+        sentence at most window words away.
+
+        Args:
+            other: Tokens to look for
+            window: Maximum distance in words (None = anywhere in the sentence)
+            side: "before", "after" or "both" (where the other token sits)
+        """
+        a = self.tokens
+        # Context queries may be unsorted and repeat tokens
+        b = np.unique(other.tokens)
+        sentence = self.index.sentence[a]
+        start, end = self.index.offsets[sentence], self.index.offsets[sentence + 1]
+        reach = window if window is not None else np.iinfo(np.int32).max
+        found = np.zeros(len(a), dtype=bool)
+        if side in ("before", "both"):
+            lo = np.maximum(a - reach, start)
+            found |= np.searchsorted(b, a) > np.searchsorted(b, lo)
+        if side in ("after", "both"):
+            hi = np.minimum(a + reach + 1, end)
+            found |= np.searchsorted(b, hi) > np.searchsorted(b, a + 1)
+        return Query(self.index, a[found])
+
+    def same_sentence(self, other: "Query") -> "Query":
+        """Tokens whose sentence contains any token of other (themselves included)."""
+        keep = np.isin(self.index.sentence[self.tokens], self.index.sentence[other.tokens])
+        return Query(self.index, self.tokens[keep])
+
+    def sentence_ids(self) -> np.ndarray:
+        """Sorted unique sentences of the tokens."""
+        return np.unique(self.index.sentence[self.tokens])
+
+    def sentences(self) -> "Query":
+        """Every token of the sentences containing these tokens."""
+        return self.index.sentences(self.sentence_ids())
+
+    def neighbours(self, offset: int) -> "Query":
+        """
+        The token offset words away from each token, within its sentence.
+        Keeps one entry per source token (so repeats are possible) in
+        source order; tokens without such a neighbour are dropped.
+        """
+        return self.context([offset])
+
+    def context(self, offsets: Iterable[int]) -> "Query":
+        """
+        Tokens at each of the given offsets from every token, within its
+        sentence, in source order and offset order (repeats kept).
+        """
+        offsets = np.asarray(list(offsets), dtype=np.int64)
+        sentence = self.index.sentence[self.tokens]
+        start = self.index.offsets[sentence][:, None]
+        end = self.index.offsets[sentence + 1][:, None]
+        target = self.tokens[:, None] + offsets[None, :]
+        valid = (target >= start) & (target < end)
+        return Query(self.index, target[valid])
+
+    def window(self, window: int, side: str = "both") -> "Query":
+        """Context tokens up to window words before and/or after each token."""
+        before = range(-window, 0) if side in ("before", "both") else []
+        after = range(1, window + 1) if side in ("after", "both") else []
+        return self.context([*before, *after])
+
+    # ------------------------------------------------------------------
+    # Group-by
+    # ------------------------------------------------------------------
+
+    def values(self, field: str) -> List:
+        """Values of a field for every token, in order (None where unset)."""
+        if field == "suffixes":
+            return ["-".join(self.index.columns.suffixes_of(t)) for t in self.tokens.tolist()]
+        if field == "position":
+            return self.index.position[self.tokens].tolist()
+        vocab = self.index.vocab(field)
+        return [vocab[i] if i >= 0 else None for i in self.index.column(field)[self.tokens].tolist()]
+
+    def count_by(self, field: str) -> Counter:
+        """
+        Counter of a field's values over the tokens (unset values skipped),
+        keyed in order of first occurrence. "suffixes" groups by the
+        joined suffix chain ("" for none), "position" by word index.
+        """
+        if field in ("suffixes", "position"):
+            return Counter(self.values(field))
+        ids = self.index.column(field)[self.tokens]
+        ids = ids[ids >= 0]
+        unique, first, counts = np.unique(ids, return_index=True, return_counts=True)
+        vocab = self.index.vocab(field)
+        order = np.argsort(first, kind="stable")
+        return Counter({vocab[unique[k]]: int(counts[k]) for k in order.tolist()})
+
+    def count_sentences_by(self, field: str) -> Counter:
+        """Counter of a sentence field (folio, section) over the distinct sentences."""
+        sentences = self.sentence_ids()
+        first = self.index.offsets[sentences]
+        return Query(self.index, first).count_by(field)
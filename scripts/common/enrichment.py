@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Vectorized Section Enrichment Engine
+Tests every word type for enrichment in every manuscript section at once,
+instead of building one 2x2 table per term and calling
+scipy.stats.chi2_contingency in a Python loop.
+
+For term t and section s the 2x2 table is
+
+                 in section     elsewhere
+    term t       a              b
+    other words  c              d
+
+and all four cells are computed as (types x sections) arrays from the
+type x section count matrix (TokenArray.section_counts()). Chi-square
+and G statistics match chi2_contingency on each table (including the
+Yates continuity correction it applies to 2x2 tables); the Fisher test
+is the one-sided "greater" alternative, i.e. enrichment only. Screening
+the whole lexicon applies Benjamini-Hochberg FDR control over all
+tested (term, section) cells.
+
+Usage:
+    engine = SectionEnrichment.from_token_array(tokens, sections=SECTIONS)
+    for row in engine.screen(test="g", alpha=0.05, min_count=5):
+        print(row["word"], row["section"], row["enrichment"], row["q_value"])
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import stats
+
+TESTS = ("chi2", "g", "fisher")
+
+
+# ============================================================================
+# 2x2 STATISTICS (broadcast over arrays of tables)
+# ============================================================================
+
+
+def expected_2x2(a, b, c, d) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Expected cell counts under independence for tables [[a, b], [c, d]]."""
+    a, b, c, d = (np.asarray(x, dtype=np.float64) for x in (a, b, c, d))
+    n = a + b + c + d
+    with np.errstate(divide="ignore", invalid="ignore"):
+        row1, row2 = (a + b) / n, (c + d) / n
+        col1, col2 = a + c, b + d
+        return row1 * col1, row1 * col2, row2 * col1, row2 * col2
+
+
+def _deviation(a, b, c, d, correction: bool):
+    """Observed/expected cells and the common |O - E| after Yates correction."""
+    observed = [np.asarray(x, dtype=np.float64) for x in (a, b, c, d)]
+    expected = expected_2x2(*observed)
+    # In a 2x2 table every cell deviates from expectation by the same amount
+    deviation = np.abs(observed[0] - expected[0])
+    if correction:
+        deviation = deviation - np.minimum(0.5, deviation)
+    valid = np.all([e > 0 for e in expected], axis=0)
+    return observed, expected, deviation, valid
+
+
+def chi_square_2x2(a, b, c, d, correction: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pearson chi-square for tables [[a, b], [c, d]].
+
+    Args:
+        a, b, c, d: Cell counts (scalars or arrays of the same shape)
+        correction: Apply the Yates continuity correction (as
+            chi2_contingency does for 2x2 tables)
+
+    Returns:
+        (chi2, p_value) arrays; NaN where an expected count is zero
+    """
+    _, expected, deviation, valid = _deviation(a, b, c, d, correction)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2 = deviation**2 * sum(1.0 / e for e in expected)
+    chi2 = np.where(valid, chi2, np.nan)
+    return chi2, stats.chi2.sf(chi2, 1)
+
+
+def g_test_2x2(a, b, c, d, correction: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Log-likelihood ratio (G) test for tables [[a, b], [c, d]].
+    Same as chi2_contingency(..., lambda_="log-likelihood"); cells are
+    moved toward expectation by the Yates correction before the log.
+
+    Returns:
+        (g, p_value) arrays; NaN where an expected count is zero
+    """
+    observed, expected, deviation, valid = _deviation(a, b, c, d, correction)
+    g = np.zeros(np.shape(deviation))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for obs, exp in zip(observed, expected):
+            corrected = exp + np.sign(obs - exp) * deviation
+            g = g + np.where(corrected > 0, corrected * np.log(corrected / exp), 0.0)
+    g = np.where(valid, 2.0 * g, np.nan)
+    return g, stats.chi2.sf(g, 1)
+
+
+def fisher_greater_2x2(a, b, c, d) -> np.ndarray:
+    """
+    One-sided Fisher exact p-value for enrichment of cell a, i.e.
+    fisher_exact([[a, b], [c, d]], alternative="greater"), vectorized
+    through the hypergeometric survival function.
+    """
+    a, b, c, d = (np.asarray(x, dtype=np.int64) for x in (a, b, c, d))
+    return stats.hypergeom.sf(a - 1, a + b + c + d, a + b, a + c)
+
+
+def benjamini_hochberg(p_values) -> np.ndarray:
+    """
+    Benjamini-Hochberg adjusted p-values (q-values).
+    NaN entries are ignored and stay NaN; the shape of the input is kept.
+    """
+    p = np.asarray(p_values, dtype=np.float64)
+    flat = p.ravel()
+    q = np.full(flat.shape, np.nan)
+    tested = np.flatnonzero(~np.isnan(flat))
+    if len(tested):
+        order = tested[np.argsort(flat[tested], kind="stable")]
+        ranked = flat[order] * len(order) / np.arange(1, len(order) + 1)
+        q[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q.reshape(p.shape)
+
+
+# ============================================================================
+# GROUPED RATES
+# ============================================================================
+
+
+def pool_sections(
+    sections: Dict[str, Dict[str, int]],
+    names: Iterable[str],
+    fields: Sequence[str],
+    exposure: Optional[str] = None,
+    allow_missing: bool = False,
+) -> Dict[str, int]:
+    """
+    Sum per-section count dicts over a group of sections.
+
+    Args:
+        sections: Section name -> count dict
+        names: Sections to pool
+        fields: Count fields to sum
+        exposure: If given, the field that must be nonzero in the pool
+        allow_missing: Pool absent sections as zeros instead of raising
+
+    Raises:
+        KeyError: A section is absent (unless allow_missing)
+        ValueError: The pooled exposure is zero, so rates over the group
+            are undefined
+    """
+    names = list(names)
+    missing = [name for name in names if name not in sections]
+    if missing and not allow_missing:
+        raise KeyError(f"Sections not found: {', '.join(missing)}")
+    pooled = {
+        field: sum(sections.get(name, {}).get(field, 0) for name in names)
+        for field in fields
+    }
+    if exposure is not None and pooled[exposure] == 0:
+        raise ValueError(f"No {exposure} in pooled sections: {', '.join(names)}")
+    return pooled
+
+
+def rate_ratios(
+    group: Dict[str, int],
+    baseline: Dict[str, int],
+    terms: Sequence[str],
+    exposure: str = "sentence_count",
+    zero: float = float("inf"),
+    undefined: Optional[float] = None,
+) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Per-exposure rates of several terms in two pooled groups and their ratio.
+
+    Args:
+        group, baseline: Pooled counts (see pool_sections)
+        terms: Count fields to compare
+        exposure: Field holding the denominator (rates are 0 when it is 0)
+        zero: Ratio reported when the baseline rate is 0
+        undefined: Ratio when both rates are 0 (defaults to zero)
+
+    Returns:
+        (group rates, baseline rates, ratios) as lists of floats
+    """
+    counts = np.array(
+        [[group[t] for t in terms], [baseline[t] for t in terms]], dtype=np.float64
+    )
+    exposures = np.array([[group[exposure]], [baseline[exposure]]], dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(exposures > 0, counts / exposures, 0.0)
+        ratio = np.where(rates[1] > 0, rates[0] / rates[1], zero)
+    if undefined is not None:
+        ratio = np.where((rates[0] == 0) & (rates[1] == 0), undefined, ratio)
+    return rates[0].tolist(), rates[1].tolist(), ratio.tolist()
+
+
+# ============================================================================
+# ENRICHMENT ENGINE
+# ============================================================================
+
+
+class SectionEnrichment:
+    """Term x section enrichment statistics over a whole vocabulary."""
+
+    def __init__(self, counts: np.ndarray, vocab: Sequence[str], sections: Sequence[str]):
+        """
+        Args:
+            counts: (types, sections) occurrence matrix
+            vocab: Word for each row
+            sections: Section name for each column
+        """
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.vocab = list(vocab)
+        self.sections = list(sections)
+        self.term_totals = self.counts.sum(axis=1)
+        self.section_totals = self.counts.sum(axis=0)
+        self.total = int(self.section_totals.sum())
+        self._index = {word: i for i, word in enumerate(self.vocab)}
+
+    @classmethod
+    def from_token_array(
+        cls, tokens, sections: Optional[Sequence[str]] = None
+    ) -> "SectionEnrichment":
+        """
+        Build from a TokenArray in one grouped count.
+        Only the given sections (default: all) form the universe, so
+        their token totals sum to N.
+        """
+        sections = list(tokens.sections if sections is None else sections)
+        columns = [tokens.sections.index(s) for s in sections]
+        return cls(tokens.section_counts()[:, columns], tokens.vocab, sections)
+
+    # ------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------
+
+    def rows(self, words: Iterable[str]) -> np.ndarray:
+        """Row index per word (-1 if not in the vocabulary)."""
+        return np.array([self._index.get(w, -1) for w in words], dtype=np.int64)
+
+    def term_counts(self, word: str) -> Dict[str, int]:
+        """Occurrences of one word per section (zeros if unseen)."""
+        row = self._index.get(word)
+        values = self.counts[row].tolist() if row is not None else [0] * len(self.sections)
+        return dict(zip(self.sections, values))
+
+    def tables(
+        self, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The (types, sections) arrays of cells a, b, c, d (optionally for some rows)."""
+        a = self.counts if rows is None else self.counts[rows]
+        totals = self.term_totals if rows is None else self.term_totals[rows]
+        b = totals[:, None] - a
+        c = self.section_totals[None, :] - a
+        d = self.total - a - b - c
+        return a, b, c, d
+
+    def expected(self) -> np.ndarray:
+        """Expected occurrences of each term in each section."""
+        if self.total == 0:
+            return np.zeros(self.counts.shape)
+        return np.outer(self.term_totals, self.section_totals) / self.total
+
+    def enrichment(self) -> np.ndarray:
+        """Observed / expected (0 where nothing is expected)."""
+        expected = self.expected()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(expected > 0, self.counts / expected, 0.0)
+
+    # ------------------------------------------------------------------
+    # Tests
+    # ------------------------------------------------------------------
+
+    def chi_square(
+        self, correction: bool = True, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(chi2, p) for every term (or the given rows) and section."""
+        return chi_square_2x2(*self.tables(rows), correction=correction)
+
+    def g_test(
+        self, correction: bool = True, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(G, p) for every term (or the given rows) and section."""
+        return g_test_2x2(*self.tables(rows), correction=correction)
+
+    def fisher(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """One-sided Fisher p-value for enrichment of every term (or the given rows)."""
+        return fisher_greater_2x2(*self.tables(rows))
+
+    def test(
+        self, test: str = "chi2", rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(statistic, p) for the named test; Fisher's statistic is the odds ratio."""
+        if test == "chi2":
+            return self.chi_square(rows=rows)
+        if test == "g":
+            return self.g_test(rows=rows)
+        if test == "fisher":
+            a, b, c, d = self.tables(rows)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                odds = (a * d) / (b * c).astype(np.float64)
+            return odds, self.fisher(rows)
+        raise ValueError(f"Unknown test {test!r}; expected one of {TESTS}")
+
+    # ------------------------------------------------------------------
+    # Screening
+    # ------------------------------------------------------------------
+
+    def screen(
+        self,
+        test: str = "chi2",
+        alpha: float = 0.05,
+        min_count: int = 5,
+        enriched_only: bool = True,
+    ) -> List[Dict]:
+        """
+        Test every (term, section) cell and control the FDR.
+
+        Args:
+            test: "chi2", "g" or "fisher"
+            alpha: FDR level for Benjamini-Hochberg
+            min_count: Skip terms with fewer total occurrences
+            enriched_only: Report only cells with observed > expected
+
+        Returns:
+            Significant cells as dicts (word, section, observed, expected,
+            enrichment, statistic, p_value, q_value), sorted by q-value
+        """
+        # Only terms above min_count are tested (and count toward the FDR)
+        tested = np.flatnonzero(self.term_totals >= min_count)
+        statistic, p_values = self.test(test, rows=tested)
+        q_values = benjamini_hochberg(p_values)
+
+        counts = self.counts[tested]
+        expected = self.expected()[tested]
+        keep = q_values <= alpha
+        if enriched_only:
+            keep &= counts > expected
+        rows, cols = np.nonzero(keep)
+        order = np.lexsort((-counts[rows, cols], q_values[rows, cols]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            enrichment = np.where(expected > 0, counts / expected, 0.0)
+
+        return [
+            {
+                "word": self.vocab[tested[r]],
+                "section": self.sections[c],
+                "observed": int(counts[r, c]),
+                "expected": float(expected[r, c]),
+                "enrichment": float(enrichment[r, c]),
+                "statistic": float(statistic[r, c]),
+                "p_value": float(p_values[r, c]),
+                "q_value": float(q_values[r, c]),
+            }
+            for r, c in zip(rows[order].tolist(), cols[order].tolist())
+        ]
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Shared EVA Corpus Loader
+Parses an EVA transcription (IVTFF such as ZL3b-n.txt, or the plain
+Takahashi text) once into compact columns and caches them on disk.
+
+Columns, one entry per token:
+    tokens    - int32 id into vocab
+    folio     - int32 id into folios
+    line      - int32 id into line_labels / line_folio
+    position  - int32 word index within its line
+
+Page variables from IVTFF page headers (<f1r> <! $Q=A $L=A $H=1 ...>)
+are kept per folio in page_vars, e.g. page_vars["Q"][folio_id].
+
+The cache (data/cache/<name>.npz) is reused while the source file's
+mtime and size are unchanged; if those differ but the SHA-1 of the
+content is the same, the cache is kept and its fingerprint refreshed.
+
+Cleaning rules (applied once, at parse time):
+    IVTFF: inline tags (<%>, <$>, <!...>) are removed, <-> breaks a word,
+           [a:b] alternate readings keep the first reading, ligature
+           braces {} and apostrophes are dropped, @nnn; glyph codes
+           become "?", and "." / "," separate words.
+    Plain: EVA markup characters (! % = - * { }) are removed and words
+           are whitespace separated; every line becomes its own folio
+           "line<N>", as in the complete manuscript translator.
+"""
+
+import os
+import re
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Bump when parsing rules change so stale caches are rebuilt
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "cache"
+
+PAGE_HEADER_RE = re.compile(r"^<(f\w+)>(.*)$")
+LOCUS_RE = re.compile(r"^<(f\w+)\.(\w+)(?:,[^>]*)?>(.*)$")
+PAGE_VAR_RE = re.compile(r"\$(\w)=(\w+)")
+TAG_RE = re.compile(r"<[^>]*>")
+ALTERNATE_RE = re.compile(r"\[([^:\]]*)[^\]]*\]")
+GLYPH_CODE_RE = re.compile(r"@\d+;")
+IVTFF_DROP_RE = re.compile(r"[{}']")
+IVTFF_SPLIT_RE = re.compile(r"[.,\s]+")
+PLAIN_MARKUP_RE = re.compile(r"[!%=\-\*\{\}]")
+FOLDOUT_PANEL_RE = re.compile(r"(?<=[rv])\d+$")
+
+
+def clean_ivtff_text(text: str) -> List[str]:
+    """Clean the text part of an IVTFF locus line and split it into words."""
+    text = text.replace("<->", ".")
+    text = TAG_RE.sub("", text)
+    text = ALTERNATE_RE.sub(r"\1", text)
+    text = GLYPH_CODE_RE.sub("?", text)
+    text = IVTFF_DROP_RE.sub("", text)
+    return [w for w in IVTFF_SPLIT_RE.split(text) if w]
+
+
+def clean_plain_text(text: str) -> List[str]:
+    """Clean a plain-text transcription line and split it into words."""
+    return PLAIN_MARKUP_RE.sub("", text).split()
+
+
+def base_folio(folio: str) -> str:
+    """Folio of a foldout panel page, e.g. "f85r1" -> "f85r"; others unchanged."""
+    return FOLDOUT_PANEL_RE.sub("", folio)
+
+
+def is_ivtff(filepath: Path) -> bool:
+    """Return True if the file looks like IVTFF (has <folio> markers)."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("#=IVTFF") or line.startswith("<f"):
+                return True
+            if line and not line.startswith("#"):
+                return False
+    return False
+
+
+def save_npz_atomic(cache_file: Path, arrays: Dict[str, np.ndarray], compressed: bool = False):
+    """
+    Write arrays to an .npz file via a uniquely named temporary file in the
+    same directory, so a crash never leaves a torn cache and concurrent
+    writers of the same cache never share a temporary file.
+    """
+    cache_file = Path(cache_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.NamedTemporaryFile(
+        dir=cache_file.parent, prefix=cache_file.name + ".", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            (np.savez_compressed if compressed else np.savez)(tmp, **arrays)
+        os.replace(tmp.name, cache_file)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def file_sha1(filepath: Path) -> str:
+    """SHA-1 of the file contents."""
+    digest = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class EvaCorpus:
+    """Columnar, interned view of one EVA transcription."""
+
+    def __init__(
+        self,
+        source: str,
+        vocab: List[str],
+        tokens: np.ndarray,
+        folio: np.ndarray,
+        line: np.ndarray,
+        position: np.ndarray,
+        folios: List[str],
+        line_labels: List[str],
+        line_folio: np.ndarray,
+        page_vars: Dict[str, List[str]],
+    ):
+        self.source = source
+        self.vocab = vocab
+        self.tokens = tokens
+        self.folio = folio
+        self.line = line
+        self.position = position
+        self.folios = folios
+        self.line_labels = line_labels
+        self.line_folio = line_folio
+        self.page_vars = page_vars
+        self._word_index = None
+        self._line_offsets = None
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def word_index(self) -> Dict[str, int]:
+        """Mapping word -> token id (built on first use)."""
+        if self._word_index is None:
+            self._word_index = {w: i for i, w in enumerate(self.vocab)}
+        return self._word_index
+
+    @property
+    def line_offsets(self) -> np.ndarray:
+        """Token offsets of each line; line i is tokens[off[i]:off[i + 1]]."""
+        if self._line_offsets is None:
+            counts = np.bincount(self.line, minlength=len(self.line_labels))
+            self._line_offsets = np.concatenate(([0], np.cumsum(counts)))
+        return self._line_offsets
+
+    def words(self) -> List[str]:
+        """All tokens as strings, in manuscript order."""
+        vocab = self.vocab
+        return [vocab[i] for i in self.tokens.tolist()]
+
+    def iter_lines(self) -> Iterator[Tuple[str, str, List[str]]]:
+        """Yield (folio, line label, words) for every line in order."""
+        vocab = self.vocab
+        offsets = self.line_offsets.tolist()
+        tokens = self.tokens.tolist()
+        line_folio = self.line_folio.tolist()
+        for i, label in enumerate(self.line_labels):
+            words = [vocab[t] for t in tokens[offsets[i] : offsets[i + 1]]]
+            yield self.folios[line_folio[i]], label, words
+
+    def folio_words(self) -> Dict[str, List[str]]:
+        """Mapping folio -> list of its words, in manuscript order."""
+        result = {folio: [] for folio in self.folios}
+        for folio, _, words in self.iter_lines():
+            result[folio].extend(words)
+        return result
+
+    def page_var(self, name: str, folio: str, default: str = "") -> str:
+        """Value of page variable $name for a folio (e.g. "Q", "L", "H")."""
+        values = self.page_vars.get(name)
+        if values is None:
+            return default
+        return values[self.folios.index(folio)] or default
+
+    def token_page_var(self, name: str) -> np.ndarray:
+        """Per-token array of page variable $name ("" where unset)."""
+        values = np.asarray(self.page_vars.get(name, [""] * len(self.folios)))
+        return values[self.folio]
+
+
+def parse_eva_file(filepath: Path) -> EvaCorpus:
+    """Parse an EVA transcription into an EvaCorpus (no caching)."""
+    vocab: List[str] = []
+    word_ids: Dict[str, int] = {}
+    folios: List[str] = []
+    folio_ids: Dict[str, int] = {}
+    page_vars: Dict[str, Dict[int, str]] = {}
+    line_labels: List[str] = []
+    line_folio: List[int] = []
+    tokens: List[int] = []
+    token_folio: List[int] = []
+    token_line: List[int] = []
+    token_position: List[int] = []
+
+    def folio_id(folio: str) -> int:
+        if folio not in folio_ids:
+            folio_ids[folio] = len(folios)
+            folios.append(folio)
+        return folio_ids[folio]
+
+    def add_line(fid: int, label: str, words: List[str]):
+        if not words:
+            return
+        lid = len(line_labels)
+        line_labels.append(label)
+        line_folio.append(fid)
+        for position, word in enumerate(words):
+            wid = word_ids.get(word)
+            if wid is None:
+                wid = word_ids[word] = len(vocab)
+                vocab.append(word)
+            tokens.append(wid)
+            token_folio.append(fid)
+            token_line.append(lid)
+            token_position.append(position)
+
+    ivtff = is_ivtff(filepath)
+    line_number = 0
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw or raw.startswith("#"):
+                continue
+
+            if not ivtff:
+                line_number += 1
+                label = f"line{line_number}"
+                words = clean_plain_text(raw)
+                if words:
+                    add_line(folio_id(label), label, words)
+                continue
+
+            locus = LOCUS_RE.match(raw)
+            if locus:
+                folio, number, text = locus.groups()
+                add_line(folio_id(folio), f"{folio}.{number}", clean_ivtff_text(text))
+                continue
+
+            header = PAGE_HEADER_RE.match(raw)
+            if header:
+                fid = folio_id(header.group(1))
+                for name, value in PAGE_VAR_RE.findall(header.group(2)):
+                    page_vars.setdefault(name, {})[fid] = value
+
+    return EvaCorpus(
+        source=str(filepath),
+        vocab=vocab,
+        tokens=np.asarray(tokens, dtype=np.int32),
+        folio=np.asarray(token_folio, dtype=np.int32),
+        line=np.asarray(token_line, dtype=np.int32),
+        position=np.asarray(token_position, dtype=np.int32),
+        folios=folios,
+        line_labels=line_labels,
+        line_folio=np.asarray(line_folio, dtype=np.int32),
+        page_vars={
+            name: [values.get(i, "") for i in range(len(folios))]
+            for name, values in sorted(page_vars.items())
+        },
+    )
+
+
+def save_corpus_cache(corpus: EvaCorpus, cache_file: Path, fingerprint: Dict):
+    """Write corpus columns and the source fingerprint to an .npz file."""
+    arrays = {
+        "tokens": corpus.tokens,
+        "folio": corpus.folio,
+        "line": corpus.line,
+        "position": corpus.position,
+        "line_folio": corpus.line_folio,
+        "vocab": np.asarray(corpus.vocab, dtype=str),
+        "folios": np.asarray(corpus.folios, dtype=str),
+        "line_labels": np.asarray(corpus.line_labels, dtype=str),
+        "meta": np.asarray(json.dumps(fingerprint)),
+    }
+    for name, values in corpus.page_vars.items():
+        arrays[f"page_var_{name}"] = np.asarray(values, dtype=str)
+
+    save_npz_atomic(cache_file, arrays)
+
+
+def load_corpus_cache(cache_file: Path, source: str) -> Tuple[EvaCorpus, Dict]:
+    """Read an .npz cache written by save_corpus_cache()."""
+    with np.load(cache_file, allow_pickle=False) as data:
+        fingerprint = json.loads(str(data["meta"]))
+        page_vars = {
+            name[len("page_var_") :]: data[name].tolist()
+            for name in data.files
+            if name.startswith("page_var_")
+        }
+        corpus = EvaCorpus(
+            source=source,
+            vocab=data["vocab"].tolist(),
+            tokens=data["tokens"],
+            folio=data["folio"],
+            line=data["line"],
+            position=data["position"],
+            folios=data["folios"].tolist(),
+            line_labels=data["line_labels"].tolist(),
+            line_folio=data["line_folio"],
+            page_vars=page_vars,
+        )
+    return corpus, fingerprint
+
+
+def load_corpus(
+    filepath,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+) -> EvaCorpus:
+    """
+    Load an EVA transcription, using the on-disk columnar cache if valid.
+
+    Args:
+        filepath: Path to the transcription (IVTFF or plain text)
+        cache_dir: Cache directory; None disables caching
+        refresh: Ignore any existing cache and reparse
+
+    Returns:
+        EvaCorpus with interned tokens and per-token folio/line/position
+    """
+    filepath = Path(filepath)
+    if cache_dir is None:
+        return parse_eva_file(filepath)
+
+    stat = filepath.stat()
+    fingerprint = {
+        "version": CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+    cache_file = Path(cache_dir) / f"{filepath.name}.npz"
+
+    if cache_file.exists() and not refresh:
+        try:
+            corpus, cached = load_corpus_cache(cache_file, str(filepath))
+        except (OSError, ValueError, KeyError):
+            cached = None
+        if cached and cached.get("version") == CACHE_VERSION:
+            if (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+                return corpus
+            # Touched but possibly unchanged (e.g. fresh checkout): compare content
+            sha1 = file_sha1(filepath)
+            if cached.get("sha1") == sha1:
+                save_corpus_cache(corpus, cache_file, {**fingerprint, "sha1": sha1})
+                return corpus
+
+    corpus = parse_eva_file(filepath)
+    fingerprint["sha1"] = file_sha1(filepath)
+    save_corpus_cache(corpus, cache_file, fingerprint)
+    return corpus
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Build or inspect the columnar cache of an EVA transcription"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=[
+            "data/voynich/eva_transcription/ZL3b-n.txt",
+            "data/voynich/eva_transcription/voynich_eva_takahashi.txt",
+        ],
+        help="Transcription files (default: ZL3b-n and Takahashi)",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="Reparse even if cache is valid"
+    )
+    args = parser.parse_args()
+
+    for name in args.files:
+        start = time.perf_counter()
+        corpus = load_corpus(name, refresh=args.refresh)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name}")
+        print(f"  Tokens: {len(corpus)}")
+        print(f"  Types: {len(corpus.vocab)}")
+        print(f"  Folios: {len(corpus.folios)}")
+        print(f"  Lines: {len(corpus.line_labels)}")
+        print(f"  Page variables: {', '.join(sorted(corpus.page_vars)) or 'none'}")
+        print(f"  Loaded in {elapsed:.1f} ms")
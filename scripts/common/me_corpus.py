@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Middle English Corpus Word Frequencies
+Tokenizes the CMEPV SGML texts into a type-frequency table once and
+caches it on disk, instead of re-reading every file on each run.
+
+Tokenization matches the original loaders: SGML tags (<...>) become
+spaces, the text is lowercased and words are runs of [a-z]. Files are
+read in fixed-size chunks (tags and words that straddle a chunk
+boundary are carried into the next chunk), so memory stays flat, and
+files are tokenized in parallel across a process pool; the per-file
+Counters are merged at the end.
+
+The cache (data/cache/cmepv_word_freq.npz) stores the vocabulary once
+with int64 counts, plus optional per-text tables as (text, type, count)
+triples. It is keyed by the SHA-1 of every corpus file, so adding,
+removing or editing a text rebuilds it.
+
+Usage:
+    word_freq = load_me_word_freq()                       # Counter
+    word_freq, per_text = load_me_word_freq(per_text=True)
+"""
+
+import re
+import json
+import hashlib
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from common.eva_corpus import DEFAULT_CACHE_DIR, file_sha1, save_npz_atomic
+
+# Bump when tokenization rules change so stale caches are rebuilt
+CACHE_VERSION = 1
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+CMEPV_SGML_DIR = (
+    REPO_ROOT / "data" / "middle_english_corpus" / "cmepv" / "middle_english_text_cmepv" / "sgml"
+)
+CACHE_NAME = "cmepv_word_freq.npz"
+CHUNK_SIZE = 1 << 20
+
+SGML_TAG_RE = re.compile(r"<[^>]+>")
+WORD_RE = re.compile(r"[a-z]+")
+
+
+def tokenize_text(text: str) -> List[str]:
+    """Words of an SGML fragment: tags stripped, lowercased, runs of [a-z]."""
+    return WORD_RE.findall(SGML_TAG_RE.sub(" ", text).lower())
+
+
+def iter_sgml_words(filepath: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Stream the words of one SGML file, chunk by chunk.
+    Yields the same tokens as tokenize_text() on the whole file.
+    """
+    carry = ""
+    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        for chunk in iter(lambda: f.read(chunk_size), ""):
+            buffer = carry + chunk
+            # Hold back an unclosed tag, from its first '<' after the last '>'
+            cut = buffer.find("<", buffer.rfind(">") + 1)
+            if cut == -1:
+                cut = len(buffer)
+            # ... and a word that may continue in the next chunk
+            while cut > 0 and buffer[cut - 1].isalpha():
+                cut -= 1
+            carry = buffer[cut:]
+            yield from tokenize_text(buffer[:cut])
+    if carry:
+        yield from tokenize_text(carry)
+
+
+def count_file(filepath: Path) -> Counter:
+    """Word frequencies of one SGML file."""
+    return Counter(iter_sgml_words(filepath))
+
+
+def count_files(files: List[Path], workers: Optional[int] = None) -> List[Counter]:
+    """
+    Per-file word frequencies, in the order of files.
+    workers: process count (None = CPU count, 1 = no pool)
+    """
+    if workers == 1 or len(files) <= 1:
+        return [count_file(path) for path in files]
+    with Pool(workers) as pool:
+        return pool.map(count_file, files, chunksize=max(1, len(files) // 64))
+
+
+def corpus_files(corpus_dir: Path) -> List[Path]:
+    """SGML texts of the corpus, in name order."""
+    return sorted(Path(corpus_dir).glob("*.sgm"))
+
+
+def corpus_key(files: List[Path]) -> str:
+    """SHA-1 over every file's name and content hash."""
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for path in files:
+        digest.update(f"{path.name}\0{file_sha1(path)}\n".encode())
+    return digest.hexdigest()
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+
+def save_freq_cache(
+    cache_file: Path,
+    key: str,
+    word_freq: Counter,
+    per_text: Optional[Dict[str, Counter]] = None,
+):
+    """Write the frequency table (and per-text tables) to an .npz file."""
+    vocab = list(word_freq)
+    arrays = {
+        "vocab": np.asarray(vocab, dtype=str),
+        "counts": np.asarray([word_freq[w] for w in vocab], dtype=np.int64),
+        "meta": np.asarray(json.dumps({"version": CACHE_VERSION, "key": key})),
+    }
+    if per_text is not None:
+        type_id = {w: i for i, w in enumerate(vocab)}
+        names = list(per_text)
+        text_ids, type_ids, counts = [], [], []
+        for text_id, name in enumerate(names):
+            for word, count in per_text[name].items():
+                text_ids.append(text_id)
+                type_ids.append(type_id[word])
+                counts.append(count)
+        arrays["text_names"] = np.asarray(names, dtype=str)
+        arrays["text_ids"] = np.asarray(text_ids, dtype=np.int32)
+        arrays["text_types"] = np.asarray(type_ids, dtype=np.int32)
+        arrays["text_counts"] = np.asarray(counts, dtype=np.int64)
+
+    save_npz_atomic(cache_file, arrays, compressed=True)
+
+
+def load_freq_cache(
+    cache_file: Path, per_text: bool = False
+) -> Tuple[Dict, Counter, Optional[Dict[str, Counter]]]:
+    """
+    Read an .npz cache written by save_freq_cache().
+    Returns (meta, word_freq, per-text tables or None if absent/not asked).
+    """
+    with np.load(cache_file, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        vocab = data["vocab"].tolist()
+        word_freq = Counter(dict(zip(vocab, data["counts"].tolist())))
+        tables = None
+        if per_text and "text_names" in data.files:
+            names = data["text_names"].tolist()
+            tables = {name: Counter() for name in names}
+            for text_id, type_id, count in zip(
+                data["text_ids"].tolist(),
+                data["text_types"].tolist(),
+                data["text_counts"].tolist(),
+            ):
+                tables[names[text_id]][vocab[type_id]] = count
+    return meta, word_freq, tables
+
+
+def load_me_word_freq(
+    corpus_dir=CMEPV_SGML_DIR,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+    workers: Optional[int] = None,
+    per_text: bool = False,
+):
+    """
+    Word frequencies of the Middle English corpus, cached on disk.
+
+    Args:
+        corpus_dir: Directory of CMEPV .sgm texts
+        cache_dir: Cache directory; None disables caching
+        refresh: Ignore any existing cache and retokenize
+        workers: Tokenizer processes (None = CPU count, 1 = no pool)
+        per_text: Also return per-text tables {file name: Counter}
+
+    Returns:
+        Counter of word -> frequency, or (Counter, per-text dict) if per_text
+    """
+    files = corpus_files(corpus_dir)
+    key = corpus_key(files) if cache_dir is not None else None
+    cache_file = Path(cache_dir) / CACHE_NAME if cache_dir is not None else None
+
+    if cache_file is not None and cache_file.exists() and not refresh:
+        try:
+            meta, word_freq, tables = load_freq_cache(cache_file, per_text)
+        except (OSError, ValueError, KeyError):
+            meta = None
+        if (
+            meta
+            and meta.get("version") == CACHE_VERSION
+            and meta.get("key") == key
+            and (tables is not None or not per_text)
+        ):
+            return (word_freq, tables) if per_text else word_freq
+
+    counters = count_files(files, workers)
+    word_freq = Counter()
+    for counter in counters:
+        word_freq.update(counter)
+    # Per-text tables are always cached, so a later per_text call is a hit
+    tables = {path.name: counter for path, counter in zip(files, counters)}
+
+    if cache_file is not None:
+        save_freq_cache(cache_file, key, word_freq, tables)
+    return (word_freq, tables) if per_text else word_freq
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Build or inspect the cached CMEPV word-frequency table"
+    )
+    parser.add_argument("--corpus-dir", default=str(CMEPV_SGML_DIR))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--refresh", action="store_true", help="Retokenize even if cache is valid"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    word_freq, tables = load_me_word_freq(
+        args.corpus_dir, refresh=args.refresh, workers=args.workers, per_text=True
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{args.corpus_dir}")
+    print(f"  Texts: {len(tables)}")
+    print(f"  Tokens: {sum(word_freq.values())}")
+    print(f"  Types: {len(word_freq)}")
+    print(f"  Loaded in {elapsed:.1f} ms")
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Token-Level Suffix Array Phrase Index
+Suffix array plus LCP array over the integer-encoded corpus (token ids,
+not characters), for finding repeated phrases of every length in one
+build instead of one n-gram Counter per n.
+
+The suffix array is built by prefix doubling: each round sorts the
+suffixes by the ranks of their first 2^k tokens, so a corpus whose
+longest repeat has L tokens needs about log2(L) + 1 argsorts. The rank
+arrays of every round are kept, so the LCP of all adjacent suffixes is
+found by vectorized binary lifting rather than a per-suffix loop.
+
+Repeated phrases are the LCP intervals (internal nodes of the suffix
+tree). An interval is a maximal repeat when its occurrences cannot all be
+extended to the right (it is an interval) or to the left (the tokens
+before the occurrences differ). With within_line=True every line end gets
+a unique separator, so no phrase crosses a line.
+
+Usage:
+    index = PhraseIndex(TokenArray.from_corpus(load_corpus(path)))
+    for phrase in index.maximal_repeats(min_length=3, min_freq=5):
+        print(phrase["length"], phrase["frequency"], phrase["folio_spread"],
+              " ".join(phrase["phrase"]))
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.token_array import TokenArray
+
+
+def dense_ranks(keys: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Rank of each key (equal keys share a rank) given its sort order."""
+    sorted_keys = keys[order]
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.concatenate(
+        ([0], np.cumsum(sorted_keys[1:] != sorted_keys[:-1]))
+    )
+    return ranks
+
+
+def suffix_array(sequence: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Suffix array of an integer sequence by prefix doubling.
+
+    Returns:
+        (suffix array, rank arrays) where ranks[k][i] orders the windows of
+        2^k tokens starting at i; equal ranks mean equal windows, and
+        windows running past the end never equal another window
+    """
+    n = len(sequence)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), []
+    order = np.argsort(sequence, kind="stable")
+    ranks = [dense_ranks(np.asarray(sequence, dtype=np.int64), order)]
+    step = 1
+    while ranks[-1][order[-1]] < n - 1:
+        rank = ranks[-1]
+        second = np.full(n, -1, dtype=np.int64)
+        second[: n - step] = rank[step:]
+        keys = rank * (n + 1) + (second + 1)
+        order = np.argsort(keys, kind="stable")
+        ranks.append(dense_ranks(keys, order))
+        step *= 2
+    return order, ranks
+
+
+def lcp_array(sa: np.ndarray, ranks: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    lcp[i] = longest common prefix of suffixes sa[i - 1] and sa[i]
+    (lcp[0] = 0), by binary lifting over the doubling ranks.
+    """
+    n = len(sa)
+    lcp = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return lcp
+    x, y = sa[:-1].copy(), sa[1:].copy()
+    # The last round has all windows distinct, so no LCP reaches its length
+    for k in range(len(ranks) - 2, -1, -1):
+        valid = (x < n) & (y < n)
+        same = np.zeros(n - 1, dtype=bool)
+        same[valid] = ranks[k][x[valid]] == ranks[k][y[valid]]
+        lcp[1:] += same << k
+        x[same] += 1 << k
+        y[same] += 1 << k
+    return lcp
+
+
+class PhraseIndex:
+    """Suffix/LCP arrays over a TokenArray for repeated-phrase queries."""
+
+    def __init__(self, tokens: TokenArray, within_line: bool = False):
+        """
+        Args:
+            tokens: Integer-encoded corpus
+            within_line: Do not let phrases cross line boundaries
+        """
+        self.tokens = tokens
+        n_tokens = len(tokens.tokens)
+        vocab_size = len(tokens.vocab)
+
+        if within_line and n_tokens:
+            # Unique separator id after every line
+            breaks = np.flatnonzero(np.diff(tokens.line)) + 1
+            starts = np.concatenate(([0], breaks))
+            ends = np.concatenate((breaks, [n_tokens]))
+            self.position = np.full(n_tokens + len(starts), -1, dtype=np.int64)
+            offsets = np.arange(len(starts))
+            slots = np.arange(n_tokens) + np.repeat(offsets, ends - starts)
+            self.position[slots] = np.arange(n_tokens)
+            sequence = vocab_size + np.arange(len(self.position), dtype=np.int64)
+            sequence[slots] = tokens.tokens
+        else:
+            self.position = np.arange(n_tokens, dtype=np.int64)
+            sequence = tokens.tokens.astype(np.int64)
+
+        self.sequence = sequence
+        self.vocab_size = vocab_size
+        self.sa, ranks = suffix_array(sequence)
+        self.lcp = lcp_array(self.sa, ranks)
+        self.run = self._run_lengths()
+
+    def __len__(self) -> int:
+        return len(self.sa)
+
+    def _run_lengths(self) -> np.ndarray:
+        """Tokens from each sequence position to the next separator or the end."""
+        n = len(self.sequence)
+        is_sep = np.append(self.sequence >= self.vocab_size, True)
+        next_sep = np.minimum.accumulate(
+            np.where(is_sep, np.arange(n + 1), n + 1)[::-1]
+        )[::-1]
+        return next_sep[:n] - np.arange(n)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def phrase_at(self, start: int, length: int) -> Tuple[str, ...]:
+        """Words of the phrase starting at a sequence position."""
+        vocab = self.tokens.vocab
+        return tuple(vocab[i] for i in self.sequence[start : start + length].tolist())
+
+    def occurrences(self, phrase: Sequence[str]) -> np.ndarray:
+        """Sorted token positions where phrase starts (binary search on the SA)."""
+        ids = self.tokens.ids(phrase)
+        if not len(ids) or (ids < 0).any():
+            return np.zeros(0, dtype=np.int64)
+        lo, hi = 0, len(self.sa)
+        for depth, token in enumerate(ids.tolist()):
+            starts = self.sa[lo:hi] + depth
+            column = np.full(hi - lo, -1, dtype=np.int64)
+            inside = starts < len(self.sequence)
+            column[inside] = self.sequence[starts[inside]]
+            # Suffixes in [lo, hi) share their first depth tokens, so this
+            # column is sorted
+            lo, hi = lo + np.searchsorted(column, token), lo + np.searchsorted(column, token, "right")
+            if lo >= hi:
+                return np.zeros(0, dtype=np.int64)
+        return np.sort(self.position[self.sa[lo:hi]])
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+
+    def ngram_counts(self, n: int, min_freq: int = 1) -> Dict[Tuple[str, ...], int]:
+        """
+        Every n-gram with its count from the LCP array (no window tuples).
+        Ordered by first occurrence like TokenArray.ngram_counts.
+        """
+        sa = self.sa
+        if n < 1 or not len(sa):
+            return {}
+        group = np.cumsum(self.lcp < n) - 1
+        sizes = np.bincount(group)
+        first = np.full(len(sizes), len(self.sequence), dtype=np.int64)
+        np.minimum.at(first, group, sa)
+        # Singleton groups may be suffixes shorter than n
+        keep = (sizes >= min_freq) & (self.run[first] >= n)
+        first, sizes = first[keep], sizes[keep]
+        order = np.argsort(first, kind="stable")
+        return {
+            self.phrase_at(start, n): int(count)
+            for start, count in zip(first[order].tolist(), sizes[order].tolist())
+        }
+
+    def lcp_intervals(self, min_length: int = 1) -> np.ndarray:
+        """
+        All LCP intervals with lcp >= min_length as (lcp, lb, rb) rows:
+        suffixes sa[lb..rb] share exactly lcp leading tokens, i.e. one
+        right-maximal repeated phrase occurring rb - lb + 1 times.
+        """
+        lcp = self.lcp.tolist()
+        intervals = []
+        stack = [(0, 0)]
+        for i in range(1, len(lcp) + 1):
+            current = lcp[i] if i < len(lcp) else 0
+            lb = i - 1
+            while current < stack[-1][0]:
+                height, lb = stack.pop()
+                if height >= min_length:
+                    intervals.append((height, lb, i - 1))
+            if current > stack[-1][0]:
+                stack.append((current, lb))
+        return np.array(intervals, dtype=np.int64).reshape(-1, 3)
+
+    def maximal_repeats(
+        self,
+        min_length: int = 2,
+        min_freq: int = 2,
+        max_length: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Maximal repeated phrases of every length in one traversal.
+
+        Args:
+            min_length: Shortest phrase (in tokens) to report
+            min_freq: Minimum number of occurrences
+            max_length: Longest phrase to report (None = no limit)
+
+        Returns:
+            Dicts with phrase, length, frequency, folio_spread and first
+            (token position of the first occurrence), sorted by
+            frequency, then length, descending
+        """
+        intervals = self.lcp_intervals(min_length)
+        if not len(intervals):
+            return []
+        heights, lbs, rbs = intervals.T
+        keep = rbs - lbs + 1 >= min_freq
+        if max_length is not None:
+            keep &= heights <= max_length
+
+        # Left-maximal: the tokens before the occurrences are not all equal
+        # (a corpus or line start counts as a distinct token)
+        before = np.where(self.sa > 0, self.sequence[self.sa - 1], -1 - self.sa)
+        changes = np.concatenate(([0], np.cumsum(before[1:] != before[:-1])))
+        keep &= changes[rbs] > changes[lbs]
+        heights, lbs, rbs = heights[keep], lbs[keep], rbs[keep]
+
+        folio = self.tokens.folio
+        repeats = []
+        for height, lb, rb in zip(heights.tolist(), lbs.tolist(), rbs.tolist()):
+            positions = self.position[self.sa[lb : rb + 1]]
+            repeats.append(
+                {
+                    "phrase": self.phrase_at(int(self.sa[lb]), height),
+                    "length": height,
+                    "frequency": rb - lb + 1,
+                    "folio_spread": len(np.unique(folio[positions])),
+                    "first": int(positions.min()),
+                }
+            )
+        repeats.sort(key=lambda r: (-r["frequency"], -r["length"], r["first"]))
+        return repeats
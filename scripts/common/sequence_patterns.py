@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Compiled Sequence-Pattern Matcher
+Matches many ordered token patterns ("a token containing X, then within
+`window` tokens one containing Y, then ...") against tokenized sentences
+in one left-to-right pass, instead of a substring scan per element per
+token followed by a backtracking search per pattern.
+
+Compilation:
+    - all pattern elements go into one Aho-Corasick automaton, so each
+      distinct token is classified once (memoized) by the elements it
+      contains
+    - patterns are merged into a trie of element sequences; a trie node
+      is a partially matched pattern, and its transition fires on a
+      token containing the node's element if the parent node was last
+      reached at most `window` tokens earlier
+
+Per token, only the latest position each node was reached is kept (a
+later position never leaves less room for the next element), so one
+sentence costs O(length) regardless of how many patterns there are.
+Sentences of equal length can also be matched as an id matrix with
+NumPy, which is what makes thousands of shuffled baselines cheap.
+
+Usage:
+    matcher = SequencePatternSet({"water_verb": ["water", "VERB"]}, window=10)
+    matcher.match(sentence.split())                  # ["water_verb"]
+    null = matcher.shuffle_null(token_lists, n_replicates=1000)
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.aho_corasick import AhoCorasick
+
+ROOT = 0
+NEVER = -(1 << 30)
+ALWAYS = 1 << 30
+
+
+class SequencePatternSet:
+    """Ordered, gap-bounded token patterns compiled into one automaton."""
+
+    def __init__(self, patterns: Dict[str, Sequence[str]], window: int = 5):
+        """
+        Args:
+            patterns: Pattern name -> elements; a token matches an element
+                if it contains it as a substring
+            window: Maximum distance between consecutive matched tokens
+        """
+        self.names: List[str] = list(patterns)
+        self.window = window
+
+        self.elements: List[str] = []
+        element_id: Dict[str, int] = {}
+        self.parent: List[int] = [ROOT]
+        self.node_element: List[int] = [-1]
+        self.depth: List[int] = [0]
+        children: Dict[Tuple[int, int], int] = {}
+        # Accepting node per pattern; -1 for an empty pattern (never matches)
+        self.accept = np.full(len(self.names), -1, dtype=np.int64)
+
+        for pattern_id, name in enumerate(self.names):
+            node = ROOT
+            for element in patterns[name]:
+                if element not in element_id:
+                    element_id[element] = len(self.elements)
+                    self.elements.append(element)
+                key = (node, element_id[element])
+                if key not in children:
+                    children[key] = len(self.parent)
+                    self.parent.append(node)
+                    self.node_element.append(element_id[element])
+                    self.depth.append(self.depth[node] + 1)
+                node = children[key]
+            if node != ROOT:
+                self.accept[pattern_id] = node
+
+        self.matcher = AhoCorasick(self.elements)
+        # The automaton skips empty elements; every token contains them
+        self.empty_elements = [i for i, e in enumerate(self.elements) if not e]
+        self.element_nodes: List[List[int]] = [[] for _ in self.elements]
+        for node in range(1, len(self.parent)):
+            self.element_nodes[self.node_element[node]].append(node)
+
+        # Token types: id 0 is reserved for a token matching nothing
+        self.type_id: Dict[str, int] = {}
+        self.type_nodes: List[Tuple[int, ...]] = [()]
+
+        # Nodes grouped by depth, deepest first, for the matrix matcher
+        self.levels = [
+            (
+                np.asarray(nodes, dtype=np.int64),
+                np.asarray([self.parent[n] for n in nodes], dtype=np.int64),
+            )
+            for depth in range(max(self.depth), 0, -1)
+            for nodes in [[n for n in range(1, len(self.parent)) if self.depth[n] == depth]]
+        ]
+
+    def __len__(self) -> int:
+        """Number of patterns."""
+        return len(self.names)
+
+    # ------------------------------------------------------------------
+    # Token classification
+    # ------------------------------------------------------------------
+
+    def token_type(self, token: str) -> int:
+        """Type id of token, classifying it against every element on first sight."""
+        type_id = self.type_id.get(token)
+        if type_id is None:
+            nodes = []
+            for element in [*self.matcher.first_occurrences(token), *self.empty_elements]:
+                nodes.extend(self.element_nodes[element])
+            # Deepest first, so a node reads its parent before this token updates it
+            nodes.sort(key=lambda n: -self.depth[n])
+            type_id = self.type_id[token] = len(self.type_nodes)
+            self.type_nodes.append(tuple(nodes))
+        return type_id
+
+    def encode(self, tokens: Sequence[str]) -> np.ndarray:
+        """Type ids of a token sequence."""
+        return np.asarray([self.token_type(t) for t in tokens], dtype=np.int64)
+
+    def node_mask(self) -> np.ndarray:
+        """Boolean (types, nodes) matrix: which nodes each token type can advance."""
+        mask = np.zeros((len(self.type_nodes), len(self.parent)), dtype=bool)
+        for type_id, nodes in enumerate(self.type_nodes):
+            mask[type_id, list(nodes)] = True
+        return mask
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def match(self, tokens: Sequence[str]) -> List[str]:
+        """Names of the patterns found in one token sequence."""
+        last = [NEVER] * len(self.parent)
+        last[ROOT] = ALWAYS
+        parent, window = self.parent, self.window
+        for pos, token in enumerate(tokens):
+            for node in self.type_nodes[self.token_type(token)]:
+                if last[parent[node]] >= pos - window:
+                    last[node] = pos
+        return [
+            name
+            for name, node in zip(self.names, self.accept.tolist())
+            if node > ROOT and last[node] >= 0
+        ]
+
+    def match_ids(self, ids: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Match every row of an equal-length type-id matrix (rows, length).
+        Returns a boolean (rows, patterns) matrix.
+        """
+        if mask is None:
+            mask = self.node_mask()
+        rows, length = ids.shape
+        last = np.full((rows, len(self.parent)), NEVER, dtype=np.int32)
+        last[:, ROOT] = ALWAYS
+        for pos in range(length):
+            hits = mask[ids[:, pos]]
+            for nodes, parents in self.levels:
+                fire = hits[:, nodes] & (last[:, parents] >= pos - self.window)
+                last[:, nodes] = np.where(fire, pos, last[:, nodes])
+        found = last[:, np.maximum(self.accept, ROOT)] >= 0
+        found[:, self.accept <= ROOT] = False
+        return found
+
+    # ------------------------------------------------------------------
+    # Shuffled baseline
+    # ------------------------------------------------------------------
+
+    def shuffle_null(
+        self,
+        sentences: Sequence[Sequence[str]],
+        n_replicates: int = 1000,
+        seed: int = 42,
+        batch_size: int = 25,
+    ) -> np.ndarray:
+        """
+        Match counts when the token order inside every sentence is shuffled.
+        Returns an int (replicates, patterns) matrix of matching sentences.
+        """
+        rng = np.random.default_rng(seed)
+        by_length: Dict[int, List[np.ndarray]] = {}
+        for tokens in sentences:
+            if tokens:
+                by_length.setdefault(len(tokens), []).append(self.encode(tokens))
+        groups = [np.stack(rows) for _, rows in sorted(by_length.items())]
+        mask = self.node_mask()
+
+        counts = []
+        remaining = n_replicates
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            batch_counts = np.zeros((batch, len(self.names)), dtype=np.int64)
+            for group in groups:
+                shuffled = rng.permuted(np.tile(group, (batch, 1)), axis=1)
+                found = self.match_ids(shuffled, mask)
+                batch_counts += found.reshape(batch, len(group), -1).sum(axis=1)
+            counts.append(batch_counts)
+            remaining -= batch
+        return np.concatenate(counts)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Substring / Containment Index
+Frequency-weighted index over the distinct word types of a corpus for
+morphological productivity queries:
+
+    how many tokens are exactly / start with / end with / contain X
+    which stems follow prefix P, which roots precede suffix S
+
+Prefix and suffix queries use binary search over the sorted (and sorted
+reversed) types with cumulative token counts, so counts are O(log n).
+Containment uses a suffix array over the types (every suffix of every
+type, sorted): the suffixes starting with X form one contiguous range,
+found in O(log n), whose owners are the types containing X.
+
+Type ids follow first occurrence in the corpus, and every listing is
+returned in that order, so Counters built from the results tie-break
+like Counters built by scanning the tokens.
+
+Usage:
+    index = SubstringIndex(word_strings)
+    index.contains_count("kedy") - index.count("kedy")   # compound tokens
+    index.stems_after_prefix("ot", min_length=3).most_common(20)
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable, List
+
+import numpy as np
+
+# Sorts after any character that appears in a transcription
+RANGE_END = "\U0010ffff"
+
+
+def sorted_range(keys: List[str], prefix: str):
+    """[lo, hi) of the sorted keys that start with prefix."""
+    lo = bisect_left(keys, prefix)
+    hi = bisect_left(keys, prefix + RANGE_END, lo)
+    return lo, hi
+
+
+class SubstringIndex:
+    """Prefix, suffix and containment queries over weighted word types."""
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Args:
+            words: Running text as a token sequence (types are weighted by
+                how often they occur)
+        """
+        counts = Counter(words)
+        self.types: List[str] = list(counts)
+        self.freq = np.asarray([counts[t] for t in self.types], dtype=np.int64)
+        self.type_id = {t: i for i, t in enumerate(self.types)}
+
+        # Prefix side: types in sorted order, with cumulative token counts
+        order = sorted(range(len(self.types)), key=self.types.__getitem__)
+        self.prefix_keys = [self.types[i] for i in order]
+        self.prefix_ids = np.asarray(order, dtype=np.int64)
+        self.prefix_cum = np.concatenate(([0], np.cumsum(self.freq[self.prefix_ids])))
+
+        # Suffix side: the same over reversed types
+        reversed_types = [t[::-1] for t in self.types]
+        order = sorted(range(len(self.types)), key=reversed_types.__getitem__)
+        self.suffix_keys = [reversed_types[i] for i in order]
+        self.suffix_ids = np.asarray(order, dtype=np.int64)
+        self.suffix_cum = np.concatenate(([0], np.cumsum(self.freq[self.suffix_ids])))
+
+        # Suffix array over the types: (suffix, owner type), sorted
+        entries = sorted(
+            (word[start:], type_id)
+            for type_id, word in enumerate(self.types)
+            for start in range(len(word))
+        )
+        self.array_keys = [suffix for suffix, _ in entries]
+        self.array_owner = np.asarray([owner for _, owner in entries], dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Number of distinct types."""
+        return len(self.types)
+
+    def count(self, word: str) -> int:
+        """Tokens exactly equal to word."""
+        type_id = self.type_id.get(word)
+        return int(self.freq[type_id]) if type_id is not None else 0
+
+    # ------------------------------------------------------------------
+    # Type-id lookups (first-occurrence order)
+    # ------------------------------------------------------------------
+
+    def ids_with_prefix(self, prefix: str) -> np.ndarray:
+        """Ids of types starting with prefix."""
+        lo, hi = sorted_range(self.prefix_keys, prefix)
+        return np.sort(self.prefix_ids[lo:hi])
+
+    def ids_with_suffix(self, suffix: str) -> np.ndarray:
+        """Ids of types ending with suffix."""
+        lo, hi = sorted_range(self.suffix_keys, suffix[::-1])
+        return np.sort(self.suffix_ids[lo:hi])
+
+    def ids_containing(self, substring: str) -> np.ndarray:
+        """Ids of types containing substring (each type once)."""
+        lo, hi = sorted_range(self.array_keys, substring)
+        return np.unique(self.array_owner[lo:hi])
+
+    # ------------------------------------------------------------------
+    # Token counts
+    # ------------------------------------------------------------------
+
+    def prefix_count(self, prefix: str) -> int:
+        """Tokens starting with prefix (including prefix itself)."""
+        lo, hi = sorted_range(self.prefix_keys, prefix)
+        return int(self.prefix_cum[hi] - self.prefix_cum[lo])
+
+    def suffix_count(self, suffix: str) -> int:
+        """Tokens ending with suffix (including suffix itself)."""
+        lo, hi = sorted_range(self.suffix_keys, suffix[::-1])
+        return int(self.suffix_cum[hi] - self.suffix_cum[lo])
+
+    def contains_count(self, substring: str) -> int:
+        """Tokens containing substring (including substring itself)."""
+        return int(self.freq[self.ids_containing(substring)].sum())
+
+    # ------------------------------------------------------------------
+    # Listings
+    # ------------------------------------------------------------------
+
+    def types_with_prefix(self, prefix: str) -> List[str]:
+        """Types starting with prefix."""
+        return [self.types[i] for i in self.ids_with_prefix(prefix).tolist()]
+
+    def types_with_suffix(self, suffix: str) -> List[str]:
+        """Types ending with suffix."""
+        return [self.types[i] for i in self.ids_with_suffix(suffix).tolist()]
+
+    def types_containing(self, substring: str) -> List[str]:
+        """Types containing substring."""
+        return [self.types[i] for i in self.ids_containing(substring).tolist()]
+
+    def stems_after_prefix(self, prefix: str, min_length: int = 1) -> Counter:
+        """Token counts of the stems following prefix, for stems of at least min_length."""
+        stems = Counter()
+        for type_id in self.ids_with_prefix(prefix).tolist():
+            stem = self.types[type_id][len(prefix) :]
+            if len(stem) >= min_length:
+                stems[stem] = int(self.freq[type_id])
+        return stems
+
+    def roots_before_suffix(self, suffix: str, min_length: int = 1) -> Counter:
+        """Token counts of the roots preceding suffix, for roots of at least min_length."""
+        roots = Counter()
+        for type_id in self.ids_with_suffix(suffix).tolist():
+            word = self.types[type_id]
+            root = word[: len(word) - len(suffix)]
+            if len(root) >= min_length:
+                roots[root] = int(self.freq[type_id])
+        return roots
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Integer-Encoded Token Array
+Interns every word type to an int32 id and keeps the corpus as NumPy
+arrays (token id plus parallel folio, line and section indices), so
+counting, windowing and n-gram extraction run as vectorized operations
+instead of Python loops over lists of strings.
+
+Memory is about 14 bytes per token (int32 token, folio and line, int16
+section) versus several hundred for a list of str objects plus
+per-token dicts. Folio ids are int32 as in EvaCorpus: a plain-text
+transcription makes every line its own folio.
+
+Per-token context (the words around a token, its whole line) is not
+stored: record() returns a TokenView that slices it out of the shared
+token buffer when read, so printing a few results costs a few joins.
+
+Usage:
+    tokens = TokenArray.from_corpus(load_corpus(path))   # with sections
+    tokens = TokenArray.from_words(words)                # plain word list
+    tokens.record(i).context_before                      # lazy context
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# IVTFF illustration-type page variable ($I) -> section name
+ILLUSTRATION_SECTIONS = {
+    "H": "herbal",
+    "A": "astronomical",
+    "C": "cosmological",
+    "Z": "zodiac",
+    "B": "biological",
+    "P": "pharmaceutical",
+    "S": "stars",
+    "T": "text",
+}
+
+UNKNOWN_SECTION = "unknown"
+
+
+def intern_words(words: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+    """
+    Intern a word sequence.
+    Returns (vocab, ids) where vocab[ids[i]] is the i-th word; ids are
+    assigned in order of first occurrence.
+    """
+    index: Dict[str, int] = {}
+    ids = [index.setdefault(word, len(index)) for word in words]
+    return list(index), np.asarray(ids, dtype=np.int32)
+
+
+class TokenArray:
+    """Interned corpus with parallel per-token index arrays."""
+
+    def __init__(
+        self,
+        vocab: List[str],
+        tokens: np.ndarray,
+        folio: Optional[np.ndarray] = None,
+        line: Optional[np.ndarray] = None,
+        section: Optional[np.ndarray] = None,
+        folios: Optional[List[str]] = None,
+        sections: Optional[List[str]] = None,
+    ):
+        n = len(tokens)
+        self.vocab = vocab
+        self.tokens = np.asarray(tokens, dtype=np.int32)
+        self.folio = (
+            np.zeros(n, dtype=np.int32) if folio is None else folio.astype(np.int32)
+        )
+        # Without line information the whole corpus is one line
+        self.line = np.zeros(n, dtype=np.int32) if line is None else line.astype(np.int32)
+        if section is not None and len(section) and section.max() > np.iinfo(np.int16).max:
+            raise ValueError(f"Too many sections for int16 ids: {int(section.max()) + 1}")
+        self.section = (
+            np.zeros(n, dtype=np.int16) if section is None else section.astype(np.int16)
+        )
+        self.folios = folios or [""]
+        self.sections = sections or [UNKNOWN_SECTION]
+        self.word_index = {word: i for i, word in enumerate(vocab)}
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "TokenArray":
+        """Build from a plain word list (no folio/line/section information)."""
+        vocab, tokens = intern_words(words)
+        return cls(vocab, tokens)
+
+    @classmethod
+    def from_corpus(cls, corpus, section_var: str = "I") -> "TokenArray":
+        """
+        Build from an EvaCorpus (see eva_corpus.py).
+        Sections come from the page variable section_var ($I illustration
+        type by default); folios without it get section "unknown".
+        """
+        codes = corpus.page_vars.get(section_var, [""] * len(corpus.folios))
+        names = [ILLUSTRATION_SECTIONS.get(code, code) or UNKNOWN_SECTION for code in codes]
+        sections = sorted(set(names))
+        folio_section = np.asarray([sections.index(n) for n in names], dtype=np.int32)
+        return cls(
+            vocab=corpus.vocab,
+            tokens=corpus.tokens,
+            folio=corpus.folio,
+            line=corpus.line,
+            section=folio_section[corpus.folio] if len(names) else None,
+            folios=corpus.folios,
+            sections=sections,
+        )
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def ids(self, words: Iterable[str]) -> np.ndarray:
+        """Token ids for words; words not in the corpus map to -1."""
+        return np.asarray([self.word_index.get(w, -1) for w in words], dtype=np.int32)
+
+    def type_mask(self, predicate) -> np.ndarray:
+        """Boolean mask over the vocabulary of types satisfying predicate(word)."""
+        return np.fromiter((predicate(w) for w in self.vocab), bool, len(self.vocab))
+
+    def token_mask(self, words: Iterable[str]) -> np.ndarray:
+        """Boolean mask over tokens whose word is in words."""
+        wanted = np.zeros(len(self.vocab), dtype=bool)
+        ids = self.ids(words)
+        wanted[ids[ids >= 0]] = True
+        return wanted[self.tokens]
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """Token ids back to words."""
+        return [self.vocab[i] for i in ids]
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+
+    def counts(self) -> np.ndarray:
+        """Token frequency per type id."""
+        return np.bincount(self.tokens, minlength=len(self.vocab))
+
+    def counter(self) -> Counter:
+        """Token frequencies as a Counter keyed by word."""
+        return Counter(dict(zip(self.vocab, self.counts().tolist())))
+
+    def section_counts(self) -> np.ndarray:
+        """Type x section count matrix (one grouped bincount)."""
+        n_sections = len(self.sections)
+        flat = self.tokens.astype(np.int64) * n_sections + self.section
+        matrix = np.bincount(flat, minlength=len(self.vocab) * n_sections)
+        return matrix.reshape(len(self.vocab), n_sections)
+
+    def section_totals(self) -> np.ndarray:
+        """Token count per section."""
+        return np.bincount(self.section, minlength=len(self.sections))
+
+    # ------------------------------------------------------------------
+    # Windowing and n-grams
+    # ------------------------------------------------------------------
+
+    def ngram_windows(self, n: int, within_line: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        All n-gram windows as a (count, n) view of token ids.
+        Returns (windows, start positions); with within_line=True windows
+        that cross a line boundary are dropped.
+        """
+        if len(self.tokens) < n:
+            return np.empty((0, n), dtype=np.int32), np.empty(0, dtype=np.int64)
+        windows = sliding_window_view(self.tokens, n)
+        starts = np.arange(len(windows))
+        if within_line and n > 1:
+            keep = self.line[: len(windows)] == self.line[n - 1 :]
+            windows, starts = windows[keep], starts[keep]
+        return windows, starts
+
+    def ngram_counts(
+        self, n: int, min_freq: int = 1, within_line: bool = False
+    ) -> Dict[Tuple[str, ...], int]:
+        """
+        Count every n-gram in one vectorized pass.
+        Returns {word tuple: count} for n-grams seen at least min_freq
+        times, ordered by first occurrence like a Counter built by a scan.
+        """
+        windows, starts = self.ngram_windows(n, within_line)
+        if not len(windows):
+            return {}
+        unique, first, counts = np.unique(
+            windows, axis=0, return_index=True, return_counts=True
+        )
+        keep = counts >= min_freq
+        unique, first, counts = unique[keep], first[keep], counts[keep]
+        order = np.argsort(first, kind="stable")
+        vocab = self.vocab
+        return {
+            tuple(vocab[i] for i in unique[k]): int(counts[k])
+            for k in order.tolist()
+        }
+
+    def neighbours(self, positions: np.ndarray, offset: int) -> np.ndarray:
+        """
+        Token ids at positions + offset; -1 where that falls outside the corpus.
+        """
+        target = np.asarray(positions) + offset
+        result = np.full(len(target), -1, dtype=np.int32)
+        valid = (target >= 0) & (target < len(self.tokens))
+        result[valid] = self.tokens[target[valid]]
+        return result
+
+    def neighbour_counts(self, positions: np.ndarray, offset: int) -> np.ndarray:
+        """Per-type count of the tokens found at positions + offset."""
+        ids = self.neighbours(positions, offset)
+        return np.bincount(ids[ids >= 0], minlength=len(self.vocab))
+
+    # ------------------------------------------------------------------
+    # Token records
+    # ------------------------------------------------------------------
+
+    def line_span(self, position: int) -> Tuple[int, int]:
+        """
+        Token range [start, end) of the line holding position.
+        Lines must be contiguous runs of non-decreasing line ids, as built
+        by from_corpus() or by parsing a file top to bottom.
+        """
+        line = self.line[position]
+        start = int(np.searchsorted(self.line, line, side="left"))
+        end = int(np.searchsorted(self.line, line, side="right"))
+        return start, end
+
+    def record(self, position: int, window: int = 3) -> "TokenView":
+        """Lazy view of one token with window words of context on each side."""
+        return TokenView(self, position, window)
+
+    def records(
+        self, positions: Optional[Iterable[int]] = None, window: int = 3
+    ) -> Iterator["TokenView"]:
+        """Lazy views of the given positions (all tokens by default)."""
+        if positions is None:
+            positions = range(len(self.tokens))
+        for position in positions:
+            yield TokenView(self, int(position), window)
+
+
+class TokenView:
+    """
+    One token of a TokenArray, read like the per-token dicts it replaces
+    (view["word"], view.get("section")). Only the array and a position
+    are held; context strings are joined from the shared buffer on access.
+    """
+
+    __slots__ = ("array", "position", "window")
+
+    def __init__(self, array: TokenArray, position: int, window: int = 3):
+        self.array = array
+        self.position = position
+        self.window = window
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def __repr__(self) -> str:
+        return f"TokenView({self.position}, {self.word!r})"
+
+    @property
+    def word(self) -> str:
+        return self.array.vocab[self.array.tokens[self.position]]
+
+    @property
+    def line(self) -> int:
+        return int(self.array.line[self.position])
+
+    @property
+    def folio(self) -> str:
+        return self.array.folios[self.array.folio[self.position]]
+
+    @property
+    def section(self) -> str:
+        return self.array.sections[self.array.section[self.position]]
+
+    def _join(self, start: int, end: int) -> str:
+        return " ".join(self.array.decode(self.array.tokens[start:end].tolist()))
+
+    @property
+    def context_before(self) -> str:
+        """Up to window words before the token, on its line."""
+        start, _ = self.array.line_span(self.position)
+        return self._join(max(start, self.position - self.window), self.position)
+
+    @property
+    def context_after(self) -> str:
+        """Up to window words after the token, on its line."""
+        _, end = self.array.line_span(self.position)
+        return self._join(self.position + 1, min(end, self.position + 1 + self.window))
+
+    @property
+    def full_sentence(self) -> str:
+        """The token's whole line."""
+        return self._join(*self.array.line_span(self.position))
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Transform Variant Index
+Inverted index from the canonical form of a word to the vocabulary types
+that reach it, so "does any e↔o variant of this word hit the vocabulary"
+is one hash lookup instead of enumerating up to 2^k variants per token.
+
+Transform families:
+    e↔o          canonical form maps every 'o' to 'e'; two words are
+                 per-position e↔o variants exactly when their forms agree
+    reversal     query with word[::-1] against the same e↔o classes
+    consonants   ch↔sh, c↔k, ph↔f, t↔d as whole-word replacements; each
+                 gives two variants, which are then looked up by e↔o class
+    scrambling   first and last letter kept, middle letters in any order;
+                 the anagram key (first, sorted middle, last) covers every
+                 permutation, and its e↔o form covers scramble + e↔o
+
+Matching follows the enumerators used across phase3 (apply_eo_substitution,
+generate_variants_smart): every combination for up to EO_POSITION_LIMIT
+e/o positions, and only the word, all-e and all-o forms beyond that.
+
+Usage:
+    index = VariantIndex(vocab)                # any iterable of words
+    index.eo_matches("qokoey")                 # vocabulary types reached
+    index.reversed_matches("yeokoq")
+    index.positions_of(index.eo_matches(w))    # token positions, if built
+                                               # over a running text
+
+    anagrams = AnagramIndex(vocab)
+    anagrams.scramble_matches("rtoo")          # ["root"]
+    anagrams.scramble_eo_matches("reet")       # ["root"]
+"""
+
+from collections import Counter
+from itertools import product
+from typing import Dict, Iterable, List, Optional
+
+EO_POSITION_LIMIT = 5
+
+# Whole-word consonant replacements: shift type -> (a, b) for a <-> b
+CONSONANT_SHIFTS = {
+    "ch_sh": ("ch", "sh"),
+    "c_k": ("c", "k"),
+    "ph_f": ("ph", "f"),
+    "t_d": ("t", "d"),
+}
+
+
+def eo_key(word: str) -> str:
+    """Canonical e↔o form: every 'o' written as 'e'."""
+    return word.replace("o", "e")
+
+
+def eo_position_count(word: str) -> int:
+    """Number of e/o positions in word."""
+    return word.count("e") + word.count("o")
+
+
+def eo_variants(word: str, max_positions: int = EO_POSITION_LIMIT) -> List[str]:
+    """
+    Enumerate e↔o variants of word (every combination up to max_positions
+    e/o positions; word, all-e and all-o beyond that). Prefer
+    VariantIndex for vocabulary lookups; this is for callers that need
+    the variants themselves.
+    """
+    positions = [i for i, c in enumerate(word) if c in "eo"]
+    if len(positions) > max_positions:
+        return list(dict.fromkeys([word, word.replace("o", "e"), word.replace("e", "o")]))
+
+    variants = []
+    chars = list(word)
+    for combination in product("eo", repeat=len(positions)):
+        for pos, new_char in zip(positions, combination):
+            chars[pos] = new_char
+        variants.append("".join(chars))
+    return variants
+
+
+def is_eo_variant(
+    word: str, candidate: str, max_positions: int = EO_POSITION_LIMIT
+) -> bool:
+    """True if candidate is among eo_variants(word)."""
+    if eo_key(word) != eo_key(candidate):
+        return False
+    if eo_position_count(word) <= max_positions:
+        return True
+    return candidate in (word, word.replace("o", "e"), word.replace("e", "o"))
+
+
+def consonant_shift(word: str, shift_type: str) -> List[str]:
+    """Both whole-word replacements for one shift type (a -> b, then b -> a)."""
+    a, b = CONSONANT_SHIFTS[shift_type]
+    return [word.replace(a, b), word.replace(b, a)]
+
+
+class VariantIndex:
+    """e↔o equivalence classes over a vocabulary or running text."""
+
+    def __init__(self, words: Iterable[str], max_positions: int = EO_POSITION_LIMIT):
+        """
+        Args:
+            words: Vocabulary (set, dict keys) or token sequence; for a
+                token sequence the positions of every type are kept too
+            max_positions: e/o positions up to which every combination counts
+        """
+        self.max_positions = max_positions
+        self.words = list(words)
+        self.classes: Dict[str, List[str]] = {}
+        self.positions: Dict[str, List[int]] = {}
+        for pos, word in enumerate(self.words):
+            seen = self.positions.get(word)
+            if seen is None:
+                self.positions[word] = [pos]
+                self.classes.setdefault(eo_key(word), []).append(word)
+            else:
+                seen.append(pos)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.positions
+
+    def __len__(self) -> int:
+        """Number of distinct types."""
+        return len(self.positions)
+
+    def eo_matches(self, word: str) -> List[str]:
+        """Vocabulary types that are e↔o variants of word (first-seen order)."""
+        return [
+            candidate
+            for candidate in self.classes.get(eo_key(word), ())
+            if is_eo_variant(word, candidate, self.max_positions)
+        ]
+
+    def reversed_matches(self, word: str) -> List[str]:
+        """Vocabulary types that are e↔o variants of word reversed."""
+        return self.eo_matches(word[::-1])
+
+    def first_eo_match(self, word: str):
+        """First e↔o match of word, or None."""
+        matches = self.eo_matches(word)
+        return matches[0] if matches else None
+
+    def positions_of(self, types: Iterable[str]) -> List[int]:
+        """Sorted token positions of the given types."""
+        positions: List[int] = []
+        for word in types:
+            positions.extend(self.positions.get(word, ()))
+        return sorted(positions)
+
+
+# ============================================================================
+# SCRAMBLING (first/last letter kept, middle permuted)
+# ============================================================================
+
+# Words this short have no middle to scramble
+SCRAMBLE_MIN_LENGTH = 4
+
+
+def anagram_key(word: str) -> str:
+    """First letter, sorted middle letters, last letter (the word itself if short)."""
+    if len(word) < SCRAMBLE_MIN_LENGTH:
+        return word
+    return word[0] + "".join(sorted(word[1:-1])) + word[-1]
+
+
+def eo_anagram_key(word: str) -> str:
+    """Anagram key of the canonical e↔o form."""
+    return anagram_key(eo_key(word))
+
+
+def unscramble(word: str, target: str) -> Optional[str]:
+    """
+    The scramble of word (first/last kept) that lines up with target
+    letter by letter up to e↔o, preferring target's own letters at e/o
+    positions; None if target is not a scramble(+e↔o) of word.
+    """
+    if eo_anagram_key(word) != eo_anagram_key(target):
+        return None
+    if len(word) < SCRAMBLE_MIN_LENGTH:
+        return word
+    pool = Counter(word[1:-1])
+    middle = []
+    for char in target[1:-1]:
+        if pool[char] == 0:
+            char = "o" if char == "e" else "e"
+        pool[char] -= 1
+        middle.append(char)
+    return word[0] + "".join(middle) + word[-1]
+
+
+class AnagramIndex:
+    """Scramble and scramble + e↔o classes over a vocabulary."""
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Args:
+            words: Vocabulary; matches are returned in this order
+        """
+        self.words = list(dict.fromkeys(words))
+        self.classes: Dict[str, List[str]] = {}
+        self.eo_classes: Dict[str, List[str]] = {}
+        for word in self.words:
+            self.classes.setdefault(anagram_key(word), []).append(word)
+            self.eo_classes.setdefault(eo_anagram_key(word), []).append(word)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.classes.get(anagram_key(word), ())
+
+    def __len__(self) -> int:
+        """Number of vocabulary words."""
+        return len(self.words)
+
+    @staticmethod
+    def _word_first(word: str, matches: List[str]) -> List[str]:
+        """Matches with word itself moved to the front, if present."""
+        if word in matches:
+            return [word] + [m for m in matches if m != word]
+        return list(matches)
+
+    def scramble_matches(self, word: str) -> List[str]:
+        """Vocabulary words that are middle-letter scrambles of word (word first)."""
+        return self._word_first(word, self.classes.get(anagram_key(word), []))
+
+    def scramble_eo_matches(self, word: str) -> List[str]:
+        """Vocabulary words reached by scrambling and any e↔o substitution."""
+        return self._word_first(word, self.eo_classes.get(eo_anagram_key(word), []))
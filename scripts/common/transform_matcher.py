@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Weighted Transform-Distance Matcher
+Approximate matching of Middle English words against a Voynich type
+inventory under a weighted edit distance whose cheap operations are the
+known transforms, so "every type within cost k of this word" is answered
+by one search instead of enumerating and probing transform variants.
+
+Costs:
+    transform substitutions   e↔o, ch↔sh, t↔d, p↔b, f↔v, g↔k, c↔k (per
+                              occurrence, multi-letter rules allowed)
+    plain edits               any other substitution, insertion or deletion
+    reversal                  a separate pass over the reversed word, at a
+                              fixed extra cost
+
+The inventory is stored as a character trie and searched with the
+weighted edit-distance DP, one row per trie node (a Levenshtein automaton
+run over the trie). Rows keep only the cells within k, so a subtree is
+pruned as soon as no alignment of its prefix is still within budget;
+while plain edits cost more than k only the letters some cell can
+match or transform into are followed. Matches carry the exact transform
+path, recovered by aligning the word with the matched type.
+
+Usage:
+    matcher = TransformMatcher(voynich_types)
+    for match in matcher.search("root", max_cost=1.5):
+        print(match["word"], match["cost"], describe_path(match["path"]))
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Transform substitutions (applied in both directions) and their costs
+TRANSFORM_COSTS = {
+    ("e", "o"): 0.25,
+    ("ch", "sh"): 0.5,
+    ("t", "d"): 0.5,
+    ("p", "b"): 0.5,
+    ("f", "v"): 0.5,
+    ("g", "k"): 0.5,
+    ("c", "k"): 0.5,
+}
+EDIT_COST = 2.0
+REVERSAL_COST = 0.5
+
+Rule = Tuple[str, str, float]
+
+_WORD = None  # trie key marking a complete type
+
+
+def symmetric_rules(costs: Dict[Tuple[str, str], float]) -> List[Rule]:
+    """Both directions of every transform substitution."""
+    rules = {}
+    for (a, b), cost in costs.items():
+        for source, target in ((a, b), (b, a)):
+            rules[(source, target)] = min(cost, rules.get((source, target), cost))
+    return [(a, b, cost) for (a, b), cost in rules.items()]
+
+
+def describe_path(path: Sequence[str]) -> str:
+    """
+    Transform path as a label for grouping, e.g. 'reversal + e→o + t→d':
+    reversal first, then each distinct operation once, sorted ('exact' if
+    the path is empty).
+    """
+    if not path:
+        return "exact"
+    operations = sorted(set(path) - {"reversal"})
+    return " + ".join((["reversal"] if "reversal" in path else []) + operations)
+
+
+class _Rules:
+    """Transform rules indexed by where they end in a given source word."""
+
+    def __init__(self, source: str, rules: Sequence[Rule]):
+        # ending[i] = rules whose source side equals source[i - len(a):i]
+        self.ending: List[List[Tuple[str, int, int, float]]] = [
+            [] for _ in range(len(source) + 1)
+        ]
+        for a, b, cost in rules:
+            start = source.find(a)
+            while start >= 0:
+                self.ending[start + len(a)].append((b, len(a), len(b), cost))
+                start = source.find(a, start + 1)
+
+
+def align(
+    source: str,
+    target: str,
+    rules: Sequence[Rule],
+    edit_cost: float = EDIT_COST,
+) -> Tuple[float, List[str]]:
+    """
+    Cheapest alignment of source with target.
+
+    Returns:
+        (cost, path) where path lists the operations in order: "a→b" for
+        transform or plain substitutions, "+x" for an inserted letter,
+        "-x" for a deleted one (matches are omitted)
+    """
+    n, m = len(source), len(target)
+    ending = _Rules(source, rules).ending
+    inf = float("inf")
+    cost = [[inf] * (n + 1) for _ in range(m + 1)]
+    back: List[List[Optional[Tuple[int, int, str]]]] = [
+        [None] * (n + 1) for _ in range(m + 1)
+    ]
+    cost[0][0] = 0.0
+
+    for j in range(m + 1):
+        for i in range(n + 1):
+            if i == 0 and j == 0:
+                continue
+            best, step = inf, None
+            if i and j:
+                same = source[i - 1] == target[j - 1]
+                candidate = cost[j - 1][i - 1] + (0.0 if same else edit_cost)
+                if candidate < best:
+                    label = "" if same else f"{source[i - 1]}→{target[j - 1]}"
+                    best, step = candidate, (j - 1, i - 1, label)
+            for b, la, lb, rule_cost in ending[i]:
+                if lb <= j and target[j - lb : j] == b:
+                    candidate = cost[j - lb][i - la] + rule_cost
+                    if candidate < best:
+                        best, step = candidate, (j - lb, i - la, f"{source[i - la:i]}→{b}")
+            if i and cost[j][i - 1] + edit_cost < best:
+                best, step = cost[j][i - 1] + edit_cost, (j, i - 1, f"-{source[i - 1]}")
+            if j and cost[j - 1][i] + edit_cost < best:
+                best, step = cost[j - 1][i] + edit_cost, (j - 1, i, f"+{target[j - 1]}")
+            cost[j][i], back[j][i] = best, step
+
+    path = []
+    j, i = m, n
+    while (j, i) != (0, 0):
+        j, i, label = back[j][i]
+        if label:
+            path.append(label)
+    path.reverse()
+    return cost[m][n], path
+
+
+class TransformMatcher:
+    """Character trie over a type inventory with weighted edit-distance search."""
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        transform_costs: Optional[Dict[Tuple[str, str], float]] = None,
+        edit_cost: float = EDIT_COST,
+        reversal_cost: float = REVERSAL_COST,
+    ):
+        """
+        Args:
+            words: Type inventory (duplicates are ignored)
+            transform_costs: {(a, b): cost} transform substitutions
+                (default TRANSFORM_COSTS), applied in both directions
+            edit_cost: Cost of any other substitution, insertion or deletion
+            reversal_cost: Extra cost of matching the reversed word
+        """
+        self.rules = symmetric_rules(
+            TRANSFORM_COSTS if transform_costs is None else transform_costs
+        )
+        self.edit_cost = edit_cost
+        self.reversal_cost = reversal_cost
+        self.max_target = max((len(b) for _, b, _ in self.rules), default=1)
+
+        self.words: List[str] = []
+        self.root: Dict = {}
+        for word in dict.fromkeys(words):
+            node = self.root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_WORD] = len(self.words)
+            self.words.append(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _within(self, source: str, max_cost: float) -> Dict[int, float]:
+        """{type index: distance} for every type within max_cost of source."""
+        n = len(source)
+        edit = self.edit_cost
+        # Rules by where their source side starts in this word
+        starting: List[List[Tuple[str, int, float]]] = [[] for _ in range(n + 1)]
+        for i, rules in enumerate(_Rules(source, self.rules).ending):
+            for b, la, lb, rule_cost in rules:
+                starting[i - la].append((b, la, rule_cost))
+
+        # Rows are sparse: {source prefix length: cost} for cells within
+        # max_cost only, since costs never decrease along an alignment
+        def close(row: Dict[int, float]) -> Dict[int, float]:
+            """Add deletions of source letters (moves along the row)."""
+            if edit <= max_cost:
+                for i in range(min(row, default=n), n):
+                    if i in row and row[i] + edit <= max_cost:
+                        if row[i] + edit < row.get(i + 1, max_cost + 1):
+                            row[i + 1] = row[i] + edit
+            return row
+
+        rows = [close({0: 0.0})]
+        chars: List[str] = []
+        found: Dict[int, float] = {}
+        if self.root.get(_WORD) is not None and n in rows[0]:
+            found[self.root[_WORD]] = rows[0][n]
+
+        def next_chars(j: int) -> Iterable[str]:
+            """Letters that can extend some alignment when plain edits are too dear."""
+            wanted = {source[i] for i in rows[-1] if i < n}
+            # Next letter of every rule target started back letters ago
+            for back in range(min(self.max_target, j)):
+                placed = "".join(chars[j - 1 - back :])
+                for i in rows[j - 1 - back]:
+                    for b, _, _ in starting[i]:
+                        if len(b) > back and b.startswith(placed):
+                            wanted.add(b[back])
+            return wanted
+
+        def visit(node: Dict):
+            j = len(rows)
+            if edit <= max_cost:
+                letters = [char for char in node if char is not _WORD]
+            else:
+                letters = [char for char in next_chars(j) if char in node]
+            for char in letters:
+                child = node[char]
+                chars.append(char)
+                row: Dict[int, float] = {}
+                for i, cost in rows[-1].items():
+                    # Match or plain substitution, then insertion of char
+                    if i < n:
+                        step = cost + (0.0 if source[i] == char else edit)
+                        if step <= max_cost and step < row.get(i + 1, max_cost + 1):
+                            row[i + 1] = step
+                    if cost + edit <= max_cost and cost + edit < row.get(i, max_cost + 1):
+                        row[i] = cost + edit
+                # Transform rules whose target side ends with char
+                for lb in range(1, min(self.max_target, j) + 1):
+                    suffix = "".join(chars[j - lb :])
+                    for i, cost in rows[j - lb].items():
+                        for b, la, rule_cost in starting[i]:
+                            if b == suffix and cost + rule_cost <= max_cost:
+                                if cost + rule_cost < row.get(i + la, max_cost + 1):
+                                    row[i + la] = cost + rule_cost
+                close(row)
+
+                word_index = child.get(_WORD)
+                if word_index is not None and n in row:
+                    found[word_index] = row[n]
+
+                # Deeper rows only read back max_target rows
+                rows.append(row)
+                if any(rows[-self.max_target :]):
+                    visit(child)
+                rows.pop()
+                chars.pop()
+
+        visit(self.root)
+        return found
+
+    def search(
+        self, word: str, max_cost: float, reversal: bool = True
+    ) -> List[Dict]:
+        """
+        All types within max_cost of word.
+
+        Args:
+            word: Query (e.g. a Middle English word)
+            max_cost: Largest total cost to accept
+            reversal: Also match the reversed word (plus reversal_cost)
+
+        Returns:
+            Dicts with word, cost and path (the alignment's operations,
+            led by "reversal" when the reversed pass was cheaper), sorted
+            by cost, then by inventory order
+        """
+        best: Dict[int, Tuple[float, bool]] = {
+            index: (cost, False) for index, cost in self._within(word, max_cost).items()
+        }
+        if reversal and max_cost >= self.reversal_cost:
+            budget = max_cost - self.reversal_cost
+            for index, cost in self._within(word[::-1], budget).items():
+                cost += self.reversal_cost
+                if index not in best or cost < best[index][0]:
+                    best[index] = (cost, True)
+
+        matches = []
+        for index, (cost, reversed_pass) in sorted(
+            best.items(), key=lambda item: (item[1][0], item[0])
+        ):
+            target = self.words[index]
+            if reversed_pass:
+                _, path = align(word[::-1], target, self.rules, self.edit_cost)
+                path = ["reversal"] + path
+            else:
+                _, path = align(word, target, self.rules, self.edit_cost)
+            matches.append({"word": target, "cost": cost, "path": path})
+        return matches
+
+    def align(self, word: str, target: str) -> Tuple[float, List[str]]:
+        """Cost and transform path from word to target (no reversal)."""
+        return align(word, target, self.rules, self.edit_cost)
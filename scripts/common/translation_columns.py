@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Columnar Translation Loader
+Converts the monolithic translator output (COMPLETE_MANUSCRIPT_TRANSLATION_
+PHASE17.json, ~5k sentences of nested words -> morphology dicts) once into
+flat interned columns, cached as an uncompressed .npz whose numeric
+columns are memory-mapped on load.
+
+Columns, one entry per token (id -1 = None):
+    word        int32 id into words (lowercased token)
+    prefix      int32 id into prefixes
+    root        int32 id into roots
+    confidence  int8 id into confidences
+    method      int8 id into methods
+    gloss       int32 id into glosses (morphology "translation" list, JSON)
+    final       int32 id into finals (final_translation)
+    reversal    int32 id into reversals (reversal match, JSON)
+    sentence    int32 sentence index
+    position    int32 word index within the sentence
+Suffixes are ragged: the suffixes of token t are
+    suffix_ids[suffix_offsets[t]:suffix_offsets[t + 1]]   (ids into suffixes)
+Per sentence: sentence_offsets (token range), folio (id into folios),
+recognition_rate, and the original text as UTF-8 bytes in
+original_bytes[original_offsets[i]:original_offsets[i + 1]].
+
+The cache (data/cache/<json name>.npz) is reused while the JSON's mtime
+and size are unchanged, falling back to a SHA-1 comparison, as for the
+EVA corpus cache.
+
+Usage:
+    tr = load_translation()
+    tokens = tr.tokens_with("root", "ch")           # vectorized filter
+    tr.value_counts("prefix", tokens)               # Counter of prefixes
+    tr.sentence_dict(12)                            # original nested form
+"""
+
+import json
+import struct
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from common.eva_corpus import DEFAULT_CACHE_DIR, file_sha1, save_npz_atomic
+
+# Bump when the column layout changes so stale caches are rebuilt
+CACHE_VERSION = 1
+
+DEFAULT_TRANSLATION = (
+    Path(__file__).resolve().parent.parent.parent
+    / "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json"
+)
+
+# Interned token fields: column name -> (vocabulary name, dtype)
+TOKEN_FIELDS = {
+    "word": ("words", np.int32),
+    "prefix": ("prefixes", np.int32),
+    "root": ("roots", np.int32),
+    "confidence": ("confidences", np.int8),
+    "method": ("methods", np.int8),
+    "gloss": ("glosses", np.int32),
+    "final": ("finals", np.int32),
+    "reversal": ("reversals", np.int32),
+}
+# Fields stored as JSON strings in their vocabulary
+JSON_FIELDS = {"gloss", "reversal"}
+NUMERIC_COLUMNS = [
+    *TOKEN_FIELDS,
+    "sentence",
+    "position",
+    "suffix_offsets",
+    "suffix_ids",
+    "sentence_offsets",
+    "folio",
+    "recognition_rate",
+    "original_offsets",
+    "original_bytes",
+]
+
+
+def memmap_npz(filepath: Path, names: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Memory-map arrays stored uncompressed in an .npz (np.savez) file.
+    Each member's .npy data is located through its zip local header.
+    """
+    arrays = {}
+    with zipfile.ZipFile(filepath) as archive, open(filepath, "rb") as f:
+        for name in names:
+            info = archive.getinfo(f"{name}.npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{name} is compressed; cannot memory-map")
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.zeros(shape, dtype=dtype)
+                continue
+            arrays[name] = np.memmap(
+                filepath,
+                dtype=dtype,
+                mode="r",
+                shape=shape,
+                order="F" if fortran else "C",
+                offset=f.tell(),
+            )
+    return arrays
+
+
+class TranslationColumns:
+    """Columnar, interned view of a translator output."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], vocabs: Dict[str, List[str]], meta: Dict):
+        for name, values in arrays.items():
+            setattr(self, name, values)
+        self.vocabs = vocabs
+        self.folios: List[str] = vocabs["folios"]
+        self.metadata: Dict = meta.get("metadata", {})
+        self.statistics: Dict = meta.get("statistics", {})
+        self._index: Dict[str, Dict[str, int]] = {}
+        self._suffix_token: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Number of tokens."""
+        return len(self.word)
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_offsets) - 1
+
+    # ------------------------------------------------------------------
+    # Vocabulary lookups
+    # ------------------------------------------------------------------
+
+    def vocab(self, field: str) -> List[str]:
+        """Vocabulary of an interned token field (or "suffix")."""
+        if field == "suffix":
+            return self.vocabs["suffixes"]
+        return self.vocabs[TOKEN_FIELDS[field][0]]
+
+    def id_of(self, field: str, value) -> int:
+        """Id of value in a field's vocabulary (-1 for None or unseen)."""
+        if value is None:
+            return -1
+        if field not in self._index:
+            self._index[field] = {v: i for i, v in enumerate(self.vocab(field))}
+        if field in JSON_FIELDS:
+            value = json.dumps(value, ensure_ascii=False)
+        return self._index[field].get(value, -1)
+
+    def decode(self, field: str, ids) -> List:
+        """Values of field ids (None for -1)."""
+        vocab = self.vocab(field)
+        values = [vocab[i] if i >= 0 else None for i in np.asarray(ids).tolist()]
+        if field in JSON_FIELDS:
+            values = [json.loads(v) if v is not None else None for v in values]
+        return values
+
+    # ------------------------------------------------------------------
+    # Vectorized filters
+    # ------------------------------------------------------------------
+
+    def mask(self, field: str, value) -> np.ndarray:
+        """Boolean token mask: field == value. Unseen values match nothing."""
+        type_id = self.id_of(field, value)
+        if type_id < 0 and value is not None:
+            return np.zeros(len(self), dtype=bool)
+        return np.asarray(getattr(self, field)) == type_id
+
+    def tokens_with(self, field: str, value) -> np.ndarray:
+        """Token indices where field == value."""
+        return np.flatnonzero(self.mask(field, value))
+
+    def vocab_mask(self, field: str, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Boolean array over a field's vocabulary: predicate(value)."""
+        return np.fromiter(
+            (bool(predicate(v)) for v in self.vocab(field)),
+            dtype=bool,
+            count=len(self.vocab(field)),
+        )
+
+    def field_mask(self, field: str, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Boolean token mask: predicate(value) for non-None values of field."""
+        hit = np.append(self.vocab_mask(field, predicate), False)
+        return hit[np.asarray(getattr(self, field))]
+
+    def suffix_mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Boolean token mask: any suffix of the token satisfies predicate."""
+        if self._suffix_token is None:
+            self._suffix_token = np.repeat(
+                np.arange(len(self), dtype=np.int64), np.diff(self.suffix_offsets)
+            )
+        hit = self.vocab_mask("suffix", predicate)[self.suffix_ids]
+        return np.bincount(self._suffix_token[hit], minlength=len(self)) > 0
+
+    def suffix_count(self) -> np.ndarray:
+        """Number of suffixes per token."""
+        return np.diff(self.suffix_offsets)
+
+    def suffixes_of(self, token: int) -> List[str]:
+        """Suffixes of one token, in word order."""
+        start, end = self.suffix_offsets[token], self.suffix_offsets[token + 1]
+        return self.decode("suffix", self.suffix_ids[start:end])
+
+    def value_counts(self, field: str, tokens=None) -> Counter:
+        """Counter of a field's values over all tokens or the given ones."""
+        ids = np.asarray(getattr(self, field))
+        if tokens is not None:
+            ids = ids[tokens]
+        counts = np.bincount(ids[ids >= 0].astype(np.int64), minlength=len(self.vocab(field)))
+        vocab = self.vocab(field)
+        return Counter({vocab[i]: int(counts[i]) for i in np.flatnonzero(counts)})
+
+    # ------------------------------------------------------------------
+    # Sentences
+    # ------------------------------------------------------------------
+
+    def sentence_tokens(self, sentence: int) -> slice:
+        """Token range of a sentence."""
+        return slice(int(self.sentence_offsets[sentence]), int(self.sentence_offsets[sentence + 1]))
+
+    def sentences_of(self, tokens) -> np.ndarray:
+        """Sorted unique sentence indices of the given tokens."""
+        return np.unique(np.asarray(self.sentence)[tokens])
+
+    def sentence_labels(self, field: str) -> Iterator[List]:
+        """Per-sentence lists of a field's values (None for -1)."""
+        values = self.decode(field, getattr(self, field))
+        offsets = np.asarray(self.sentence_offsets).tolist()
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield values[start:end]
+
+    def original(self, sentence: int) -> str:
+        """Original EVA text of a sentence."""
+        start, end = self.original_offsets[sentence], self.original_offsets[sentence + 1]
+        return bytes(self.original_bytes[start:end]).decode("utf-8")
+
+    def final_translation(self, sentence: int) -> str:
+        """Sentence translation, words joined by spaces."""
+        return " ".join(self.decode("final", self.final[self.sentence_tokens(sentence)]))
+
+    def sentence_records(self) -> List[Dict]:
+        """
+        Per-sentence {"folio", "original", "final_translation"} dicts, for
+        code that only reads those keys of the JSON translations list
+        (no per-word dicts are built).
+        """
+        finals = self.decode("final", self.final)
+        offsets = np.asarray(self.sentence_offsets).tolist()
+        folios = np.asarray(self.folio).tolist()
+        return [
+            {
+                "folio": self.folios[folios[i]],
+                "original": self.original(i),
+                "final_translation": " ".join(finals[offsets[i] : offsets[i + 1]]),
+            }
+            for i in range(self.sentence_count)
+        ]
+
+    # ------------------------------------------------------------------
+    # Nested form (for code written against the JSON)
+    # ------------------------------------------------------------------
+
+    def word_dict(self, token: int) -> Dict:
+        """One word entry exactly as in the translator output."""
+        word = self.vocabs["words"][self.word[token]]
+        return {
+            "original": word,
+            "morphology": {
+                "original": word,
+                "prefix": self.decode("prefix", [self.prefix[token]])[0],
+                "root": self.decode("root", [self.root[token]])[0],
+                "suffixes": self.suffixes_of(token),
+                "translation": self.decode("gloss", [self.gloss[token]])[0],
+                "method": self.decode("method", [self.method[token]])[0],
+            },
+            "reversal": self.decode("reversal", [self.reversal[token]])[0],
+            "final_translation": self.decode("final", [self.final[token]])[0],
+            "confidence": self.decode("confidence", [self.confidence[token]])[0],
+        }
+
+    def sentence_dict(self, sentence: int) -> Dict:
+        """One sentence entry exactly as in the translator output."""
+        span = self.sentence_tokens(sentence)
+        words = [self.word_dict(t) for t in range(span.start, span.stop)]
+        confidences = Counter(w["confidence"] for w in words)
+        return {
+            "folio": self.folios[self.folio[sentence]],
+            "original": self.original(sentence),
+            "words": words,
+            "final_translation": " ".join(w["final_translation"] for w in words),
+            "statistics": {
+                "total_words": len(words),
+                "high_confidence": confidences["high"],
+                "medium_confidence": confidences["medium"],
+                "reversal_matches": confidences["reversal-hypothesis"],
+                "unknown": confidences["unknown"],
+                "recognition_rate": float(self.recognition_rate[sentence]),
+            },
+        }
+
+
+# ============================================================================
+# CONVERSION AND CACHE
+# ============================================================================
+
+
+def columns_from_translation(data: Dict):
+    """Intern a translator output dict into (arrays, vocabs, meta)."""
+    vocabs: Dict[str, Dict[str, int]] = {
+        name: {} for name, _ in TOKEN_FIELDS.values()
+    }
+    vocabs["suffixes"] = {}
+    vocabs["folios"] = {}
+    columns: Dict[str, List[int]] = {field: [] for field in TOKEN_FIELDS}
+    sentence, position, suffix_ids = [], [], []
+    suffix_offsets, sentence_offsets = [0], [0]
+    folio, recognition_rate = [], []
+    original_offsets, original_bytes = [0], bytearray()
+
+    def intern(vocab_name: str, value) -> int:
+        if value is None:
+            return -1
+        vocab = vocabs[vocab_name]
+        return vocab.setdefault(value, len(vocab))
+
+    for sentence_id, trans in enumerate(data["translations"]):
+        for pos, word in enumerate(trans["words"]):
+            morphology = word["morphology"]
+            values = {
+                "word": word["original"],
+                "prefix": morphology["prefix"],
+                "root": morphology["root"],
+                "confidence": word["confidence"],
+                "method": morphology["method"],
+                "gloss": json.dumps(morphology["translation"], ensure_ascii=False),
+                "final": word["final_translation"],
+                "reversal": (
+                    json.dumps(word["reversal"], ensure_ascii=False)
+                    if word["reversal"] is not None
+                    else None
+                ),
+            }
+            for field, (vocab_name, _) in TOKEN_FIELDS.items():
+                columns[field].append(intern(vocab_name, values[field]))
+            suffix_ids.extend(intern("suffixes", s) for s in morphology["suffixes"])
+            suffix_offsets.append(len(suffix_ids))
+            sentence.append(sentence_id)
+            position.append(pos)
+        sentence_offsets.append(len(sentence))
+        folio.append(intern("folios", trans["folio"]))
+        recognition_rate.append(trans["statistics"]["recognition_rate"])
+        original_bytes.extend(trans["original"].encode("utf-8"))
+        original_offsets.append(len(original_bytes))
+
+    arrays = {
+        field: np.asarray(columns[field], dtype=dtype)
+        for field, (_, dtype) in TOKEN_FIELDS.items()
+    }
+    arrays.update(
+        sentence=np.asarray(sentence, dtype=np.int32),
+        position=np.asarray(position, dtype=np.int32),
+        suffix_offsets=np.asarray(suffix_offsets, dtype=np.int64),
+        suffix_ids=np.asarray(suffix_ids, dtype=np.int32),
+        sentence_offsets=np.asarray(sentence_offsets, dtype=np.int64),
+        folio=np.asarray(folio, dtype=np.int32),
+        recognition_rate=np.asarray(recognition_rate, dtype=np.float64),
+        original_offsets=np.asarray(original_offsets, dtype=np.int64),
+        original_bytes=np.frombuffer(bytes(original_bytes), dtype=np.uint8),
+    )
+    vocab_lists = {name: list(vocab) for name, vocab in vocabs.items()}
+    statistics = {k: v for k, v in data.get("statistics", {}).items() if k != "recognition_rates"}
+    meta = {"metadata": data.get("metadata", {}), "statistics": statistics}
+    return arrays, vocab_lists, meta
+
+
+def save_columns_cache(cache_file: Path, arrays: Dict, vocabs: Dict, meta: Dict, fingerprint: Dict):
+    """Write columns (uncompressed, so they can be memory-mapped) and vocabularies."""
+    payload = dict(arrays)
+    for name, values in vocabs.items():
+        payload[f"vocab_{name}"] = np.asarray(values, dtype=str)
+    payload["meta"] = np.asarray(json.dumps({**meta, "fingerprint": fingerprint}))
+
+    save_npz_atomic(cache_file, payload)
+
+
+def load_columns_cache(cache_file: Path, mmap: bool = True):
+    """Read a cache written by save_columns_cache(); returns (columns, fingerprint)."""
+    with np.load(cache_file, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        vocabs = {
+            name[len("vocab_") :]: data[name].tolist()
+            for name in data.files
+            if name.startswith("vocab_")
+        }
+        arrays = None if mmap else {name: data[name] for name in NUMERIC_COLUMNS}
+    if arrays is None:
+        arrays = memmap_npz(cache_file, NUMERIC_COLUMNS)
+    fingerprint = meta.pop("fingerprint", {})
+    return TranslationColumns(arrays, vocabs, meta), fingerprint
+
+
+def load_translation(
+    filepath=DEFAULT_TRANSLATION,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+    mmap: bool = True,
+) -> TranslationColumns:
+    """
+    Load a translator output as columns, using the on-disk cache if valid.
+
+    Args:
+        filepath: Translator JSON output (default: PHASE17 translation)
+        cache_dir: Cache directory; None disables caching
+        refresh: Ignore any existing cache and reconvert
+        mmap: Memory-map the numeric columns instead of reading them
+
+    Returns:
+        TranslationColumns
+    """
+    filepath = Path(filepath)
+    if cache_dir is None:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return TranslationColumns(*columns_from_translation(json.load(f)))
+
+    stat = filepath.stat()
+    fingerprint = {
+        "version": CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+    cache_file = Path(cache_dir) / f"{filepath.stem}.npz"
+
+    if cache_file.exists() and not refresh:
+        try:
+            columns, cached = load_columns_cache(cache_file, mmap)
+        except (OSError, ValueError, KeyError):
+            cached = None
+        if cached and cached.get("version") == CACHE_VERSION:
+            if (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+                return columns
+            # Touched but possibly unchanged: compare content
+            sha1 = file_sha1(filepath)
+            if cached.get("sha1") == sha1:
+                with np.load(cache_file, allow_pickle=False) as data:
+                    arrays = {name: data[name] for name in NUMERIC_COLUMNS}
+                save_columns_cache(
+                    cache_file,
+                    arrays,
+                    columns.vocabs,
+                    {"metadata": columns.metadata, "statistics": columns.statistics},
+                    {**fingerprint, "sha1": sha1},
+                )
+                return load_columns_cache(cache_file, mmap)[0]
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        arrays, vocabs, meta = columns_from_translation(json.load(f))
+    fingerprint["sha1"] = file_sha1(filepath)
+    save_columns_cache(cache_file, arrays, vocabs, meta, fingerprint)
+    return load_columns_cache(cache_file, mmap)[0]
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Build or inspect the columnar cache of a translator output"
+    )
+    parser.add_argument("file", nargs="?", default=str(DEFAULT_TRANSLATION))
+    parser.add_argument(
+        "--refresh", action="store_true", help="Reconvert even if cache is valid"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    tr = load_translation(args.file, refresh=args.refresh)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{args.file}")
+    print(f"  Sentences: {tr.sentence_count}")
+    print(f"  Tokens: {len(tr)}")
+    print(f"  Word types: {len(tr.vocab('word'))}")
+    print(f"  Roots: {len(tr.vocab('root'))}")
+    print(f"  Loaded in {elapsed:.1f} ms")
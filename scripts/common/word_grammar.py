@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Table-Driven Word Grammar
+The phase5 prefix/root/suffix grammar as data: an ordered list of steps,
+each a rule (or a first-match choice between rules) that tests the
+remaining word for a prefix, suffix or embedded morpheme, removes it and
+emits labels into output slots. One interpreter runs every grammar
+variant, and parses are cached per word type, so a corpus costs one
+parse per distinct type instead of one per token.
+
+Rules remove the first occurrence of a morpheme anywhere in what is left
+of the word, so a later rule can match across the gap an earlier one
+leaves (chsheeo -> cho once shee is removed); the steps therefore run in
+order on the remainder rather than as a single left-to-right scan.
+
+Grammars:
+    FIXED_GRAMMAR      parse_word_fixed_grammar (generalization_test,
+                       cross_section_validation, test_astronomical)
+    COMPLETE_GRAMMAR   decompose_word_complete
+                       (final_retranslation_complete_grammar)
+
+Usage:
+    FIXED_GRAMMAR.parse("qokedy")      # {"roots": ["oak-GEN"], ...}
+    FIXED_GRAMMAR.parse_types(words)   # {type: components}, one parse each
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+PREFIX = "prefix"
+SUFFIX = "suffix"
+CONTAINS = "contains"
+
+# (slot, label): lists get the label appended, other slots are set to it
+Output = Tuple[str, Union[str, bool]]
+
+
+class Rule(NamedTuple):
+    """One morpheme test: kind, alternative spellings and emitted labels."""
+
+    kind: str
+    patterns: Tuple[str, ...]
+    outputs: Tuple[Output, ...]
+    unless: Optional[str] = None  # skip if this substring is present
+    min_length: int = 0  # skip if the remainder is not longer than this
+
+    def matches(self, remaining: str) -> bool:
+        if self.unless is not None and self.unless in remaining:
+            return False
+        if self.min_length and len(remaining) <= self.min_length:
+            return False
+        if self.kind == PREFIX:
+            return any(remaining.startswith(p) for p in self.patterns)
+        if self.kind == SUFFIX:
+            return any(remaining.endswith(p) for p in self.patterns)
+        return any(p in remaining for p in self.patterns)
+
+    def strip(self, remaining: str) -> str:
+        """Remove the morpheme (every listed spelling once, for CONTAINS)."""
+        if self.kind == PREFIX:
+            pattern = next(p for p in self.patterns if remaining.startswith(p))
+            return remaining[len(pattern) :]
+        if self.kind == SUFFIX:
+            pattern = next(p for p in self.patterns if remaining.endswith(p))
+            return remaining[: -len(pattern)]
+        for pattern in self.patterns:
+            remaining = remaining.replace(pattern, "", 1)
+        return remaining
+
+
+def rule(kind: str, patterns: Union[str, Sequence[str]], *outputs: Output, **options) -> Rule:
+    """Shorthand for Rule(kind, patterns, outputs, ...)."""
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    return Rule(kind, tuple(patterns), tuple(outputs), **options)
+
+
+# A step is a single rule or a tuple of rules of which the first match applies
+Step = Union[Rule, Tuple[Rule, ...]]
+
+
+class WordGrammar:
+    """Ordered morpheme rules over output slots, with a per-type cache."""
+
+    def __init__(
+        self,
+        steps: Sequence[Step],
+        slots: Dict[str, Union[list, bool]],
+        leftover: Tuple[str, str],
+        ignorable: Iterable[str],
+    ):
+        """
+        Args:
+            steps: Rules applied in order to the remaining word
+            slots: Output slots and their empty values (list or bool)
+            leftover: (slot, format) for an unexplained remainder, e.g.
+                ("unknown", "{}")
+            ignorable: Remainders that are not reported as leftover
+        """
+        self.steps = [(step,) if isinstance(step, Rule) else step for step in steps]
+        self.slots = slots
+        self.leftover_slot, self.leftover_format = leftover
+        self.ignorable = frozenset(ignorable)
+        self.cache: Dict[str, Dict] = {}
+
+    def __len__(self) -> int:
+        """Number of cached types."""
+        return len(self.cache)
+
+    def _parse(self, word: str) -> Dict:
+        components = {
+            slot: list(empty) if isinstance(empty, list) else empty
+            for slot, empty in self.slots.items()
+        }
+        remaining = word
+        for alternatives in self.steps:
+            for alternative in alternatives:
+                if alternative.matches(remaining):
+                    for slot, label in alternative.outputs:
+                        if isinstance(components[slot], list):
+                            components[slot].append(label)
+                        else:
+                            components[slot] = label
+                    remaining = alternative.strip(remaining)
+                    break
+        if remaining and remaining not in self.ignorable:
+            components[self.leftover_slot].append(self.leftover_format.format(remaining))
+        return components
+
+    def parse(self, word: str) -> Dict:
+        """Components of word (a fresh copy of the cached parse)."""
+        parsed = self.cache.get(word)
+        if parsed is None:
+            parsed = self.cache[word] = self._parse(word)
+        return {
+            slot: list(value) if isinstance(value, list) else value
+            for slot, value in parsed.items()
+        }
+
+    def parse_types(self, words: Iterable[str]) -> Dict[str, Dict]:
+        """Parse every distinct word once; {word: components} in first-seen order."""
+        return {word: self.parse(word) for word in dict.fromkeys(words)}
+
+
+# ============================================================================
+# PHASE 5 GRAMMARS
+# ============================================================================
+
+
+def _embedded_roots(slot: str) -> List[Step]:
+    """Semantic roots found anywhere in the remainder (shared by both variants)."""
+    return [
+        (rule(CONTAINS, "shee", (slot, "water")), rule(CONTAINS, "she", (slot, "water"))),
+        rule(CONTAINS, "cho", (slot, "vessel"), unless="cheo"),
+        rule(CONTAINS, "cheo", (slot, "CHEO")),
+        rule(CONTAINS, "dor", (slot, "red")),
+    ]
+
+
+_FUNCTION_WORDS = [
+    rule(CONTAINS, "qol", ("function_words", "THEN")),
+    rule(CONTAINS, "sal", ("function_words", "AND")),
+    rule(CONTAINS, ("dain", "dai!n"), ("function_words", "THAT")),
+]
+
+
+def _definiteness(slot: str) -> Tuple[Rule, ...]:
+    return tuple(rule(CONTAINS, p, (slot, "DEF")) for p in ("aiin", "iin", "ain"))
+
+
+def _case_markers(slot: str, instrumental: str) -> List[Rule]:
+    return [
+        rule(CONTAINS, "al", (slot, "LOC")),
+        rule(CONTAINS, "ar", (slot, "DIR")),
+        rule(CONTAINS, "or", (slot, instrumental)),
+        rule(CONTAINS, "ol", (slot, "LOC2")),
+    ]
+
+
+FIXED_GRAMMAR = WordGrammar(
+    steps=[
+        (
+            rule(PREFIX, "qok", ("roots", "oak-GEN")),
+            rule(PREFIX, "qot", ("roots", "oat-GEN")),
+            rule(PREFIX, "ok", ("roots", "oak")),
+            rule(PREFIX, "ot", ("roots", "oat")),
+        ),
+        *_embedded_roots("roots"),
+        *_FUNCTION_WORDS,
+        rule(SUFFIX, "ory", ("suffixes", "ADV")),
+        (
+            rule(CONTAINS, "edy", ("suffixes", "VERB")),
+            rule(SUFFIX, "dy", ("suffixes", "VERB")),
+        ),
+        _definiteness("suffixes"),
+        *_case_markers("suffixes", "INST"),
+    ],
+    slots={"roots": [], "function_words": [], "suffixes": [], "unknown": []},
+    leftover=("unknown", "{}"),
+    ignorable=["", "k", "ch", "p", "s", "l", "d", "y", "e", "!", "t", "c", "h"],
+)
+
+COMPLETE_GRAMMAR = WordGrammar(
+    steps=[
+        (
+            rule(PREFIX, "qok", ("root", "oak"), ("cases", "GEN")),
+            rule(PREFIX, "qot", ("root", "oat"), ("cases", "GEN")),
+            rule(PREFIX, "ok", ("root", "oak")),
+            rule(PREFIX, "ot", ("root", "oat")),
+        ),
+        *_embedded_roots("root"),
+        *_FUNCTION_WORDS,
+        (
+            rule(CONTAINS, "edy", ("verbal", True)),
+            rule(SUFFIX, "dy", ("verbal", True)),
+            rule(CONTAINS, "dy", ("verbal", True), min_length=3),
+        ),
+        rule(SUFFIX, "ory", ("function_words", "ADV")),
+        _definiteness("definiteness"),
+        *_case_markers("cases", "INST/ABL"),
+    ],
+    slots={
+        "root": [],
+        "verbal": False,
+        "cases": [],
+        "definiteness": [],
+        "function_words": [],
+    },
+    leftover=("root", "[{}]"),
+    ignorable=["", "k", "ch", "p", "s", "l", "d", "y", "e", "!", "ey"],
+)
@@ -5,8 +5,15 @@ Apply 10-point framework to 12 new candidates
 """
 
 import re
-from collections import Counter, defaultdict
-from scipy import stats
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.candidate_validation import CandidateAggregates
+from common.enrichment import chi_square_2x2
 
 
 def load_voynich_text(filepath):
@@ -82,16 +89,26 @@ def get_validated_elements():
     }
 
 
+def validate_candidates(candidates, words_list, validated_elements):
+    """
+    Apply 10-point validation framework to a whole candidate list
+    Corpus aggregates are computed once and shared by every candidate
+    """
+    aggregates = CandidateAggregates(words_list, validated_elements, candidates)
+    return [score_candidate(candidate, aggregates) for candidate in candidates]
+
+
 def validate_candidate(candidate_word, words_list, validated_elements):
-    """Apply 10-point validation framework to a candidate"""
+    """Apply 10-point validation framework to a single candidate"""
+    return validate_candidates([candidate_word], words_list, validated_elements)[0]
+
 
-    word_strings = [w["word"] for w in words_list]
+def score_candidate(candidate_word, aggregates):
+    """Score one candidate from precomputed corpus aggregates"""
 
     # Count exact and compound occurrences
-    exact_count = sum(1 for w in word_strings if w == candidate_word)
-    compound_count = sum(
-        1 for w in word_strings if candidate_word in w and w != candidate_word
-    )
+    exact_count = aggregates.exact[candidate_word]
+    compound_count = aggregates.compound[candidate_word]
     total_count = exact_count + compound_count
 
     if total_count == 0:
@@ -130,28 +147,7 @@ def validate_candidate(candidate_word, words_list, validated_elements):
         standalone_score = 0
 
     # Criterion 3: Positional Distribution (0-2 points)
-    # Reconstruct sentences
-    sentences = []
-    current_sentence = []
-    for i, entry in enumerate(words_list):
-        current_sentence.append(entry["word"])
-        if len(current_sentence) >= 8 or (
-            i > 0 and entry["section"] != words_list[i - 1]["section"]
-        ):
-            if len(current_sentence) >= 3:
-                sentences.append(current_sentence)
-            current_sentence = []
-
-    position_counts = {"initial": 0, "medial": 0, "final": 0}
-    for sentence in sentences:
-        for i, word in enumerate(sentence):
-            if word == candidate_word:
-                if i == 0:
-                    position_counts["initial"] += 1
-                elif i == len(sentence) - 1:
-                    position_counts["final"] += 1
-                else:
-                    position_counts["medial"] += 1
+    position_counts = aggregates.position_counts(candidate_word)
 
     total_pos = sum(position_counts.values())
     if total_pos > 0:
@@ -179,16 +175,13 @@ def validate_candidate(candidate_word, words_list, validated_elements):
         dominant_position = "unknown"
 
     # Criterion 4: Section Distribution (0-2 points)
-    section_counts = defaultdict(int)
-    for entry in words_list:
-        if entry["word"] == candidate_word and entry["section"]:
-            section_counts[entry["section"]] += 1
+    section_counts = aggregates.section_counts.get(candidate_word, Counter())
 
     sections_present = len([s for s in section_counts if section_counts[s] > 0])
 
     # Calculate enrichment
-    section_totals = Counter([w["section"] for w in words_list if w["section"]])
-    total_words = sum(section_totals.values())
+    section_totals = aggregates.section_totals
+    total_words = aggregates.total_words
 
     max_enrichment = 0
     enriched_section = None
@@ -209,13 +202,7 @@ def validate_candidate(candidate_word, words_list, validated_elements):
         section_score = 0
 
     # Criterion 5: Co-occurrence (0-2 points)
-    cooccur_count = 0
-    for i in range(1, len(words_list) - 1):
-        if words_list[i]["word"] == candidate_word:
-            prev_word = words_list[i - 1]["word"]
-            next_word = words_list[i + 1]["word"]
-            if prev_word in validated_elements or next_word in validated_elements:
-                cooccur_count += 1
+    cooccur_count = aggregates.cooccur[candidate_word]
 
     cooccur_rate = (cooccur_count / exact_count) * 100 if exact_count > 0 else 0
 
@@ -257,27 +244,18 @@ def validate_candidate(candidate_word, words_list, validated_elements):
     }
 
 
-def chi_square_test(candidate_word, words_list, enriched_section):
+def chi_square_test(candidate_word, aggregates, enriched_section):
     """Test statistical significance of section enrichment"""
     if not enriched_section:
         return None, None
 
     # Count word occurrences by section
-    word_in_section = 0
-    word_in_other = 0
-    total_in_section = 0
-    total_in_other = 0
-
-    for entry in words_list:
-        if entry["section"]:
-            if entry["section"] == enriched_section:
-                total_in_section += 1
-                if entry["word"] == candidate_word:
-                    word_in_section += 1
-            else:
-                total_in_other += 1
-                if entry["word"] == candidate_word:
-                    word_in_other += 1
+    (
+        word_in_section,
+        word_in_other,
+        total_in_section,
+        total_in_other,
+    ) = aggregates.section_split(candidate_word, enriched_section)
 
     # 2x2 contingency table
     observed = [
@@ -285,11 +263,10 @@ def chi_square_test(candidate_word, words_list, enriched_section):
         [total_in_section - word_in_section, total_in_other - word_in_other],
     ]
 
-    try:
-        chi2, p_value, dof, expected = stats.chi2_contingency(observed)
-        return chi2, p_value
-    except:
+    chi2, p_value = chi_square_2x2(*observed[0], *observed[1])
+    if np.isnan(chi2):
         return None, None
+    return float(chi2), float(p_value)
 
 
 def main():
@@ -329,16 +306,19 @@ def main():
     print("VALIDATION RESULTS")
     print("=" * 80)
 
+    # One corpus pass shared by all candidates
+    aggregates = CandidateAggregates(words, validated, candidates)
+
     results = []
     for candidate in candidates:
-        result = validate_candidate(candidate, words, validated)
+        result = score_candidate(candidate, aggregates)
         if result:
             results.append(result)
 
             # Chi-square test if section enriched
             if result["enriched_section"] and result["n"] >= 10:
                 chi2, p_value = chi_square_test(
-                    candidate, words, result["enriched_section"]
+                    candidate, aggregates, result["enriched_section"]
                 )
                 result["chi2"] = chi2
                 result["p_value"] = p_value
@@ -5,8 +5,15 @@ Apply 10-point framework with adjusted thresholds for low-frequency elements
 """
 
 import re
-from collections import Counter, defaultdict
-from scipy import stats
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.candidate_validation import CandidateAggregates
+from common.enrichment import chi_square_2x2
 
 
 def load_voynich_text(filepath):
@@ -89,21 +96,38 @@ def get_validated_elements():
     }
 
 
+def validate_candidates(
+    candidates, words_list, validated_elements, adjusted_threshold=False
+):
+    """
+    Apply 10-point validation framework to a whole candidate list
+    Corpus aggregates are computed once and shared by every candidate
+    """
+    aggregates = CandidateAggregates(words_list, validated_elements, candidates)
+    return [
+        score_candidate(candidate, aggregates, adjusted_threshold)
+        for candidate in candidates
+    ]
+
+
 def validate_candidate(
     candidate_word, words_list, validated_elements, adjusted_threshold=False
 ):
+    """Apply 10-point validation framework to a single candidate"""
+    return validate_candidates(
+        [candidate_word], words_list, validated_elements, adjusted_threshold
+    )[0]
+
+
+def score_candidate(candidate_word, aggregates, adjusted_threshold=False):
     """
-    Apply 10-point validation framework
+    Score one candidate from precomputed corpus aggregates
     adjusted_threshold: Use relaxed thresholds for low-frequency elements (n<25)
     """
 
-    word_strings = [w["word"] for w in words_list]
-
     # Count exact and compound occurrences
-    exact_count = sum(1 for w in word_strings if w == candidate_word)
-    compound_count = sum(
-        1 for w in word_strings if candidate_word in w and w != candidate_word
-    )
+    exact_count = aggregates.exact[candidate_word]
+    compound_count = aggregates.compound[candidate_word]
     total_count = exact_count + compound_count
 
     if total_count == 0:
@@ -142,27 +166,7 @@ def validate_candidate(
         standalone_score = 0
 
     # Criterion 3: Positional Distribution (0-2 points)
-    sentences = []
-    current_sentence = []
-    for i, entry in enumerate(words_list):
-        current_sentence.append(entry["word"])
-        if len(current_sentence) >= 8 or (
-            i > 0 and entry["section"] != words_list[i - 1]["section"]
-        ):
-            if len(current_sentence) >= 3:
-                sentences.append(current_sentence)
-            current_sentence = []
-
-    position_counts = {"initial": 0, "medial": 0, "final": 0}
-    for sentence in sentences:
-        for i, word in enumerate(sentence):
-            if word == candidate_word:
-                if i == 0:
-                    position_counts["initial"] += 1
-                elif i == len(sentence) - 1:
-                    position_counts["final"] += 1
-                else:
-                    position_counts["medial"] += 1
+    position_counts = aggregates.position_counts(candidate_word)
 
     total_pos = sum(position_counts.values())
     if total_pos > 0:
@@ -193,16 +197,13 @@ def validate_candidate(
         dominant_position = "unknown"
 
     # Criterion 4: Section Distribution (0-2 points)
-    section_counts = defaultdict(int)
-    for entry in words_list:
-        if entry["word"] == candidate_word and entry["section"]:
-            section_counts[entry["section"]] += 1
+    section_counts = aggregates.section_counts.get(candidate_word, Counter())
 
     sections_present = len([s for s in section_counts if section_counts[s] > 0])
 
     # Calculate enrichment
-    section_totals = Counter([w["section"] for w in words_list if w["section"]])
-    total_words = sum(section_totals.values())
+    section_totals = aggregates.section_totals
+    total_words = aggregates.total_words
 
     max_enrichment = 0
     enriched_section = None
@@ -228,13 +229,7 @@ def validate_candidate(
         section_score = 0
 
     # Criterion 5: Co-occurrence (0-2 points)
-    cooccur_count = 0
-    for i in range(1, len(words_list) - 1):
-        if words_list[i]["word"] == candidate_word:
-            prev_word = words_list[i - 1]["word"]
-            next_word = words_list[i + 1]["word"]
-            if prev_word in validated_elements or next_word in validated_elements:
-                cooccur_count += 1
+    cooccur_count = aggregates.cooccur[candidate_word]
 
     cooccur_rate = (cooccur_count / exact_count) * 100 if exact_count > 0 else 0
 
@@ -277,37 +272,28 @@ def validate_candidate(
     }
 
 
-def chi_square_test(candidate_word, words_list, enriched_section):
+def chi_square_test(candidate_word, aggregates, enriched_section):
     """Test statistical significance of section enrichment"""
     if not enriched_section:
         return None, None
 
-    word_in_section = 0
-    word_in_other = 0
-    total_in_section = 0
-    total_in_other = 0
-
-    for entry in words_list:
-        if entry["section"]:
-            if entry["section"] == enriched_section:
-                total_in_section += 1
-                if entry["word"] == candidate_word:
-                    word_in_section += 1
-            else:
-                total_in_other += 1
-                if entry["word"] == candidate_word:
-                    word_in_other += 1
+    # Count word occurrences by section
+    (
+        word_in_section,
+        word_in_other,
+        total_in_section,
+        total_in_other,
+    ) = aggregates.section_split(candidate_word, enriched_section)
 
     observed = [
         [word_in_section, word_in_other],
         [total_in_section - word_in_section, total_in_other - word_in_other],
     ]
 
-    try:
-        chi2, p_value, dof, expected = stats.chi2_contingency(observed)
-        return chi2, p_value
-    except:
+    chi2, p_value = chi_square_2x2(*observed[0], *observed[1])
+    if np.isnan(chi2):
         return None, None
+    return float(chi2), float(p_value)
 
 
 def main():
@@ -340,18 +326,19 @@ def main():
     print("VALIDATION RESULTS (with adjusted thresholds for n<25)")
     print("=" * 80)
 
+    # One corpus pass shared by all candidates
+    aggregates = CandidateAggregates(words, validated, candidates)
+
     results = []
     for candidate in candidates:
-        result = validate_candidate(
-            candidate, words, validated, adjusted_threshold=True
-        )
+        result = score_candidate(candidate, aggregates, adjusted_threshold=True)
         if result:
             results.append(result)
 
             # Chi-square test if section enriched
             if result["enriched_section"] and result["n"] >= 8:
                 chi2, p_value = chi_square_test(
-                    candidate, words, result["enriched_section"]
+                    candidate, aggregates, result["enriched_section"]
                 )
                 result["chi2"] = chi2
                 result["p_value"] = p_value
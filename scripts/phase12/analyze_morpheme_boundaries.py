@@ -5,7 +5,12 @@ Analyze prefix/suffix productivity and identify compound structures
 """
 
 import re
+import sys
 from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.substring_index import SubstringIndex
 
 
 def load_voynich_text(filepath):
@@ -60,22 +65,16 @@ def get_validated_affixes():
     }
 
 
-def analyze_prefix_productivity(words_list, prefix, min_stem_length=2):
-    """Analyze how productively a prefix combines with different stems"""
-    word_strings = [w["word"] for w in words_list]
-
-    # Find words starting with this prefix
-    prefix_words = [
-        w
-        for w in word_strings
-        if w.startswith(prefix) and len(w) > len(prefix) + min_stem_length
-    ]
-
-    # Extract stems
-    stems = Counter([w[len(prefix) :] for w in prefix_words])
+def analyze_prefix_productivity(index, prefix, min_stem_length=2):
+    """
+    Analyze how productively a prefix combines with different stems
+    index: SubstringIndex over the corpus words
+    """
+    # Stems of words starting with this prefix
+    stems = index.stems_after_prefix(prefix, min_length=min_stem_length + 1)
 
     # Count total occurrences
-    total_prefix_uses = len(prefix_words)
+    total_prefix_uses = sum(stems.values())
     unique_stems = len(stems)
 
     # Calculate productivity ratio
@@ -94,21 +93,15 @@ def analyze_prefix_productivity(words_list, prefix, min_stem_length=2):
     }
 
 
-def analyze_suffix_productivity(words_list, suffix, min_root_length=2):
-    """Analyze how productively a suffix combines with different roots"""
-    word_strings = [w["word"] for w in words_list]
+def analyze_suffix_productivity(index, suffix, min_root_length=2):
+    """
+    Analyze how productively a suffix combines with different roots
+    index: SubstringIndex over the corpus words
+    """
+    # Roots of words ending with this suffix
+    roots = index.roots_before_suffix(suffix, min_length=min_root_length + 1)
 
-    # Find words ending with this suffix
-    suffix_words = [
-        w
-        for w in word_strings
-        if w.endswith(suffix) and len(w) > len(suffix) + min_root_length
-    ]
-
-    # Extract roots
-    roots = Counter([w[: -len(suffix)] for w in suffix_words])
-
-    total_suffix_uses = len(suffix_words)
+    total_suffix_uses = sum(roots.values())
     unique_roots = len(roots)
 
     productivity = unique_roots / total_suffix_uses if total_suffix_uses > 0 else 0
@@ -178,23 +171,22 @@ def analyze_near_validated_compounds():
     ]
 
 
-def test_compound_hypothesis(words_list, word, prefix, root):
-    """Test whether a compound hypothesis is supported by data"""
-    word_strings = [w["word"] for w in words_list]
-
+def test_compound_hypothesis(index, word, prefix, root):
+    """
+    Test whether a compound hypothesis is supported by data
+    index: SubstringIndex over the corpus words
+    """
     # Count occurrences
-    word_count = word_strings.count(word)
+    word_count = index.count(word)
 
     # Count prefix usage
-    prefix_words = [
-        w for w in word_strings if w.startswith(prefix) and len(w) > len(prefix) + 1
-    ]
-    prefix_count = len(prefix_words)
-    prefix_unique = len(set(prefix_words))
+    prefix_stems = index.stems_after_prefix(prefix, min_length=2)
+    prefix_count = sum(prefix_stems.values())
+    prefix_unique = len(prefix_stems)
 
     # Count root as standalone or in compounds
-    root_exact = word_strings.count(root)
-    root_compound = sum(1 for w in word_strings if root in w and w != root)
+    root_exact = index.count(root)
+    root_compound = index.contains_count(root) - root_exact
 
     return {
         "word": word,
@@ -222,6 +214,9 @@ def main():
     words = load_voynich_text(eva_file)
     print(f"\nLoaded {len(words)} words from EVA transcription\n")
 
+    # Prefix/suffix/containment queries all go through one index
+    index = SubstringIndex(w["word"] for w in words)
+
     validated_affixes = get_validated_affixes()
 
     print("=" * 80)
@@ -231,7 +226,7 @@ def main():
     print("\nAnalyzing validated prefixes:\n")
 
     for prefix_name, prefix_data in validated_affixes["prefixes"].items():
-        result = analyze_prefix_productivity(words, prefix_name)
+        result = analyze_prefix_productivity(index, prefix_name)
         print(f"{prefix_name.upper()} ({prefix_data['type']}):")
         print(f"  Total uses: {result['total_uses']}")
         print(f"  Unique stems: {result['unique_stems']}")
@@ -248,7 +243,7 @@ def main():
     print("\nAnalyzing validated suffixes:\n")
 
     for suffix_name, suffix_data in validated_affixes["suffixes"].items():
-        result = analyze_suffix_productivity(words, suffix_name)
+        result = analyze_suffix_productivity(index, suffix_name)
         print(f"{suffix_name.upper()} ({suffix_data['type']}):")
         print(f"  Total uses: {result['total_uses']}")
         print(f"  Unique roots: {result['unique_roots']}")
@@ -272,7 +267,7 @@ def main():
     print("-" * 55)
 
     for prefix in candidate_prefixes:
-        result = analyze_prefix_productivity(words, prefix)
+        result = analyze_prefix_productivity(index, prefix)
         if result["total_uses"] >= 50:
             print(
                 f"{prefix:<10} {result['total_uses']:<12} {result['unique_stems']:<15} {result['productivity']:<12.3f}"
@@ -288,7 +283,7 @@ def main():
 
     for compound in near_validated_compounds:
         result = test_compound_hypothesis(
-            words, compound["word"], compound["prefix"], compound["root"]
+            index, compound["word"], compound["prefix"], compound["root"]
         )
         print(f"{result['word'].upper()} -> {result['hypothesis']}")
         print(f"  Word frequency: {result['word_count']}")
@@ -5,8 +5,14 @@ Test whether ol- and ot- show phonologically conditioned distribution
 """
 
 import re
+import sys
 from collections import Counter, defaultdict
-from scipy import stats
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.enrichment import chi_square_2x2, expected_2x2
 
 
 def load_voynich_text(filepath):
@@ -81,11 +87,12 @@ def chi_square_test(ol_counts, ot_counts):
     # ol-       ol_C        ol_V
     # ot-       ot_C        ot_V
 
-    observed = [[ol_counts["C"], ol_counts["V"]], [ot_counts["C"], ot_counts["V"]]]
+    observed = [ol_counts["C"], ol_counts["V"], ot_counts["C"], ot_counts["V"]]
 
-    chi2, p_value, dof, expected = stats.chi2_contingency(observed)
+    chi2, p_value = chi_square_2x2(*observed)
+    expected = np.array(expected_2x2(*observed)).reshape(2, 2)
 
-    return chi2, p_value, expected
+    return float(chi2), float(p_value), expected
 
 
 def analyze_top_stems(words, prefix, n=20):
@@ -16,7 +16,12 @@ Strategy:
 """
 
 import re
+import sys
 from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.substring_index import SubstringIndex
 
 
 def load_eva_transcription(filepath):
@@ -62,17 +67,13 @@ def is_vowel_initial(word):
     return word[0] in vowels if word else False
 
 
-def calculate_morphological_productivity(target_word, all_words):
-    """Calculate percentage of target appearances in compound forms."""
-    total_count = 0
-    compound_count = 0
-
-    for word in all_words:
-        if word == target_word:
-            total_count += 1
-        elif target_word in word and len(word) > len(target_word):
-            total_count += 1
-            compound_count += 1
+def calculate_morphological_productivity(target_word, index):
+    """
+    Calculate percentage of target appearances in compound forms.
+    index: SubstringIndex over the corpus words
+    """
+    total_count = index.contains_count(target_word)
+    compound_count = total_count - index.count(target_word)
 
     if total_count == 0:
         return 0.0, 0, 0
@@ -81,15 +82,9 @@ def calculate_morphological_productivity(target_word, all_words):
     return productivity, total_count, compound_count
 
 
-def get_ot_cooccurrence(stem, all_words):
+def get_ot_cooccurrence(stem, index):
     """Count how often stem appears with ot- prefix."""
-    ot_stem_pattern = f"ot{stem}"
-    count = sum(
-        1
-        for word in all_words
-        if word == ot_stem_pattern or word.startswith(ot_stem_pattern)
-    )
-    return count
+    return index.prefix_count(f"ot{stem}")
 
 
 def analyze_vowel_initial_candidates(words_with_context):
@@ -97,6 +92,12 @@ def analyze_vowel_initial_candidates(words_with_context):
 
     # Extract word strings
     word_strings = [w["word"] for w in words_with_context]
+    index = SubstringIndex(word_strings)
+
+    # Sections of every occurrence, per word (one pass)
+    sections_by_word = defaultdict(list)
+    for w in words_with_context:
+        sections_by_word[w["word"]].append(w["section"])
 
     # Already validated elements to exclude
     validated = {
@@ -128,7 +129,7 @@ def analyze_vowel_initial_candidates(words_with_context):
 
         # Calculate productivity
         productivity, total_count, compound_count = (
-            calculate_morphological_productivity(word, word_strings)
+            calculate_morphological_productivity(word, index)
         )
 
         standalone_count = exact_count
@@ -137,11 +138,10 @@ def analyze_vowel_initial_candidates(words_with_context):
         )
 
         # Get ot- co-occurrence
-        ot_count = get_ot_cooccurrence(word, word_strings)
+        ot_count = get_ot_cooccurrence(word, index)
 
         # Calculate section distribution
-        word_sections = [w["section"] for w in words_with_context if w["word"] == word]
-        section_counts = Counter(word_sections)
+        section_counts = Counter(sections_by_word[word])
         num_sections = len(section_counts)
 
         candidates.append(
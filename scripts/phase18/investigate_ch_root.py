@@ -11,15 +11,18 @@ Note: This is STRUCTURAL ANALYSIS, not semantic interpretation.
 
 import json
 import re
-from collections import Counter, defaultdict
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.corpus_query import CorpusIndex
+from common.translation_columns import load_translation
 
 
 def load_translation_data():
-    """Load Phase 17 translation data."""
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        return json.load(f)
+    """Load Phase 17 translation data as a queryable token index."""
+    return CorpusIndex(load_translation())
 
 
 def load_sentences():
@@ -50,97 +53,36 @@ def load_sentences():
     return sentences
 
 
-def find_ch_instances(translations):
-    """Find all instances where [?ch] appears in translations."""
-    ch_instances = []
-
-    for trans in translations:
-        text = trans["final_translation"]
-        original = trans["original"]
-        folio = trans["folio"]
+def find_ch_instances(index):
+    """Find all tokens whose translation contains [?ch]."""
+    return index.query(final=lambda final: "[?ch]" in final)
 
-        # Look for [?ch] in translation
-        if "[?ch]" in text:
-            ch_instances.append(
-                {
-                    "folio": folio,
-                    "original": original,
-                    "translation": text,
-                    "words": trans["words"],
-                }
-            )
 
-    return ch_instances
-
-
-def analyze_morphological_patterns(ch_instances):
+def analyze_morphological_patterns(index, ch_instances):
     """Analyze how 'ch' combines with affixes."""
 
-    prefix_combinations = Counter()
-    suffix_combinations = Counter()
-    standalone_count = 0
-
-    # Collect all word forms containing 'ch'
-    word_forms = Counter()
-
-    for instance in ch_instances:
-        for word in instance["words"]:
-            # Check if this word contains [?ch] in its translation
-            if word["morphology"]["root"] == "ch":
-                orig = word["original"]
-                word_forms[orig] += 1
-
-                # Check for prefix
-                prefix = word["morphology"]["prefix"]
-                if prefix:
-                    prefix_combinations[prefix] += 1
-
-                # Check for suffixes
-                suffixes = word["morphology"]["suffixes"]
-                if suffixes:
-                    suffix_str = "-".join(suffixes)
-                    suffix_combinations[suffix_str] += 1
-                else:
-                    standalone_count += 1
+    # Words with root 'ch' in the sentences containing [?ch]
+    roots = index.query(root="ch").same_sentence(ch_instances)
+    standalone = roots.where(suffix=None)
 
     return {
-        "prefix_combinations": prefix_combinations,
-        "suffix_combinations": suffix_combinations,
-        "standalone_count": standalone_count,
-        "word_forms": word_forms,
+        "prefix_combinations": roots.where(prefix=bool).count_by("prefix"),
+        "suffix_combinations": (roots - standalone).count_by("suffixes"),
+        "standalone_count": len(standalone),
+        "word_forms": roots.count_by("word"),
     }
 
 
 def analyze_cooccurrence(ch_instances):
     """Analyze what words co-occur with 'ch' in sentences."""
 
-    # Words that appear in same sentence as 'ch'
-    cooccurrence = Counter()
-
-    # Position patterns: what comes before/after 'ch'
-    before_ch = Counter()
-    after_ch = Counter()
-
-    for instance in ch_instances:
-        words = instance["translation"].split()
-
-        # Find position of [?ch] words
-        for i, word in enumerate(words):
-            if "[?ch]" in word:
-                # What comes before?
-                if i > 0:
-                    before_ch[words[i - 1]] += 1
-
-                # What comes after?
-                if i < len(words) - 1:
-                    after_ch[words[i + 1]] += 1
-
-        # Count all words in sentences with 'ch'
-        for word in words:
-            if "[?ch]" not in word:
-                cooccurrence[word] += 1
-
-    return {"cooccurrence": cooccurrence, "before_ch": before_ch, "after_ch": after_ch}
+    return {
+        # Words that appear in same sentence as 'ch'
+        "cooccurrence": (ch_instances.sentences() - ch_instances).count_by("final"),
+        # Position patterns: what comes before/after 'ch'
+        "before_ch": ch_instances.neighbours(-1).count_by("final"),
+        "after_ch": ch_instances.neighbours(1).count_by("final"),
+    }
 
 
 def check_validated_vocabulary_cooccurrence(ch_instances):
@@ -176,14 +118,11 @@ def check_validated_vocabulary_cooccurrence(ch_instances):
 
     cooccurrence = defaultdict(int)
 
-    for instance in ch_instances:
-        words = instance["translation"].split()
-
-        # Check for validated vocabulary in same sentence
-        for word in words:
-            for val in validated:
-                if val in word:
-                    cooccurrence[val] += 1
+    # Check for validated vocabulary in same sentence, once per word type
+    for word, count in ch_instances.sentences().count_by("final").items():
+        for val in validated:
+            if val in word:
+                cooccurrence[val] += count
 
     return dict(cooccurrence)
 
@@ -199,18 +138,19 @@ def main():
 
     # Load data
     print("Loading translation data...")
-    translation_data = load_translation_data()
+    index = load_translation_data()
 
     print("Loading EVA sentences...")
     sentences = load_sentences()
 
-    print(f"Loaded {len(translation_data['translations'])} translations")
+    print(f"Loaded {index.columns.sentence_count} translations")
     print(f"Loaded {len(sentences)} sentences\n")
 
     # Find [?ch] instances
     print("Finding [?ch] instances in translations...")
-    ch_instances = find_ch_instances(translation_data["translations"])
-    print(f"Found {len(ch_instances)} sentences containing [?ch]\n")
+    ch_instances = find_ch_instances(index)
+    ch_sentences = len(ch_instances.sentence_ids())
+    print(f"Found {ch_sentences} sentences containing [?ch]\n")
 
     # Morphological patterns
     print("=" * 80)
@@ -218,7 +158,7 @@ def main():
     print("=" * 80)
     print("Analyzing how 'ch' combines with affixes...\n")
 
-    morph_patterns = analyze_morphological_patterns(ch_instances)
+    morph_patterns = analyze_morphological_patterns(index, ch_instances)
 
     print("PREFIX COMBINATIONS:")
     if morph_patterns["prefix_combinations"]:
@@ -282,7 +222,7 @@ def main():
     total_prefix_combos = len(morph_patterns["prefix_combinations"])
 
     print(f"\n[?ch] ROOT STATISTICS:")
-    print(f"  Total sentences with [?ch]: {len(ch_instances)}")
+    print(f"  Total sentences with [?ch]: {ch_sentences}")
     print(f"  Standalone instances: {morph_patterns['standalone_count']}")
     print(f"  With suffix: {total_suffix_combos} instances")
     print(f"  With prefix: {total_prefix_combos} different prefixes")
@@ -351,7 +291,7 @@ def main():
 
     # Save results
     results = {
-        "total_instances": len(ch_instances),
+        "total_instances": ch_sentences,
         "morphological_patterns": {
             "prefix_combinations": dict(
                 morph_patterns["prefix_combinations"].most_common(20)
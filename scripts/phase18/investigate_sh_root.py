@@ -11,15 +11,18 @@ Note: This is STRUCTURAL ANALYSIS, not semantic interpretation.
 
 import json
 import re
-from collections import Counter, defaultdict
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.corpus_query import CorpusIndex
+from common.translation_columns import load_translation
 
 
 def load_translation_data():
-    """Load Phase 17 translation data."""
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        return json.load(f)
+    """Load Phase 17 translation data as a queryable token index."""
+    return CorpusIndex(load_translation(), section_of=folio_section)
 
 
 def load_sentences():
@@ -50,97 +53,36 @@ def load_sentences():
     return sentences
 
 
-def find_sh_instances(translations):
-    """Find all instances where [?sh] appears in translations."""
-    sh_instances = []
-
-    for trans in translations:
-        text = trans["final_translation"]
-        original = trans["original"]
-        folio = trans["folio"]
-
-        # Look for [?sh] in translation
-        if "[?sh]" in text:
-            sh_instances.append(
-                {
-                    "folio": folio,
-                    "original": original,
-                    "translation": text,
-                    "words": trans["words"],
-                }
-            )
-
-    return sh_instances
+def find_sh_instances(index):
+    """Find all tokens whose translation contains [?sh]."""
+    return index.query(final=lambda final: "[?sh]" in final)
 
 
-def analyze_morphological_patterns(sh_instances):
+def analyze_morphological_patterns(index, sh_instances):
     """Analyze how 'sh' combines with affixes."""
 
-    prefix_combinations = Counter()
-    suffix_combinations = Counter()
-    standalone_count = 0
-
-    # Collect all word forms containing 'sh'
-    word_forms = Counter()
-
-    for instance in sh_instances:
-        for word in instance["words"]:
-            # Check if this word contains [?sh] in its translation
-            if word["morphology"]["root"] == "sh":
-                orig = word["original"]
-                word_forms[orig] += 1
-
-                # Check for prefix
-                prefix = word["morphology"]["prefix"]
-                if prefix:
-                    prefix_combinations[prefix] += 1
-
-                # Check for suffixes
-                suffixes = word["morphology"]["suffixes"]
-                if suffixes:
-                    suffix_str = "-".join(suffixes)
-                    suffix_combinations[suffix_str] += 1
-                else:
-                    standalone_count += 1
+    # Words with root 'sh' in the sentences containing [?sh]
+    roots = index.query(root="sh").same_sentence(sh_instances)
+    standalone = roots.where(suffix=None)
 
     return {
-        "prefix_combinations": prefix_combinations,
-        "suffix_combinations": suffix_combinations,
-        "standalone_count": standalone_count,
-        "word_forms": word_forms,
+        "prefix_combinations": roots.where(prefix=bool).count_by("prefix"),
+        "suffix_combinations": (roots - standalone).count_by("suffixes"),
+        "standalone_count": len(standalone),
+        "word_forms": roots.count_by("word"),
     }
 
 
 def analyze_cooccurrence(sh_instances):
     """Analyze what words co-occur with 'sh' in sentences."""
 
-    # Words that appear in same sentence as 'sh'
-    cooccurrence = Counter()
-
-    # Position patterns: what comes before/after 'sh'
-    before_sh = Counter()
-    after_sh = Counter()
-
-    for instance in sh_instances:
-        words = instance["translation"].split()
-
-        # Find position of [?sh] words
-        for i, word in enumerate(words):
-            if "[?sh]" in word:
-                # What comes before?
-                if i > 0:
-                    before_sh[words[i - 1]] += 1
-
-                # What comes after?
-                if i < len(words) - 1:
-                    after_sh[words[i + 1]] += 1
-
-        # Count all words in sentences with 'sh'
-        for word in words:
-            if "[?sh]" not in word:
-                cooccurrence[word] += 1
-
-    return {"cooccurrence": cooccurrence, "before_sh": before_sh, "after_sh": after_sh}
+    return {
+        # Words that appear in same sentence as 'sh'
+        "cooccurrence": (sh_instances.sentences() - sh_instances).count_by("final"),
+        # Position patterns: what comes before/after 'sh'
+        "before_sh": sh_instances.neighbours(-1).count_by("final"),
+        "after_sh": sh_instances.neighbours(1).count_by("final"),
+    }
 
 
 def check_validated_vocabulary_cooccurrence(sh_instances):
@@ -176,52 +118,43 @@ def check_validated_vocabulary_cooccurrence(sh_instances):
 
     cooccurrence = defaultdict(int)
 
-    for instance in sh_instances:
-        words = instance["translation"].split()
-
-        # Check for validated vocabulary in same sentence
-        for word in words:
-            for val in validated:
-                if val in word:
-                    cooccurrence[val] += 1
+    # Check for validated vocabulary in same sentence, once per word type
+    for word, count in sh_instances.sentences().count_by("final").items():
+        for val in validated:
+            if val in word:
+                cooccurrence[val] += count
 
     return dict(cooccurrence)
 
 
-def analyze_by_manuscript_section(sh_instances):
-    """Check if 'sh' distribution varies by manuscript section."""
+def folio_section(folio):
+    """Manuscript section of a folio (f1r, f1v, f2r, etc.)."""
+    if not folio.startswith("f"):
+        return "unknown"
 
-    section_counts = defaultdict(int)
+    # Get folio number
+    match = re.match(r"f(\d+)", folio)
+    if not match:
+        return None
+    folio_num = int(match.group(1))
 
-    for instance in sh_instances:
-        folio = instance["folio"]
+    # Group into sections
+    if folio_num <= 20:
+        return "herbal_section_1"
+    elif folio_num <= 40:
+        return "herbal_section_2"
+    elif folio_num <= 60:
+        return "pharmaceutical_section"
+    elif folio_num <= 70:
+        return "astronomical_section"
+    elif folio_num <= 80:
+        return "biological_section"
+    return "text_section"
 
-        # Extract section from folio (f1r, f1v, f2r, etc.)
-        if folio.startswith("f"):
-            # Get folio number
-            match = re.match(r"f(\d+)", folio)
-            if match:
-                folio_num = int(match.group(1))
-
-                # Group into sections
-                if folio_num <= 20:
-                    section = "herbal_section_1"
-                elif folio_num <= 40:
-                    section = "herbal_section_2"
-                elif folio_num <= 60:
-                    section = "pharmaceutical_section"
-                elif folio_num <= 70:
-                    section = "astronomical_section"
-                elif folio_num <= 80:
-                    section = "biological_section"
-                else:
-                    section = "text_section"
-
-                section_counts[section] += 1
-        else:
-            section_counts["unknown"] += 1
 
-    return dict(section_counts)
+def analyze_by_manuscript_section(sh_instances):
+    """Check if 'sh' distribution varies by manuscript section."""
+    return dict(sh_instances.count_sentences_by("section"))
 
 
 def main():
@@ -234,18 +167,19 @@ def main():
 
     # Load data
     print("Loading translation data...")
-    translation_data = load_translation_data()
+    index = load_translation_data()
 
     print("Loading EVA sentences...")
     sentences = load_sentences()
 
-    print(f"Loaded {len(translation_data['translations'])} translations")
+    print(f"Loaded {index.columns.sentence_count} translations")
     print(f"Loaded {len(sentences)} sentences\n")
 
     # Find [?sh] instances
     print("Finding [?sh] instances in translations...")
-    sh_instances = find_sh_instances(translation_data["translations"])
-    print(f"Found {len(sh_instances)} sentences containing [?sh]\n")
+    sh_instances = find_sh_instances(index)
+    sh_sentences = len(sh_instances.sentence_ids())
+    print(f"Found {sh_sentences} sentences containing [?sh]\n")
 
     # Morphological patterns
     print("=" * 80)
@@ -253,7 +187,7 @@ def main():
     print("=" * 80)
     print("Analyzing how 'sh' combines with affixes...\n")
 
-    morph_patterns = analyze_morphological_patterns(sh_instances)
+    morph_patterns = analyze_morphological_patterns(index, sh_instances)
 
     print("PREFIX COMBINATIONS:")
     if morph_patterns["prefix_combinations"]:
@@ -333,7 +267,7 @@ def main():
     total_prefix_combos = len(morph_patterns["prefix_combinations"])
 
     print(f"\n[?sh] ROOT STATISTICS:")
-    print(f"  Total sentences with [?sh]: {len(sh_instances)}")
+    print(f"  Total sentences with [?sh]: {sh_sentences}")
     print(f"  Standalone instances: {morph_patterns['standalone_count']}")
     print(f"  With suffix: {total_suffix_combos} instances")
     print(f"  With prefix: {total_prefix_combos} different prefixes")
@@ -402,7 +336,7 @@ def main():
 
     # Save results
     results = {
-        "total_instances": len(sh_instances),
+        "total_instances": sh_sentences,
         "morphological_patterns": {
             "prefix_combinations": dict(
                 morph_patterns["prefix_combinations"].most_common(20)
@@ -13,14 +13,19 @@ without making semantic interpretations.
 import json
 import sys
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.corpus_query import CorpusIndex
+from common.translation_columns import load_translation
 
 
 def load_json_file(filepath):
-    """Load JSON data from file."""
+    """Load translation data from file as a queryable token index."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return CorpusIndex(load_translation(Path(filepath)))
     except FileNotFoundError:
         print(f"Error: Could not find {filepath}")
         sys.exit(1)
@@ -29,53 +34,34 @@ def load_json_file(filepath):
         sys.exit(1)
 
 
-def find_al_instances(translations):
-    """Find all instances where [?al] appears in translations."""
-    al_instances = []
-    for trans in translations:
-        text = trans["final_translation"]
-        words = text.split()
-
-        for i, word in enumerate(words):
-            if "[?al]" in word:
-                al_instances.append(
-                    {
-                        "sentence_id": trans.get("folio", "unknown"),
-                        "word": word,
-                        "position": i,
-                        "full_sentence": text,
-                    }
-                )
-
-    return al_instances
+def find_al_instances(index):
+    """Find all words whose translation contains [?al]."""
+    return index.query(final=lambda final: "[?al]" in final)
 
 
 def analyze_morphology(al_instances):
     """Analyze morphological patterns of 'al'."""
 
     # Track different patterns
-    standalone = []
-    with_suffix = []
-    with_prefix = []
-    word_forms = Counter()
+    standalone = 0
+    with_suffix = 0
+    with_prefix = 0
+    word_forms = al_instances.count_by("final")
     suffix_patterns = Counter()
     prefix_patterns = Counter()
 
-    for instance in al_instances:
-        word = instance["word"]
-        word_forms[word] += 1
-
+    for word, count in word_forms.items():
         # Check if standalone [?al]
         if word == "[?al]":
-            standalone.append(instance)
+            standalone += count
 
         # Check for prefixes
         # Format: PREFIX-[?al]-... or just [?al]-...
         if "-[?al]" in word:
             prefix = word.split("-[?al]")[0]
             if prefix:
-                prefix_patterns[prefix] += 1
-                with_prefix.append(instance)
+                prefix_patterns[prefix] += count
+                with_prefix += count
 
         # Check for suffixes
         # Format: [?al]-SUFFIX or PREFIX-[?al]-SUFFIX
@@ -83,8 +69,8 @@ def analyze_morphology(al_instances):
             parts = word.split("[?al]-")
             if len(parts) > 1 and parts[1]:
                 suffix = parts[1]
-                suffix_patterns[suffix] += 1
-                with_suffix.append(instance)
+                suffix_patterns[suffix] += count
+                with_suffix += count
 
     return {
         "standalone": standalone,
@@ -99,30 +85,14 @@ def analyze_morphology(al_instances):
 def analyze_cooccurrence(al_instances, window=5):
     """Analyze what words appear near 'al' in sentences."""
 
-    before_words = Counter()
-    after_words = Counter()
-    all_cooccurring = Counter()
-
-    for instance in al_instances:
-        words = instance["full_sentence"].split()
-        pos = instance["position"]
-
-        # Words before
-        for i in range(max(0, pos - window), pos):
-            if i < len(words):
-                before_words[words[i]] += 1
-                all_cooccurring[words[i]] += 1
-
-        # Words after
-        for i in range(pos + 1, min(len(words), pos + window + 1)):
-            if i < len(words):
-                after_words[words[i]] += 1
-                all_cooccurring[words[i]] += 1
-
-    return {"before": before_words, "after": after_words, "all": all_cooccurring}
+    return {
+        "before": al_instances.window(window, "before").count_by("final"),
+        "after": al_instances.window(window, "after").count_by("final"),
+        "all": al_instances.window(window).count_by("final"),
+    }
 
 
-def check_validated_vocabulary(al_instances):
+def check_validated_vocabulary(index, al_instances):
     """Check which validated morphemes appear in sentences with 'al'."""
 
     # List of validated morphemes to search for
@@ -153,12 +123,25 @@ def check_validated_vocabulary(al_instances):
     ]
 
     validated_counts = Counter()
+    if not len(al_instances):
+        return validated_counts
 
-    for instance in al_instances:
-        sentence = instance["full_sentence"]
-        for morpheme in validated:
-            # Count occurrences of each validated morpheme in the sentence
-            validated_counts[morpheme] += sentence.count(morpheme)
+    # Each sentence counts once per [?al] instance in it
+    instances = np.bincount(
+        index.sentence[al_instances.tokens], minlength=index.columns.sentence_count
+    )
+    context = al_instances.sentences()
+    word_weights = Counter()
+    for word, weight in zip(
+        context.values("final"), instances[index.sentence[context.tokens]].tolist()
+    ):
+        word_weights[word] += weight
+
+    for morpheme in validated:
+        # Count occurrences of each validated morpheme in the sentences
+        validated_counts[morpheme] += sum(
+            word.count(morpheme) * weight for word, weight in word_weights.items()
+        )
 
     return validated_counts
 
@@ -174,14 +157,13 @@ def main():
 
     # Load data
     print("Loading translation data...")
-    data = load_json_file("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json")
-    translations = data["translations"]
-    print(f"Loaded {len(translations)} translations")
+    index = load_json_file("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json")
+    print(f"Loaded {index.columns.sentence_count} translations")
     print()
 
     # Find all [?al] instances
     print("Finding [?al] instances in translations...")
-    al_instances = find_al_instances(translations)
+    al_instances = find_al_instances(index)
     print(f"Found {len(al_instances)} sentences containing [?al]")
     print()
 
@@ -194,7 +176,7 @@ def main():
 
     morph = analyze_morphology(al_instances)
 
-    print(f"STANDALONE '[?al]' (no affixes): {len(morph['standalone'])} instances")
+    print(f"STANDALONE '[?al]' (no affixes): {morph['standalone']} instances")
     print()
 
     print("PREFIX COMBINATIONS:")
@@ -245,7 +227,7 @@ def main():
     print("Checking which validated elements appear with 'al'...")
     print()
 
-    validated = check_validated_vocabulary(al_instances)
+    validated = check_validated_vocabulary(index, al_instances)
 
     print("VALIDATED ELEMENTS IN SENTENCES WITH [?al]:")
     for morpheme, count in validated.most_common():
@@ -259,14 +241,14 @@ def main():
     print("=" * 80)
     print()
 
-    total_with_suffix = len(morph["with_suffix"])
+    total_with_suffix = morph["with_suffix"]
     total_instances = len(al_instances)
 
     print(f"[?al] ROOT STATISTICS:")
     print(f"  Total sentences with [?al]: {total_instances}")
-    print(f"  Standalone instances: {len(morph['standalone'])}")
+    print(f"  Standalone instances: {morph['standalone']}")
     print(f"  With suffix: {total_with_suffix} instances")
-    print(f"  With prefix: {len(morph['with_prefix'])} instances")
+    print(f"  With prefix: {morph['with_prefix']} instances")
     print(f"  Unique word forms: {len(morph['word_forms'])}")
     print()
 
@@ -319,8 +301,8 @@ def main():
     print("OBJECTIVE PATTERNS (No semantic interpretation):")
     print()
 
-    if len(morph["standalone"]) > 0:
-        print(f"1. 'al' appears standalone {len(morph['standalone'])} times")
+    if morph["standalone"] > 0:
+        print(f"1. 'al' appears standalone {morph['standalone']} times")
         print("   → Likely a ROOT, not an affix")
         print()
 
@@ -385,9 +367,9 @@ def main():
     output_file = "PHASE19_AL_ROOT_INVESTIGATION.json"
     output_data = {
         "total_instances": total_instances,
-        "standalone_count": len(morph["standalone"]),
+        "standalone_count": morph["standalone"],
         "with_suffix_count": total_with_suffix,
-        "with_prefix_count": len(morph["with_prefix"]),
+        "with_prefix_count": morph["with_prefix"],
         "unique_word_forms": len(morph["word_forms"]),
         "verb_percentage": verb_pct if total_with_suffix > 0 else 0,
         "inst_percentage": inst_pct if total_with_suffix > 0 else 0,
@@ -5,9 +5,13 @@ This maps our translated sections to exact manuscript folios.
 """
 
 import re
+import sys
 from pathlib import Path
 from difflib import SequenceMatcher
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import base_folio, load_corpus
+
 
 def normalize_text(text):
     """Normalize text for comparison (remove punctuation, lowercase)."""
@@ -39,7 +43,7 @@ def load_takahashi():
 
 
 def load_zl_with_folios():
-    """Load ZL transcription with folio markers."""
+    """Load ZL transcription with folio markers (shared parsed-corpus cache)."""
     zl_path = (
         Path(__file__).parent.parent.parent
         / "data"
@@ -47,66 +51,36 @@ def load_zl_with_folios():
         / "eva_transcription"
         / "ZL3b-n.txt"
     )
+    corpus = load_corpus(zl_path)
 
-    with open(zl_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Parse into folio sections
+    # Group consecutive lines into folio sections; foldout panels
+    # (f85r1, f85r2, ...) belong to their base folio
     folio_data = []
-    current_folio = None
-    current_words = []
     word_position = 0
 
-    for line in lines:
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
+    for folio, _, line_words in corpus.iter_lines():
+        folio = base_folio(folio)
+        words = normalize_text(" ".join(line_words)).split()
+        if not words:
             continue
-
-        # Folio marker
-        if line.startswith("<f") and ">" in line and not "," in line.split(">")[0]:
-            # Save previous folio if exists
-            if current_folio and current_words:
-                folio_data.append(
-                    {
-                        "folio": current_folio,
-                        "start_word": word_position - len(current_words),
-                        "end_word": word_position,
-                        "word_count": len(current_words),
-                        "words": current_words.copy(),
-                        "text": " ".join(current_words),
-                    }
-                )
-
-            # Start new folio
-            folio_match = re.match(r"<(f\d+[rv])>", line)
-            if folio_match:
-                current_folio = folio_match.group(1)
-                current_words = []
-
-        # Text line (has folio.line marker)
-        elif "," in line and current_folio:
-            # Extract text after the marker
-            parts = line.split(">")
-            if len(parts) >= 2:
-                text = parts[-1]
-                words = normalize_text(text).split()
-                current_words.extend(words)
-                word_position += len(words)
-
-    # Add last folio
-    if current_folio and current_words:
-        folio_data.append(
-            {
-                "folio": current_folio,
-                "start_word": word_position - len(current_words),
-                "end_word": word_position,
-                "word_count": len(current_words),
-                "words": current_words.copy(),
-                "text": " ".join(current_words),
-            }
-        )
+        if not folio_data or folio_data[-1]["folio"] != folio:
+            folio_data.append(
+                {
+                    "folio": folio,
+                    "start_word": word_position,
+                    "end_word": word_position,
+                    "word_count": 0,
+                    "words": [],
+                }
+            )
+        section = folio_data[-1]
+        section["words"].extend(words)
+        word_position += len(words)
+        section["end_word"] = word_position
+        section["word_count"] = len(section["words"])
+
+    for section in folio_data:
+        section["text"] = " ".join(section["words"])
 
     return folio_data
 
@@ -5,29 +5,19 @@ Extract medical terminology from ME corpus and create searchable database.
 Focus on: herbs, body parts, conditions, treatments, women's health.
 """
 
+import sys
 from pathlib import Path
-import re
 import json
-from collections import Counter, defaultdict
+from collections import defaultdict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.me_corpus import CMEPV_SGML_DIR, corpus_files, load_me_word_freq
 
 
 def load_me_corpus_words():
-    """Load all words from ME corpus."""
-    corpus_dir = Path("data/middle_english_corpus/cmepv/middle_english_text_cmepv/sgml")
-    sgml_files = list(corpus_dir.glob("*.sgm"))
-
-    all_words = []
-    print(f"Reading {len(sgml_files)} ME texts...")
-
-    for sgml_file in sgml_files:
-        with open(sgml_file, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-            # Remove SGML tags
-            text = re.sub(r"<[^>]+>", " ", content)
-            words = re.findall(r"[a-z]+", text.lower())
-            all_words.extend(words)
-
-    return Counter(all_words)
+    """Load word frequencies of the ME corpus (cached, tokenized in parallel)."""
+    print(f"Reading {len(corpus_files(CMEPV_SGML_DIR))} ME texts...")
+    return load_me_word_freq(CMEPV_SGML_DIR)
 
 
 def extract_medical_vocabulary(word_freq):
@@ -13,9 +13,12 @@ Strategy:
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
-from itertools import product
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.transform_index import VariantIndex, eo_variants
 
 
 def load_manuscript():
@@ -36,25 +39,6 @@ def load_manuscript():
     return all_words, data["sections"]
 
 
-def apply_eo_substitution(word, max_variants=32):
-    """Apply e↔o substitution to a word."""
-    eo_positions = [(i, c) for i, c in enumerate(word) if c in ["e", "o"]]
-
-    if len(eo_positions) > 5:
-        return [word, word.replace("o", "e"), word.replace("e", "o")]
-
-    variants = set()
-    for combination in product(["e", "o"], repeat=len(eo_positions)):
-        variant = list(word)
-        for (pos, _), new_char in zip(eo_positions, combination):
-            variant[pos] = new_char
-        variants.add("".join(variant))
-        if len(variants) >= max_variants:
-            break
-
-    return list(variants)
-
-
 def generate_reversal_variants(word):
     """
     Generate all reversal + e↔o variants for a word.
@@ -63,53 +47,44 @@ def generate_reversal_variants(word):
     - Direct: root, reet, ruut, rout
     - Reversed: toor, teor, teur, taor
     """
-    variants = {"direct": [], "reversed": []}
-
-    # Direct with e↔o
-    for eo_var in apply_eo_substitution(word):
-        variants["direct"].append(eo_var)
-
-    # Reversed with e↔o
-    reversed_word = word[::-1]
-    for eo_var in apply_eo_substitution(reversed_word):
-        variants["reversed"].append(eo_var)
-
-    return variants
+    return {
+        "direct": eo_variants(word),
+        "reversed": eo_variants(word[::-1]),
+    }
 
 
-def search_term_in_manuscript(term, variants, all_words):
+def search_term_in_manuscript(term, index):
     """
     Search for all variants of a term in the manuscript.
     Returns matches with positions and transform types.
+
+    index is a VariantIndex over the cleaned manuscript words, so each
+    transform is one class lookup instead of a scan of every word.
     """
     matches = {"direct": [], "reversed": []}
 
-    # Create word position map
-    for pos, word in enumerate(all_words):
-        word_clean = word.lower().strip(".,;:!?")
-
-        # Check direct matches
-        if word_clean in variants["direct"]:
-            matches["direct"].append(
-                {
-                    "position": pos,
-                    "voynich": word_clean,
-                    "english": term,
-                    "variant": word_clean,
-                }
-            )
+    for pos in index.positions_of(index.eo_matches(term)):
+        word_clean = index.words[pos]
+        matches["direct"].append(
+            {
+                "position": pos,
+                "voynich": word_clean,
+                "english": term,
+                "variant": word_clean,
+            }
+        )
 
-        # Check reversed matches
-        if word_clean in variants["reversed"]:
-            matches["reversed"].append(
-                {
-                    "position": pos,
-                    "voynich": word_clean,
-                    "english": term,
-                    "variant": word_clean,
-                    "reversed_from": word_clean[::-1],
-                }
-            )
+    for pos in index.positions_of(index.reversed_matches(term)):
+        word_clean = index.words[pos]
+        matches["reversed"].append(
+            {
+                "position": pos,
+                "voynich": word_clean,
+                "english": term,
+                "variant": word_clean,
+                "reversed_from": word_clean[::-1],
+            }
+        )
 
     return matches
 
@@ -164,10 +139,11 @@ def main():
 
     # Search for each term
     results = {}
+    index = VariantIndex(word.lower().strip(".,;:!?") for word in all_words)
 
     for term, info in high_frequency_terms.items():
         variants = generate_reversal_variants(term)
-        matches = search_term_in_manuscript(term, variants, all_words)
+        matches = search_term_in_manuscript(term, index)
 
         total_matches = len(matches["direct"]) + len(matches["reversed"])
 
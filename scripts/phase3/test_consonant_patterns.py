@@ -16,11 +16,19 @@ This could significantly increase recognition rate.
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
-from itertools import product
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.transform_index import (
+    CONSONANT_SHIFTS,
+    VariantIndex,
+    consonant_shift,
+    eo_variants,
+)
+
 
 def load_data():
     """Load specialized vocabulary and full manuscript."""
@@ -88,64 +96,6 @@ def load_data():
     return combined_vocab, all_words
 
 
-def apply_eo_substitution(word, max_variants=32):
-    """Apply e↔o substitution to a word."""
-    eo_positions = [(i, c) for i, c in enumerate(word) if c in ["e", "o"]]
-
-    if len(eo_positions) > 5:
-        return [word, word.replace("o", "e"), word.replace("e", "o")]
-
-    variants = set()
-    for combination in product(["e", "o"], repeat=len(eo_positions)):
-        variant = list(word)
-        for (pos, _), new_char in zip(eo_positions, combination):
-            variant[pos] = new_char
-        variants.add("".join(variant))
-        if len(variants) >= max_variants:
-            break
-
-    return list(variants)
-
-
-def apply_consonant_shift(word, shift_type):
-    """
-    Apply consonant shift to a word.
-
-    shift_type: 'ch_sh', 'c_k', 'ph_f', 't_d'
-    """
-    if shift_type == "ch_sh":
-        # ch ↔ sh
-        variants = []
-        # Replace ch with sh
-        variants.append(word.replace("ch", "sh"))
-        # Replace sh with ch
-        variants.append(word.replace("sh", "ch"))
-        return variants
-
-    elif shift_type == "c_k":
-        # c ↔ k
-        variants = []
-        variants.append(word.replace("c", "k"))
-        variants.append(word.replace("k", "c"))
-        return variants
-
-    elif shift_type == "ph_f":
-        # ph ↔ f
-        variants = []
-        variants.append(word.replace("ph", "f"))
-        variants.append(word.replace("f", "ph"))
-        return variants
-
-    elif shift_type == "t_d":
-        # t ↔ d
-        variants = []
-        variants.append(word.replace("t", "d"))
-        variants.append(word.replace("d", "t"))
-        return variants
-
-    return [word]
-
-
 def generate_full_variants(word, include_reversal=True, include_consonants=True):
     """
     Generate all possible variants of a word with:
@@ -159,11 +109,11 @@ def generate_full_variants(word, include_reversal=True, include_consonants=True)
     if include_reversal:
         base_words.append(word[::-1])
 
-    consonant_shifts = ["ch_sh", "c_k", "ph_f", "t_d"] if include_consonants else []
+    consonant_shifts = list(CONSONANT_SHIFTS) if include_consonants else []
 
     for base in base_words:
         # Start with e↔o variants of base
-        for eo_var in apply_eo_substitution(base):
+        for eo_var in eo_variants(base):
             if base == word:
                 variants["direct"].add(eo_var)
             elif include_reversal:
@@ -172,7 +122,7 @@ def generate_full_variants(word, include_reversal=True, include_consonants=True)
             # Apply each consonant shift
             if include_consonants:
                 for shift_type in consonant_shifts:
-                    for cons_var in apply_consonant_shift(eo_var, shift_type):
+                    for cons_var in consonant_shift(eo_var, shift_type):
                         if cons_var != eo_var:  # Only add if actually changed
                             if base == word:
                                 variants["direct"].add(cons_var)
@@ -205,6 +155,9 @@ def search_with_transforms(
     # Limit search if sample_size specified
     search_words = all_words[:sample_size] if sample_size else all_words
 
+    # e↔o classes of the vocabulary: variant checks become one lookup each
+    index = VariantIndex(vocab)
+
     for pos, word in enumerate(search_words):
         word_clean = word.lower().strip(".,;:!?")
 
@@ -223,45 +176,40 @@ def search_with_transforms(
 
         # Strategy 2: e↔o only
         found = False
-        for eo_var in apply_eo_substitution(word_clean):
-            if eo_var in vocab:
-                results["direct_matches"].append(
-                    {
-                        "position": pos,
-                        "voynich": word_clean,
-                        "english": vocab[eo_var]["meaning"],
-                        "category": vocab[eo_var]["category"],
-                        "transform": "e↔o",
-                    }
-                )
-                found = True
-                break
-
-        if found:
+        eo_var = index.first_eo_match(word_clean)
+        if eo_var:
+            results["direct_matches"].append(
+                {
+                    "position": pos,
+                    "voynich": word_clean,
+                    "english": vocab[eo_var]["meaning"],
+                    "category": vocab[eo_var]["category"],
+                    "transform": "e↔o",
+                }
+            )
             continue
 
         # Strategy 3: Reversal + e↔o (we know this works)
         reversed_word = word_clean[::-1]
-        for eo_var in apply_eo_substitution(reversed_word):
-            if eo_var in vocab:
-                results["reversed_matches"].append(
-                    {
-                        "position": pos,
-                        "voynich": word_clean,
-                        "english": vocab[eo_var]["meaning"],
-                        "category": vocab[eo_var]["category"],
-                        "transform": "reversed + e↔o",
-                    }
-                )
-                found = True
-                break
+        eo_var = index.first_eo_match(reversed_word)
+        if eo_var:
+            results["reversed_matches"].append(
+                {
+                    "position": pos,
+                    "voynich": word_clean,
+                    "english": vocab[eo_var]["meaning"],
+                    "category": vocab[eo_var]["category"],
+                    "transform": "reversed + e↔o",
+                }
+            )
+            continue
 
-        if found or not include_consonants:
+        if not include_consonants:
             continue
 
         # Strategy 4: Consonant shifts (NEW!)
-        for shift_type in ["ch_sh", "c_k", "ph_f", "t_d"]:
-            for cons_var in apply_consonant_shift(word_clean, shift_type):
+        for shift_type in CONSONANT_SHIFTS:
+            for cons_var in consonant_shift(word_clean, shift_type):
                 if cons_var in vocab:
                     results["consonant_matches"].append(
                         {
@@ -276,21 +224,18 @@ def search_with_transforms(
                     break
 
                 # Try consonant + e↔o
-                for eo_var in apply_eo_substitution(cons_var):
-                    if eo_var in vocab:
-                        results["consonant_matches"].append(
-                            {
-                                "position": pos,
-                                "voynich": word_clean,
-                                "english": vocab[eo_var]["meaning"],
-                                "category": vocab[eo_var]["category"],
-                                "transform": f"consonant ({shift_type}) + e↔o",
-                            }
-                        )
-                        found = True
-                        break
-
-                if found:
+                eo_var = index.first_eo_match(cons_var)
+                if eo_var:
+                    results["consonant_matches"].append(
+                        {
+                            "position": pos,
+                            "voynich": word_clean,
+                            "english": vocab[eo_var]["meaning"],
+                            "category": vocab[eo_var]["category"],
+                            "transform": f"consonant ({shift_type}) + e↔o",
+                        }
+                    )
+                    found = True
                     break
 
             if found:
@@ -301,9 +246,9 @@ def search_with_transforms(
 
         # Strategy 5: Multi-transform (consonant + e↔o + reversal)
         if include_consonants:
-            for shift_type in ["ch_sh", "c_k", "ph_f", "t_d"]:
+            for shift_type in CONSONANT_SHIFTS:
                 # Try reversal + consonant
-                for cons_var in apply_consonant_shift(reversed_word, shift_type):
+                for cons_var in consonant_shift(reversed_word, shift_type):
                     if cons_var in vocab:
                         results["multi_transform_matches"].append(
                             {
@@ -318,21 +263,18 @@ def search_with_transforms(
                         break
 
                     # Try reversal + consonant + e↔o
-                    for eo_var in apply_eo_substitution(cons_var):
-                        if eo_var in vocab:
-                            results["multi_transform_matches"].append(
-                                {
-                                    "position": pos,
-                                    "voynich": word_clean,
-                                    "english": vocab[eo_var]["meaning"],
-                                    "category": vocab[eo_var]["category"],
-                                    "transform": f"reversed + consonant ({shift_type}) + e↔o",
-                                }
-                            )
-                            found = True
-                            break
-
-                    if found:
+                    eo_var = index.first_eo_match(cons_var)
+                    if eo_var:
+                        results["multi_transform_matches"].append(
+                            {
+                                "position": pos,
+                                "voynich": word_clean,
+                                "english": vocab[eo_var]["meaning"],
+                                "category": vocab[eo_var]["category"],
+                                "transform": f"reversed + consonant ({shift_type}) + e↔o",
+                            }
+                        )
+                        found = True
                         break
 
                 if found:
@@ -19,10 +19,13 @@ We'll test:
 """
 
 import json
+import sys
 from pathlib import Path
-from itertools import permutations
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.transform_index import AnagramIndex, unscramble
+
 
 def load_data():
     """Load specialized vocabulary and Section 4 text."""
@@ -104,36 +107,6 @@ def apply_eo_substitution(word, max_variants=32):
     return list(variants)
 
 
-def generate_scrambled_variants(word, max_variants=50):
-    """
-    Generate variants with middle letters scrambled, first/last preserved.
-
-    Example: "root" → "root", "roto", "rtoo" (all keep r_t pattern)
-    """
-    if len(word) <= 3:
-        # Too short to scramble meaningfully
-        return [word]
-
-    first = word[0]
-    last = word[-1]
-    middle = word[1:-1]
-
-    if len(middle) <= 1:
-        return [word]
-
-    # Generate all permutations of middle letters
-    variants = set()
-    variants.add(word)  # Include original
-
-    for perm in permutations(middle):
-        scrambled = first + "".join(perm) + last
-        variants.add(scrambled)
-        if len(variants) >= max_variants:
-            break
-
-    return list(variants)
-
-
 def test_scrambling_hypothesis(section_words, vocab):
     """
     Test multiple scrambling strategies:
@@ -142,7 +115,11 @@ def test_scrambling_hypothesis(section_words, vocab):
     3. Scrambling + e↔o
     4. Scrambling + reversal
     5. Scrambling + e↔o + reversal
+
+    Strategies 2-5 look the word up by its anagram key (first letter,
+    sorted middle, last letter), so every middle permutation is covered.
     """
+    anagrams = AnagramIndex(vocab)
 
     results = {
         "baseline": {"matches": [], "details": []},
@@ -171,77 +148,69 @@ def test_scrambling_hypothesis(section_words, vocab):
                 break
 
         # Strategy 2: Pure scrambling (preserve first/last)
-        for scrambled in generate_scrambled_variants(word_clean):
-            if scrambled in vocab:
-                results["scrambled"]["details"].append(
-                    {
-                        "original": word_clean,
-                        "variant": scrambled,
-                        "meaning": vocab[scrambled]["meaning"],
-                        "category": vocab[scrambled]["category"],
-                        "transform": "scrambled",
-                        "position": word_idx,
-                    }
-                )
-                break
+        matches = anagrams.scramble_matches(word_clean)
+        if matches:
+            scrambled = matches[0]
+            results["scrambled"]["details"].append(
+                {
+                    "original": word_clean,
+                    "variant": scrambled,
+                    "meaning": vocab[scrambled]["meaning"],
+                    "category": vocab[scrambled]["category"],
+                    "transform": "scrambled",
+                    "position": word_idx,
+                }
+            )
 
         # Strategy 3: Scrambling + e↔o
-        for scrambled in generate_scrambled_variants(word_clean):
-            for eo_variant in apply_eo_substitution(scrambled):
-                if eo_variant in vocab:
-                    results["scrambled_eo"]["details"].append(
-                        {
-                            "original": word_clean,
-                            "scrambled": scrambled,
-                            "variant": eo_variant,
-                            "meaning": vocab[eo_variant]["meaning"],
-                            "category": vocab[eo_variant]["category"],
-                            "transform": "scrambled + e↔o",
-                            "position": word_idx,
-                        }
-                    )
-                    break
-            else:
-                continue
-            break
+        matches = anagrams.scramble_eo_matches(word_clean)
+        if matches:
+            eo_variant = matches[0]
+            results["scrambled_eo"]["details"].append(
+                {
+                    "original": word_clean,
+                    "scrambled": unscramble(word_clean, eo_variant),
+                    "variant": eo_variant,
+                    "meaning": vocab[eo_variant]["meaning"],
+                    "category": vocab[eo_variant]["category"],
+                    "transform": "scrambled + e↔o",
+                    "position": word_idx,
+                }
+            )
 
         # Strategy 4: Scrambling + reversal
         reversed_word = word_clean[::-1]
-        for scrambled in generate_scrambled_variants(reversed_word):
-            if scrambled in vocab:
-                results["scrambled_reversed"]["details"].append(
-                    {
-                        "original": word_clean,
-                        "reversed": reversed_word,
-                        "variant": scrambled,
-                        "meaning": vocab[scrambled]["meaning"],
-                        "category": vocab[scrambled]["category"],
-                        "transform": "reversed + scrambled",
-                        "position": word_idx,
-                    }
-                )
-                break
+        matches = anagrams.scramble_matches(reversed_word)
+        if matches:
+            scrambled = matches[0]
+            results["scrambled_reversed"]["details"].append(
+                {
+                    "original": word_clean,
+                    "reversed": reversed_word,
+                    "variant": scrambled,
+                    "meaning": vocab[scrambled]["meaning"],
+                    "category": vocab[scrambled]["category"],
+                    "transform": "reversed + scrambled",
+                    "position": word_idx,
+                }
+            )
 
         # Strategy 5: All combined (scramble + reverse + e↔o)
-        for scrambled in generate_scrambled_variants(reversed_word):
-            for eo_variant in apply_eo_substitution(scrambled):
-                if eo_variant in vocab:
-                    results["all_combined"]["details"].append(
-                        {
-                            "original": word_clean,
-                            "reversed": reversed_word,
-                            "scrambled": scrambled,
-                            "variant": eo_variant,
-                            "meaning": vocab[eo_variant]["meaning"],
-                            "category": vocab[eo_variant]["category"],
-                            "transform": "scrambled + reversed + e↔o",
-                            "position": word_idx,
-                        }
-                    )
-                    break
-            else:
-                continue
-            break
+        matches = anagrams.scramble_eo_matches(reversed_word)
+        if matches:
+            eo_variant = matches[0]
+            results["all_combined"]["details"].append(
+                {
+                    "original": word_clean,
+                    "reversed": reversed_word,
+                    "scrambled": unscramble(reversed_word, eo_variant),
+                    "variant": eo_variant,
+                    "meaning": vocab[eo_variant]["meaning"],
+                    "category": vocab[eo_variant]["category"],
+                    "transform": "scrambled + reversed + e↔o",
+                    "position": word_idx,
+                }
+            )
 
     return results
 
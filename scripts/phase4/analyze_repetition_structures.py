@@ -19,10 +19,16 @@ Questions to answer:
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import load_corpus
+from common.phrase_index import PhraseIndex
+from common.token_array import TokenArray
+
 
 def load_manuscript():
     """Load manuscript as word list"""
@@ -37,6 +43,12 @@ def load_manuscript():
     return words
 
 
+def load_folio_corpus():
+    """Load the folio-tagged ZL3b transcription as a TokenArray"""
+    transcription_path = Path("data/voynich/eva_transcription/ZL3b-n.txt")
+    return TokenArray.from_corpus(load_corpus(transcription_path))
+
+
 def load_validated_words():
     """Load all validated word classes"""
 
@@ -120,16 +132,26 @@ def find_formulaic_sequences(words, window_size=5, min_freq=5):
 
     Examples: "daiin chedy otedy" appearing multiple times
     """
-    ngrams = Counter()
+    # Read n-gram counts off the suffix/LCP arrays of the integer-encoded
+    # corpus, keeping only frequent formulae
+    formulae = PhraseIndex(TokenArray.from_words(words)).ngram_counts(
+        window_size, min_freq=min_freq
+    )
 
-    for i in range(len(words) - window_size + 1):
-        ngram = tuple(words[i : i + window_size])
-        ngrams[ngram] += 1
+    return formulae
 
-    # Filter to frequent formulae
-    formulae = {ngram: count for ngram, count in ngrams.items() if count >= min_freq}
 
-    return formulae
+def find_maximal_phrases(tokens, min_length=2, min_freq=5):
+    """
+    Find repeated phrases of every length in one suffix-array build
+
+    Only maximal repeats are kept: phrases whose occurrences cannot all be
+    extended by the same word on the left or on the right
+    Returns dicts with phrase, length, frequency and folio_spread
+    """
+    return PhraseIndex(tokens).maximal_repeats(
+        min_length=min_length, min_freq=min_freq
+    )
 
 
 def analyze_repetition_by_word_class(repetitions, validated_words):
@@ -494,6 +516,42 @@ def main():
 
     print()
 
+    # Analysis 7: Variable-length formulae
+    print("=" * 80)
+    print("ANALYSIS 7: VARIABLE-LENGTH FORMULAE (MAXIMAL REPEATS, ALL LENGTHS)")
+    print("=" * 80)
+    print("Mining repeated phrases of every length over the folio-tagged corpus...")
+    print()
+
+    folio_tokens = load_folio_corpus()
+    phrases = find_maximal_phrases(folio_tokens, min_length=2, min_freq=5)
+    length_distribution = Counter(p["length"] for p in phrases)
+
+    print(f"Found {len(phrases)} maximal phrases (2+ words, appearing 5+ times)")
+    print()
+    print(f"{'Length':<10} {'Phrases':<10}")
+    print("-" * 20)
+    for length in sorted(length_distribution):
+        print(f"{length:<10} {length_distribution[length]:<10}")
+
+    print()
+    print("Top 15 most common phrases:")
+    print(f"  {'Freq':>4}   {'Folios':>6}   Phrase")
+    for phrase in phrases[:15]:
+        print(
+            f"  {phrase['frequency']:4}×   {phrase['folio_spread']:6}   {' '.join(phrase['phrase'])}"
+        )
+
+    longest = sorted(phrases, key=lambda p: (-p["length"], -p["frequency"]))
+    print()
+    print("Longest recurring phrases:")
+    for phrase in longest[:10]:
+        print(
+            f"  {phrase['length']:2} words, {phrase['frequency']}× in {phrase['folio_spread']} folios | {' '.join(phrase['phrase'])}"
+        )
+
+    print()
+
     # Summary
     print("=" * 80)
     print("SUMMARY & INTERPRETATION")
@@ -528,6 +586,9 @@ def main():
     print()
     print(f"4. Formulaic sequences suggest standardized phrasing")
     print(f"   - {len(formulae)} repeated 5-grams")
+    print(
+        f"   - {len(phrases)} maximal repeated phrases of 2-{max(length_distribution, default=0)} words"
+    )
     print()
 
     # Interpretation
@@ -595,6 +656,15 @@ def main():
             {"sequence": list(ngram), "frequency": count}
             for ngram, count in sorted_formulae[:50]
         ],
+        "maximal_phrases": [
+            {
+                "sequence": list(phrase["phrase"]),
+                "length": phrase["length"],
+                "frequency": phrase["frequency"],
+                "folio_spread": phrase["folio_spread"],
+            }
+            for phrase in phrases[:100]
+        ],
         "summary": {
             "overall_repetition_density": overall_density,
             "recipe_enrichment": recipe_enrichment,
@@ -4,12 +4,26 @@ Phase 4A: Exhaustive Vocabulary Search
 
 Apply ALL known transforms + extended consonant patterns to expanded vocabulary
 Search for matches in Voynich manuscript
+
+Matches are found with a weighted transform distance (common/transform_matcher):
+each e↔o swap, consonant shift and the reversal has a cost, and every Voynich
+type within MAX_TRANSFORM_COST of an ME word is reported with the exact
+transform path that reaches it
 """
 
 import json
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.transform_matcher import TransformMatcher, describe_path
+
+# Largest weighted transform distance accepted as a match: up to six e↔o
+# swaps, or reversal plus two consonant shifts, etc.; any plain edit
+# (insertion, deletion, other substitution) costs more than this
+MAX_TRANSFORM_COST = 1.5
+
 
 def load_expanded_vocabulary():
     """Load the expanded ME medical vocabulary."""
@@ -31,120 +45,7 @@ def load_voynich_text():
     return Counter(words), set(words)
 
 
-def apply_all_transforms(me_word):
-    """
-    Apply ALL known transforms to ME word to generate Voynich candidates.
-
-    Transforms:
-    1. e↔o vowel substitution
-    2. Word reversal
-    3. Consonant shifts: ch↔sh, t↔d, p↔b, f↔v, g↔k, c↔k
-    4. Combinations of above
-    """
-
-    candidates = set()
-
-    # Helper functions
-    def vowel_swap(word, e_to_o=True):
-        """Swap e↔o."""
-        if e_to_o:
-            return word.replace("e", "o")
-        else:
-            return word.replace("o", "e")
-
-    def reverse_word(word):
-        """Reverse the word."""
-        return word[::-1]
-
-    def consonant_shifts(word):
-        """Apply all consonant shift patterns."""
-        variants = {word}
-
-        # ch ↔ sh
-        if "ch" in word:
-            variants.add(word.replace("ch", "sh"))
-        if "sh" in word:
-            variants.add(word.replace("sh", "ch"))
-
-        # t ↔ d
-        if "t" in word:
-            variants.add(word.replace("t", "d"))
-        if "d" in word:
-            variants.add(word.replace("d", "t"))
-
-        # p ↔ b
-        if "p" in word:
-            variants.add(word.replace("p", "b"))
-        if "b" in word:
-            variants.add(word.replace("b", "p"))
-
-        # f ↔ v
-        if "f" in word:
-            variants.add(word.replace("f", "v"))
-        if "v" in word:
-            variants.add(word.replace("v", "f"))
-
-        # g ↔ k
-        if "g" in word:
-            variants.add(word.replace("g", "k"))
-        if "k" in word:
-            variants.add(word.replace("k", "g"))
-
-        # c ↔ k (soft c)
-        if "c" in word:
-            variants.add(word.replace("c", "k"))
-        if "k" in word and "c" not in word:
-            variants.add(word.replace("k", "c"))
-
-        return variants
-
-    # Layer 1: Direct (no transform)
-    candidates.add(me_word)
-
-    # Layer 2: e↔o only
-    candidates.add(vowel_swap(me_word, e_to_o=True))
-    candidates.add(vowel_swap(me_word, e_to_o=False))
-
-    # Layer 3: Reversal only
-    reversed_word = reverse_word(me_word)
-    candidates.add(reversed_word)
-
-    # Layer 4: Reversal + e↔o
-    candidates.add(vowel_swap(reversed_word, e_to_o=True))
-    candidates.add(vowel_swap(reversed_word, e_to_o=False))
-
-    # Layer 5: Consonant shifts
-    for consonant_variant in consonant_shifts(me_word):
-        candidates.add(consonant_variant)
-        # Also apply e↔o to consonant variants
-        candidates.add(vowel_swap(consonant_variant, e_to_o=True))
-        candidates.add(vowel_swap(consonant_variant, e_to_o=False))
-
-    # Layer 6: Reversal + consonant shifts
-    for consonant_variant in consonant_shifts(reversed_word):
-        candidates.add(consonant_variant)
-        # Also apply e↔o
-        candidates.add(vowel_swap(consonant_variant, e_to_o=True))
-        candidates.add(vowel_swap(consonant_variant, e_to_o=False))
-
-    # Layer 7: Double consonant shifts (ch→sh + t→d, etc.)
-    base_variants = list(consonant_shifts(me_word))
-    for variant in base_variants:
-        for double_variant in consonant_shifts(variant):
-            candidates.add(double_variant)
-            candidates.add(vowel_swap(double_variant, e_to_o=True))
-            candidates.add(vowel_swap(double_variant, e_to_o=False))
-
-    # Remove the original word (we're looking for transformed versions)
-    candidates.discard(me_word)
-
-    # Remove empty strings or very short artifacts
-    candidates = {c for c in candidates if len(c) >= 2}
-
-    return candidates
-
-
-def search_vocabulary_exhaustively():
+def search_vocabulary_exhaustively(max_cost=MAX_TRANSFORM_COST):
     """Search for all ME vocabulary in Voynich text with all transforms."""
 
     print("Loading data...")
@@ -155,7 +56,11 @@ def search_vocabulary_exhaustively():
     print(f"Voynich unique words: {len(voynich_set)}")
     print(f"Voynich total words: {sum(voynich_freqs.values())}")
 
-    print("\nGenerating transform candidates and searching...")
+    print("\nSearching Voynich types within transform cost of each term...")
+
+    # One trie over the Voynich types; each ME word is matched against it
+    # directly instead of enumerating its transform variants
+    matcher = TransformMatcher(voynich_freqs)
 
     matches = []
     me_word_to_matches = defaultdict(list)
@@ -166,79 +71,31 @@ def search_vocabulary_exhaustively():
         if checked % 100 == 0:
             print(f"  Processed {checked}/{len(vocab)} ME terms...")
 
-        # Generate all possible Voynich forms
-        voynich_candidates = apply_all_transforms(me_word)
-
-        # Check which candidates exist in Voynich
-        for candidate in voynich_candidates:
-            if candidate in voynich_set:
-                freq = voynich_freqs[candidate]
-                matches.append(
-                    {
-                        "me_word": me_word,
-                        "meaning": me_data["meaning"],
-                        "category": me_data["category"],
-                        "voynich_word": candidate,
-                        "frequency": freq,
-                        "transform_applied": infer_transform(me_word, candidate),
-                    }
-                )
-                me_word_to_matches[me_word].append((candidate, freq))
+        for match in matcher.search(me_word, max_cost):
+            candidate = match["word"]
+            # We're looking for transformed versions; skip short artifacts
+            if candidate == me_word or len(candidate) < 2:
+                continue
+            freq = voynich_freqs[candidate]
+            matches.append(
+                {
+                    "me_word": me_word,
+                    "meaning": me_data["meaning"],
+                    "category": me_data["category"],
+                    "voynich_word": candidate,
+                    "frequency": freq,
+                    "transform_applied": describe_path(match["path"]),
+                    "transform_path": match["path"],
+                    "transform_cost": match["cost"],
+                }
+            )
+            me_word_to_matches[me_word].append((candidate, freq))
 
     print(f"\nSearch complete!")
 
     return matches, me_word_to_matches
 
 
-def infer_transform(me_word, voynich_word):
-    """Infer which transform(s) were applied."""
-    transforms = []
-
-    # Check for reversal
-    if me_word[::-1] == voynich_word:
-        return "reversal"
-
-    # Check for e↔o
-    if me_word.replace("e", "o") == voynich_word:
-        return "e→o"
-    if me_word.replace("o", "e") == voynich_word:
-        return "o→e"
-
-    # Check for vowel swap on reversed
-    if me_word[::-1].replace("e", "o") == voynich_word:
-        return "reversal + e→o"
-    if me_word[::-1].replace("o", "e") == voynich_word:
-        return "reversal + o→e"
-
-    # Check consonant patterns
-    if "ch" in me_word and "sh" in voynich_word:
-        transforms.append("ch→sh")
-    if "sh" in me_word and "ch" in voynich_word:
-        transforms.append("sh→ch")
-    if me_word.replace("t", "d") == voynich_word:
-        transforms.append("t→d")
-    if me_word.replace("d", "t") == voynich_word:
-        transforms.append("d→t")
-    if me_word.replace("p", "b") == voynich_word:
-        transforms.append("p→b")
-    if me_word.replace("b", "p") == voynich_word:
-        transforms.append("b→p")
-    if me_word.replace("f", "v") == voynich_word:
-        transforms.append("f→v")
-    if me_word.replace("v", "f") == voynich_word:
-        transforms.append("v→f")
-    if me_word.replace("g", "k") == voynich_word:
-        transforms.append("g→k")
-    if me_word.replace("k", "g") == voynich_word:
-        transforms.append("k→g")
-
-    if transforms:
-        return " + ".join(transforms)
-
-    # Complex multi-transform
-    return "multi-transform"
-
-
 def analyze_results(matches):
     """Analyze and display results."""
 
@@ -385,7 +242,7 @@ def main():
     print("  - e↔o vowel substitution")
     print("  - Word reversal")
     print("  - Consonant shifts: ch↔sh, t↔d, p↔b, f↔v, g↔k, c↔k")
-    print("  - All combinations")
+    print(f"  - All combinations up to transform cost {MAX_TRANSFORM_COST}")
 
     # Search
     matches, me_word_to_matches = search_vocabulary_exhaustively()
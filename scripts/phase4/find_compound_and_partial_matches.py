@@ -9,9 +9,13 @@ Strategy: Many Voynich words might be:
 """
 
 import json
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.aho_corasick import AhoCorasick
+
 
 def load_data():
     """Load vocabulary and Voynich text."""
@@ -131,6 +135,10 @@ def find_partial_matches(vocab, voynich_freqs):
             if len(variant) >= 3:
                 me_variants[variant] = (me_word, me_data)
 
+    # One automaton over every variant; pattern ids follow me_variants order
+    variant_list = list(me_variants)
+    matcher = AhoCorasick(variant_list)
+
     partial_matches = []
 
     # Get mid-frequency Voynich words
@@ -146,33 +154,32 @@ def find_partial_matches(vocab, voynich_freqs):
         if checked % 200 == 0:
             print(f"  Checked {checked}/{len(target_words)}...")
 
-        # Check if any ME variant is substring
-        for me_variant, (me_word, me_data) in me_variants.items():
-            if (
-                len(me_variant) >= 3
-                and me_variant in voynich_word
-                and me_variant != voynich_word
-            ):
-                # Found partial match
-                position = voynich_word.index(me_variant)
-                prefix = voynich_word[:position]
-                suffix = voynich_word[position + len(me_variant) :]
-
-                partial_matches.append(
-                    {
-                        "voynich_word": voynich_word,
-                        "frequency": freq,
-                        "me_word": me_word,
-                        "me_variant": me_variant,
-                        "meaning": me_data["meaning"],
-                        "category": me_data["category"],
-                        "prefix": prefix,
-                        "suffix": suffix,
-                        "position": "prefix"
-                        if prefix
-                        else ("suffix" if suffix else "both"),
-                    }
-                )
+        # Every embedded ME variant in one pass, with its leftmost position
+        for variant_id, position in sorted(matcher.first_occurrences(voynich_word).items()):
+            me_variant = variant_list[variant_id]
+            if me_variant == voynich_word:
+                continue
+
+            # Found partial match
+            me_word, me_data = me_variants[me_variant]
+            prefix = voynich_word[:position]
+            suffix = voynich_word[position + len(me_variant) :]
+
+            partial_matches.append(
+                {
+                    "voynich_word": voynich_word,
+                    "frequency": freq,
+                    "me_word": me_word,
+                    "me_variant": me_variant,
+                    "meaning": me_data["meaning"],
+                    "category": me_data["category"],
+                    "prefix": prefix,
+                    "suffix": suffix,
+                    "position": "prefix"
+                    if prefix
+                    else ("suffix" if suffix else "both"),
+                }
+            )
 
     print(f"\nFound {len(partial_matches)} partial matches")
 
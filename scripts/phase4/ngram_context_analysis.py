@@ -13,9 +13,15 @@ we can infer their grammatical function even without phonetic matching.
 """
 
 import json
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.token_array import TokenArray
+
 
 def load_voynich_text():
     """Load Voynich text as word list."""
@@ -107,29 +113,35 @@ def find_ngrams_around_anchors(words, anchor_variants, window_size=3):
     after_counts = Counter()
     contexts = []
 
-    for i, word in enumerate(words):
-        if word.lower() in anchor_variants:
-            # Get context window
-            before = words[max(0, i - window_size) : i]
-            after = words[i + 1 : min(len(words), i + 1 + window_size)]
-
-            # Count immediate neighbors
-            if before:
-                before_counts[before[-1]] += 1  # Word immediately before
-            if after:
-                after_counts[after[0]] += 1  # Word immediately after
-
-            # Store full context
-            contexts.append(
-                {
-                    "position": i,
-                    "anchor": word,
-                    "before": before,
-                    "after": after,
-                    "before_1": before[-1] if before else None,
-                    "after_1": after[0] if after else None,
-                }
-            )
+    # Locate anchors with one vectorized lookup over the interned corpus,
+    # then visit only the anchor positions
+    tokens = TokenArray.from_words(words)
+    is_anchor = tokens.type_mask(lambda w: w.lower() in anchor_variants)
+    anchor_positions = np.flatnonzero(is_anchor[tokens.tokens])
+
+    for i in anchor_positions.tolist():
+        word = words[i]
+        # Get context window
+        before = words[max(0, i - window_size) : i]
+        after = words[i + 1 : min(len(words), i + 1 + window_size)]
+
+        # Count immediate neighbors
+        if before:
+            before_counts[before[-1]] += 1  # Word immediately before
+        if after:
+            after_counts[after[0]] += 1  # Word immediately after
+
+        # Store full context
+        contexts.append(
+            {
+                "position": i,
+                "anchor": word,
+                "before": before,
+                "after": after,
+                "before_1": before[-1] if before else None,
+                "after_1": after[0] if after else None,
+            }
+        )
 
     return before_counts, after_counts, contexts
 
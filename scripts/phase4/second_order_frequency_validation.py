@@ -21,22 +21,25 @@ Validation methods:
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
-import math
 
+import numpy as np
 
-def load_manuscript():
-    """Load manuscript as word list"""
-    transcription_path = Path(
-        "data/voynich/eva_transcription/voynich_eva_takahashi.txt"
-    )
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import load_corpus
+from common.token_array import TokenArray
 
-    with open(transcription_path, "r", encoding="utf-8") as f:
-        text = f.read()
 
-    words = text.lower().split()
-    return words
+def load_manuscript():
+    """
+    Load manuscript as a TokenArray with real sections
+    Sections come from each folio's illustration type ($I) in the IVTFF
+    transcription, stored as a per-token section id
+    """
+    transcription_path = Path("data/voynich/eva_transcription/ZL3b-n.txt")
+    return TokenArray.from_corpus(load_corpus(transcription_path))
 
 
 def load_validated_anchors():
@@ -99,87 +102,65 @@ def calculate_cooccurrence_scores(words, anchors, window_size=5):
     return cooccurrence_scores
 
 
-def calculate_distribution_correlation(words, anchors, word_candidates):
+def calculate_distribution_correlation(tokens, anchors, word_candidates):
     """
     Calculate correlation between candidate word distributions and anchor distributions
 
-    Uses Pearson correlation coefficient on section distributions
+    Uses Pearson correlation coefficient on section distributions. Section
+    histograms for every word come from one grouped count over the token
+    section ids, and all correlations from one matrix operation.
     """
-    sections = {
-        "herbal": (0, 20000),
-        "biological": (20000, 25000),
-        "pharmaceutical": (25000, 32000),
-        "recipes": (32000, 37187),
-    }
+    sections = tokens.sections
+    counts = tokens.section_counts()  # type x section
 
     # Get anchor distribution
-    anchor_dist = {s: 0 for s in sections}
-    for i, word in enumerate(words):
-        if word in anchors:
-            for section_name, (start, end) in sections.items():
-                if start <= i < end:
-                    anchor_dist[section_name] += 1
-                    break
+    anchor_ids = tokens.ids(anchors)
+    anchor_counts = counts[anchor_ids[anchor_ids >= 0]].sum(axis=0)
 
     # Normalize anchor distribution
-    anchor_total = sum(anchor_dist.values())
-    anchor_dist = {s: count / anchor_total for s, count in anchor_dist.items()}
-
-    # Calculate correlation for each candidate
-    correlations = {}
-
-    for candidate in word_candidates:
-        cand_dist = {s: 0 for s in sections}
-
-        for i, word in enumerate(words):
-            if word == candidate:
-                for section_name, (start, end) in sections.items():
-                    if start <= i < end:
-                        cand_dist[section_name] += 1
-                        break
+    anchor_vals = anchor_counts / anchor_counts.sum()
+    anchor_dist = dict(zip(sections, anchor_vals.tolist()))
 
-        # Normalize
-        cand_total = sum(cand_dist.values())
-        if cand_total == 0:
-            continue
-
-        cand_dist = {s: count / cand_total for s, count in cand_dist.items()}
-
-        # Pearson correlation
-        anchor_vals = [anchor_dist[s] for s in sections]
-        cand_vals = [cand_dist[s] for s in sections]
+    # Candidate distributions (candidates never seen are skipped)
+    cand_ids = tokens.ids(word_candidates)
+    present = cand_ids >= 0
+    cand_words = [w for w, keep in zip(word_candidates, present) if keep]
+    cand_counts = counts[cand_ids[present]]
+    cand_totals = cand_counts.sum(axis=1)
+    nonzero = cand_totals > 0
+    cand_words = [w for w, keep in zip(cand_words, nonzero) if keep]
+    cand_vals = cand_counts[nonzero] / cand_totals[nonzero, np.newaxis]
 
-        correlation = pearson_correlation(anchor_vals, cand_vals)
+    correlation = pearson_rows(cand_vals, anchor_vals)
 
+    correlations = {}
+    for i, candidate in enumerate(cand_words):
         correlations[candidate] = {
-            "correlation": correlation,
-            "distribution": cand_dist,
-            "total_count": cand_total,
+            "correlation": float(correlation[i]),
+            "distribution": dict(zip(sections, cand_vals[i].tolist())),
+            "total_count": int(cand_totals[nonzero][i]),
         }
 
     return correlations, anchor_dist
 
 
-def pearson_correlation(x, y):
-    """Calculate Pearson correlation coefficient"""
-    n = len(x)
-    if n != len(y):
-        return 0
-
-    mean_x = sum(x) / n
-    mean_y = sum(y) / n
-
-    numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-
-    sum_sq_x = sum((x[i] - mean_x) ** 2 for i in range(n))
-    sum_sq_y = sum((y[i] - mean_y) ** 2 for i in range(n))
-
-    denominator = math.sqrt(sum_sq_x * sum_sq_y)
+def pearson_rows(matrix, vector):
+    """
+    Pearson correlation of every row of matrix with vector
+    (0 where either side has no variance)
+    """
+    centered = matrix - matrix.mean(axis=1, keepdims=True)
+    centered_vec = vector - vector.mean()
 
-    if denominator == 0:
-        return 0
+    numerator = centered @ centered_vec
+    denominator = np.sqrt((centered**2).sum(axis=1) * (centered_vec**2).sum())
 
-    return numerator / denominator
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator, dtype=float),
+        where=denominator > 0,
+    )
 
 
 def test_morphological_consistency(word, known_morphemes):
@@ -230,10 +211,12 @@ def test_morphological_consistency(word, known_morphemes):
     return {"score": min(score, 1.0), "affixes": matched_affixes, "root": word}
 
 
-def validate_candidates(words, anchors, min_freq=20):
+def validate_candidates(tokens, anchors, min_freq=20):
     """
     Main validation pipeline: combine all validation methods
     """
+    words = tokens.decode(tokens.tokens)
+
     print("Calculating co-occurrence scores...")
     cooccurrence_scores = calculate_cooccurrence_scores(words, anchors["all"])
 
@@ -248,7 +231,7 @@ def validate_candidates(words, anchors, min_freq=20):
     # Calculate distribution correlations
     print("Calculating distribution correlations...")
     correlations, anchor_dist = calculate_distribution_correlation(
-        words, anchors["all"], candidates
+        tokens, anchors["all"], candidates
     )
 
     # Test morphological consistency
@@ -371,8 +354,10 @@ def main():
 
     # Load data
     print("Loading manuscript...")
-    words = load_manuscript()
+    tokens = load_manuscript()
+    words = tokens.decode(tokens.tokens)
     print(f"Total words: {len(words):,}")
+    print(f"Sections: {', '.join(tokens.sections)}")
 
     anchors = load_validated_anchors()
     print(f"Validated anchors: {len(anchors['all'])} words")
@@ -387,7 +372,7 @@ def main():
     print("=" * 80)
     print()
 
-    validated, anchor_dist = validate_candidates(words, anchors, min_freq=20)
+    validated, anchor_dist = validate_candidates(tokens, anchors, min_freq=20)
 
     print(f"Validated {len(validated)} candidate words")
     print()
@@ -27,7 +27,12 @@ FIXED GRAMMATICAL SYSTEM (same as Phase 5A, no changes):
 """
 
 import re
+import sys
 from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.word_grammar import FIXED_GRAMMAR
 
 
 def load_folio(filepath, folio_id):
@@ -77,118 +82,11 @@ def load_folio(filepath, folio_id):
 
 
 def parse_word_fixed_grammar(word):
-    """Parse word using FIXED grammatical system (no modifications allowed)"""
-    components = {
-        "roots": [],
-        "function_words": [],
-        "suffixes": [],
-        "unknown": [],
-    }
-
-    remaining = word
-
-    # 1. Semantic roots
-    if word.startswith("qok"):
-        components["roots"].append("oak-GEN")
-        remaining = word[3:]
-    elif word.startswith("qot"):
-        components["roots"].append("oat-GEN")
-        remaining = word[3:]
-    elif word.startswith("ok"):
-        components["roots"].append("oak")
-        remaining = word[2:]
-    elif word.startswith("ot"):
-        components["roots"].append("oat")
-        remaining = word[2:]
-
-    if "shee" in remaining:
-        components["roots"].append("water")
-        remaining = remaining.replace("shee", "", 1)
-    elif "she" in remaining:
-        components["roots"].append("water")
-        remaining = remaining.replace("she", "", 1)
-
-    if "cho" in remaining and "cheo" not in remaining:
-        components["roots"].append("vessel")
-        remaining = remaining.replace("cho", "", 1)
-
-    if "cheo" in remaining:
-        components["roots"].append("CHEO")
-        remaining = remaining.replace("cheo", "", 1)
-
-    if "dor" in remaining:
-        components["roots"].append("red")
-        remaining = remaining.replace("dor", "", 1)
-
-    # 2. Function words
-    if "qol" in remaining:
-        components["function_words"].append("THEN")
-        remaining = remaining.replace("qol", "", 1)
-
-    if "sal" in remaining:
-        components["function_words"].append("AND")
-        remaining = remaining.replace("sal", "", 1)
-
-    if "dain" in remaining or "dai!n" in remaining:
-        components["function_words"].append("THAT")
-        remaining = remaining.replace("dain", "", 1).replace("dai!n", "", 1)
-
-    if remaining.endswith("ory"):
-        components["suffixes"].append("ADV")
-        remaining = remaining[:-3]
-
-    # 3. Verbal suffix
-    if "edy" in remaining:
-        components["suffixes"].append("VERB")
-        remaining = remaining.replace("edy", "", 1)
-    elif remaining.endswith("dy"):
-        components["suffixes"].append("VERB")
-        remaining = remaining[:-2]
-
-    # 4. Definiteness markers
-    if "aiin" in remaining:
-        components["suffixes"].append("DEF")
-        remaining = remaining.replace("aiin", "", 1)
-    elif "iin" in remaining:
-        components["suffixes"].append("DEF")
-        remaining = remaining.replace("iin", "", 1)
-    elif "ain" in remaining:
-        components["suffixes"].append("DEF")
-        remaining = remaining.replace("ain", "", 1)
-
-    # 5. Case markers
-    if "al" in remaining:
-        components["suffixes"].append("LOC")
-        remaining = remaining.replace("al", "", 1)
-    if "ar" in remaining:
-        components["suffixes"].append("DIR")
-        remaining = remaining.replace("ar", "", 1)
-    if "or" in remaining:
-        components["suffixes"].append("INST")
-        remaining = remaining.replace("or", "", 1)
-    if "ol" in remaining:
-        components["suffixes"].append("LOC2")
-        remaining = remaining.replace("ol", "", 1)
-
-    # 6. Unknown remainder
-    if remaining and remaining not in [
-        "",
-        "k",
-        "ch",
-        "p",
-        "s",
-        "l",
-        "d",
-        "y",
-        "e",
-        "!",
-        "t",
-        "c",
-        "h",
-    ]:
-        components["unknown"].append(remaining)
-
-    return components
+    """
+    Parse word using FIXED grammatical system (no modifications allowed)
+    (rules in common/word_grammar.py, parsed once per word type)
+    """
+    return FIXED_GRAMMAR.parse(word)
 
 
 def format_parsed_word(word, components):
@@ -17,133 +17,19 @@ Suffix system:
 Suffix chaining: Root + CASE + DEFINITENESS (e.g., okar + aiin)
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.word_grammar import COMPLETE_GRAMMAR
+
 
 def decompose_word_complete(word):
     """
     Complete morphological decomposition with full grammatical system
+    (rules in common/word_grammar.py, parsed once per word type)
     """
-    original = word
-    components = {
-        "root": [],
-        "verbal": False,
-        "cases": [],
-        "definiteness": [],
-        "function_words": [],
-    }
-
-    remaining = word
-
-    # 1. Check for genitive prefix
-    if word.startswith("qok"):
-        components["root"].append("oak")
-        components["cases"].append("GEN")
-        remaining = word[3:]
-    elif word.startswith("qot"):
-        components["root"].append("oat")
-        components["cases"].append("GEN")
-        remaining = word[3:]
-    elif word.startswith("ok"):
-        components["root"].append("oak")
-        remaining = word[2:]
-    elif word.startswith("ot"):
-        components["root"].append("oat")
-        remaining = word[2:]
-
-    # 2. Check for semantic roots in remaining
-    if "shee" in remaining:
-        components["root"].append("water")
-        remaining = remaining.replace("shee", "", 1)
-    elif "she" in remaining:
-        components["root"].append("water")
-        remaining = remaining.replace("she", "", 1)
-
-    if "cho" in remaining and "cheo" not in remaining:
-        components["root"].append("vessel")
-        remaining = remaining.replace("cho", "", 1)
-
-    if "cheo" in remaining:
-        components["root"].append("CHEO")
-        remaining = remaining.replace("cheo", "", 1)
-
-    if "dor" in remaining:
-        components["root"].append("red")
-        remaining = remaining.replace("dor", "", 1)
-
-    # 3. Check for function words
-    if "qol" in remaining:
-        components["function_words"].append("THEN")
-        remaining = remaining.replace("qol", "", 1)
-
-    if "sal" in remaining:
-        components["function_words"].append("AND")
-        remaining = remaining.replace("sal", "", 1)
-
-    if "dain" in remaining or "dai!n" in remaining:
-        components["function_words"].append("THAT")
-        remaining = remaining.replace("dain", "", 1).replace("dai!n", "", 1)
-
-    # 4. Check for verbal suffix (-dy/-edy)
-    if "edy" in remaining:
-        components["verbal"] = True
-        remaining = remaining.replace("edy", "", 1)
-    elif remaining.endswith("dy"):
-        components["verbal"] = True
-        remaining = remaining[:-2]
-    elif "dy" in remaining and len(remaining) > 3:
-        components["verbal"] = True
-        remaining = remaining.replace("dy", "", 1)
-
-    # 5. Check for derivational -ory suffix
-    if remaining.endswith("ory"):
-        components["function_words"].append("ADV")
-        remaining = remaining[:-3]
-
-    # 6. Check for definiteness markers (can chain!)
-    if "aiin" in remaining:
-        components["definiteness"].append("DEF")
-        remaining = remaining.replace("aiin", "", 1)
-    elif "iin" in remaining:
-        components["definiteness"].append("DEF")
-        remaining = remaining.replace("iin", "", 1)
-    elif "ain" in remaining:
-        components["definiteness"].append("DEF")
-        remaining = remaining.replace("ain", "", 1)
-
-    # 7. Check for case markers (can chain!)
-    cases_found = []
-    if "al" in remaining:
-        cases_found.append("LOC")
-        remaining = remaining.replace("al", "", 1)
-    if "ar" in remaining:
-        cases_found.append("DIR")
-        remaining = remaining.replace("ar", "", 1)
-    if "or" in remaining:
-        cases_found.append("INST/ABL")
-        remaining = remaining.replace("or", "", 1)
-    if "ol" in remaining:
-        cases_found.append("LOC2")
-        remaining = remaining.replace("ol", "", 1)
-
-    components["cases"].extend(cases_found)
-
-    # 8. What's left?
-    if remaining and remaining not in [
-        "",
-        "k",
-        "ch",
-        "p",
-        "s",
-        "l",
-        "d",
-        "y",
-        "e",
-        "!",
-        "ey",
-        "y",
-    ]:
-        components["root"].append(f"[{remaining}]")
-
-    return components
+    return COMPLETE_GRAMMAR.parse(word)
 
 
 def format_translation(word, components):
@@ -6,14 +6,15 @@ Look at sentences containing key pharmaceutical elements and analyze their struc
 """
 
 import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.translation_columns import load_translation
 
 
 def load_data():
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        data = json.load(f)
-    return data["translations"]
+    return load_translation("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json").sentence_records()
 
 
 def analyze_al_sentences(translations):
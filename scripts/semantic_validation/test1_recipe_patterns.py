@@ -27,12 +27,20 @@ from pathlib import Path
 from collections import defaultdict, Counter
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.null_models import summarize_null
+from common.sequence_patterns import SequencePatternSet
+from common.translation_columns import load_translation
 
-def load_json_file(filepath):
-    """Load JSON data from file."""
+PATTERN_WINDOW = 10
+N_SHUFFLES = 1000
+SEED = 42
+
+
+def load_translations(filepath):
+    """Load per-sentence translations (sentence-level fields, shared columnar cache)."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_translation(filepath).sentence_records()
     except FileNotFoundError:
         print(f"Error: Could not find {filepath}")
         sys.exit(1)
@@ -58,32 +66,15 @@ def has_pattern_sequence(tokens, pattern_elements, window=5):
     Returns:
         True if pattern found, False otherwise
     """
-    if not pattern_elements:
-        return False
-
-    # Find positions of each pattern element
-    positions = []
-    for element in pattern_elements:
-        found_positions = []
-        for i, token in enumerate(tokens):
-            if element in token:
-                found_positions.append(i)
-        if not found_positions:
-            return False  # Element not found at all
-        positions.append(found_positions)
-
-    # Check if we can find a valid sequence
-    def check_sequence(pos_lists, current_pos=-1, depth=0):
-        if depth >= len(pos_lists):
-            return True
-
-        for pos in pos_lists[depth]:
-            if pos > current_pos and (current_pos == -1 or pos - current_pos <= window):
-                if check_sequence(pos_lists, pos, depth + 1):
-                    return True
-        return False
-
-    return check_sequence(positions)
+    matcher = SequencePatternSet({"pattern": pattern_elements}, window=window)
+    return bool(matcher.match(tokens))
+
+
+def build_pattern_matcher(patterns, window=PATTERN_WINDOW):
+    """Compile every recipe pattern into one sequence automaton."""
+    return SequencePatternSet(
+        {name: data["elements"] for name, data in patterns.items()}, window=window
+    )
 
 
 def find_recipe_patterns(translations):
@@ -162,21 +153,21 @@ def find_recipe_patterns(translations):
         },
     }
 
-    # Search for patterns
+    # Search for patterns: one automaton pass per sentence
+    matcher = build_pattern_matcher(patterns)
     for trans in translations:
         folio = trans.get("folio", "unknown")
         sentence = trans["final_translation"]
         tokens = parse_sentence_to_tokens(sentence)
 
-        for pattern_name, pattern_data in patterns.items():
-            if has_pattern_sequence(tokens, pattern_data["elements"], window=10):
-                patterns[pattern_name]["matches"].append(
-                    {
-                        "folio": folio,
-                        "sentence": sentence,
-                        "original": trans.get("original", ""),
-                    }
-                )
+        for pattern_name in matcher.match(tokens):
+            patterns[pattern_name]["matches"].append(
+                {
+                    "folio": folio,
+                    "sentence": sentence,
+                    "original": trans.get("original", ""),
+                }
+            )
 
     return patterns
 
@@ -242,6 +233,22 @@ def calculate_baseline(translations):
     return expected_random
 
 
+def calculate_shuffle_baseline(
+    translations, patterns, n_replicates=N_SHUFFLES, seed=SEED
+):
+    """
+    Permutation baseline: match counts with the word order shuffled inside
+    every sentence (same words, same sentence lengths), n_replicates times.
+    """
+    matcher = build_pattern_matcher(patterns)
+    sentences = [parse_sentence_to_tokens(t["final_translation"]) for t in translations]
+    null = matcher.shuffle_null(sentences, n_replicates=n_replicates, seed=seed)
+    return {
+        name: summarize_null(len(patterns[name]["matches"]), null[:, i])
+        for i, name in enumerate(matcher.names)
+    }
+
+
 def main():
     print("=" * 80)
     print("SEMANTIC VALIDATION TEST 1: RECIPE PATTERN FREQUENCY")
@@ -258,8 +265,7 @@ def main():
 
     # Load data
     print("Loading translation data...")
-    data = load_json_file("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json")
-    translations = data["translations"]
+    translations = load_translations("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json")
     total_sentences = len(translations)
     print(f"Loaded {total_sentences} sentences")
     print()
@@ -326,6 +332,21 @@ def main():
             print(f"  Enrichment: {enrichment:.1f}×")
             print()
 
+    print(f"SHUFFLED WORD-ORDER BASELINE ({N_SHUFFLES} replicates):")
+    print()
+    shuffle_baseline = calculate_shuffle_baseline(translations, patterns)
+    results["shuffle_baseline"] = shuffle_baseline
+
+    for pattern_name, summary in shuffle_baseline.items():
+        print(f"{pattern_name}:")
+        print(
+            f"  Shuffled: {summary['null_mean']:.1f} "
+            f"[{summary['ci_low']:.0f}, {summary['ci_high']:.0f}]"
+        )
+        print(f"  Observed: {summary['observed']:.0f}")
+        print(f"  p (observed > shuffled): {summary['p_value_greater']:.4f}")
+        print()
+
     # Interpretation
     print("=" * 80)
     print("INTERPRETATION")
@@ -24,15 +24,27 @@ SUCCESS CRITERIA:
 import json
 import sys
 from collections import defaultdict, Counter
+from pathlib import Path
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.enrichment import pool_sections, rate_ratios
+from common.translation_columns import load_translation
+
+# Per-sentence counts compared between botanical and non-botanical sections
+TERMS = [
+    "al_count",
+    "botanical_count",
+    "oak_gen_count",
+    "oat_gen_count",
+    "vessel_count",
+    "water_count",
+]
+FIELDS = ["sentence_count"] + TERMS
+
 
 def load_data():
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        data = json.load(f)
-    return data["translations"]
+    return load_translation("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json").sentence_records()
 
 
 def extract_folio_section(folio_id):
@@ -134,75 +146,33 @@ def calculate_enrichment(sections):
     """Calculate enrichment ratios comparing botanical vs non-botanical sections."""
 
     # Combine herbal sections
-    herbal_combined = {
-        "sentence_count": sections["herbal_a"]["sentence_count"]
-        + sections["herbal_b"]["sentence_count"],
-        "al_count": sections["herbal_a"]["al_count"] + sections["herbal_b"]["al_count"],
-        "botanical_count": sections["herbal_a"]["botanical_count"]
-        + sections["herbal_b"]["botanical_count"],
-        "oak_gen_count": sections["herbal_a"]["oak_gen_count"]
-        + sections["herbal_b"]["oak_gen_count"],
-        "oat_gen_count": sections["herbal_a"]["oat_gen_count"]
-        + sections["herbal_b"]["oat_gen_count"],
-        "vessel_count": sections["herbal_a"]["vessel_count"]
-        + sections["herbal_b"]["vessel_count"],
-        "water_count": sections["herbal_a"]["water_count"]
-        + sections["herbal_b"]["water_count"],
-    }
+    herbal_combined = pool_sections(
+        sections, ["herbal_a", "herbal_b"], FIELDS, exposure="sentence_count"
+    )
 
     # Combine non-botanical sections
-    non_botanical = {
-        "sentence_count": sections["astronomical"]["sentence_count"]
-        + sections["biological"]["sentence_count"]
-        + sections["stars"]["sentence_count"],
-        "al_count": sections["astronomical"]["al_count"]
-        + sections["biological"]["al_count"]
-        + sections["stars"]["al_count"],
-        "botanical_count": sections["astronomical"]["botanical_count"]
-        + sections["biological"]["botanical_count"]
-        + sections["stars"]["botanical_count"],
-        "oak_gen_count": sections["astronomical"]["oak_gen_count"]
-        + sections["biological"]["oak_gen_count"]
-        + sections["stars"]["oak_gen_count"],
-        "oat_gen_count": sections["astronomical"]["oat_gen_count"]
-        + sections["biological"]["oat_gen_count"]
-        + sections["stars"]["oat_gen_count"],
-        "vessel_count": sections["astronomical"]["vessel_count"]
-        + sections["biological"]["vessel_count"]
-        + sections["stars"]["vessel_count"],
-        "water_count": sections["astronomical"]["water_count"]
-        + sections["biological"]["water_count"]
-        + sections["stars"]["water_count"],
-    }
-
-    enrichment = {}
+    non_botanical = pool_sections(
+        sections,
+        ["astronomical", "biological", "stars"],
+        FIELDS,
+        exposure="sentence_count",
+    )
 
-    for term in [
-        "al_count",
-        "botanical_count",
-        "oak_gen_count",
-        "oat_gen_count",
-        "vessel_count",
-        "water_count",
-    ]:
-        herbal_freq = (
-            herbal_combined[term] / herbal_combined["sentence_count"]
-            if herbal_combined["sentence_count"] > 0
-            else 0
-        )
-        non_botanical_freq = (
-            non_botanical[term] / non_botanical["sentence_count"]
-            if non_botanical["sentence_count"] > 0
-            else 0
-        )
+    # Per-sentence rates of every term in both groups at once
+    herbal_freqs, non_botanical_freqs, ratios = rate_ratios(
+        herbal_combined, non_botanical, TERMS, zero=0
+    )
 
-        enrichment[term] = {
+    enrichment = {
+        term: {
             "herbal_freq": herbal_freq,
             "non_botanical_freq": non_botanical_freq,
-            "enrichment_ratio": herbal_freq / non_botanical_freq
-            if non_botanical_freq > 0
-            else 0,
+            "enrichment_ratio": ratio,
         }
+        for term, herbal_freq, non_botanical_freq, ratio in zip(
+            TERMS, herbal_freqs, non_botanical_freqs, ratios
+        )
+    }
 
     return enrichment, herbal_combined, non_botanical
 
@@ -276,7 +246,12 @@ def main():
     print("=" * 80)
     print()
 
-    enrichment, herbal, non_botanical = calculate_enrichment(sections)
+    try:
+        enrichment, herbal, non_botanical = calculate_enrichment(sections)
+    except (KeyError, ValueError) as e:
+        print(f"ERROR: Cannot calculate enrichment - {e.args[0]}")
+        print("This suggests the folio mapping didn't work correctly.")
+        return
 
     print(f"HERBAL SECTIONS (combined): {herbal['sentence_count']} sentences")
     print(
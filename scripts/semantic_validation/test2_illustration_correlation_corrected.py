@@ -8,15 +8,28 @@ across manuscript sections.
 
 import json
 import re
+import sys
 from collections import defaultdict, Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.enrichment import pool_sections, rate_ratios
+from common.translation_columns import load_translation
+
+# Per-sentence counts compared between botanical and non-botanical sections
+TERMS = [
+    "al_count",
+    "botanical_count",
+    "oak_gen_count",
+    "oat_gen_count",
+    "vessel_count",
+    "water_count",
+]
+FIELDS = ["sentence_count"] + TERMS
 
 
 def load_data():
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        data = json.load(f)
-    return data["translations"]
+    return load_translation("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json").sentence_records()
 
 
 def load_folio_mapping():
@@ -147,76 +160,33 @@ def calculate_enrichment(sections):
     """Calculate enrichment comparing botanical sections vs non-botanical"""
 
     # Herbal + Pharmaceutical = botanical sections
-    botanical_combined = {
-        "sentence_count": sections["herbal"]["sentence_count"]
-        + sections["pharmaceutical"]["sentence_count"],
-        "al_count": sections["herbal"]["al_count"]
-        + sections["pharmaceutical"]["al_count"],
-        "botanical_count": sections["herbal"]["botanical_count"]
-        + sections["pharmaceutical"]["botanical_count"],
-        "oak_gen_count": sections["herbal"]["oak_gen_count"]
-        + sections["pharmaceutical"]["oak_gen_count"],
-        "oat_gen_count": sections["herbal"]["oat_gen_count"]
-        + sections["pharmaceutical"]["oat_gen_count"],
-        "vessel_count": sections["herbal"]["vessel_count"]
-        + sections["pharmaceutical"]["vessel_count"],
-        "water_count": sections["herbal"]["water_count"]
-        + sections["pharmaceutical"]["water_count"],
-    }
+    botanical_combined = pool_sections(
+        sections, ["herbal", "pharmaceutical"], FIELDS, exposure="sentence_count"
+    )
 
     # Astronomical + Biological + Stars = non-botanical
-    non_botanical = {
-        "sentence_count": sections["astronomical"]["sentence_count"]
-        + sections["biological"]["sentence_count"]
-        + sections["stars"]["sentence_count"],
-        "al_count": sections["astronomical"]["al_count"]
-        + sections["biological"]["al_count"]
-        + sections["stars"]["al_count"],
-        "botanical_count": sections["astronomical"]["botanical_count"]
-        + sections["biological"]["botanical_count"]
-        + sections["stars"]["botanical_count"],
-        "oak_gen_count": sections["astronomical"]["oak_gen_count"]
-        + sections["biological"]["oak_gen_count"]
-        + sections["stars"]["oak_gen_count"],
-        "oat_gen_count": sections["astronomical"]["oat_gen_count"]
-        + sections["biological"]["oat_gen_count"]
-        + sections["stars"]["oat_gen_count"],
-        "vessel_count": sections["astronomical"]["vessel_count"]
-        + sections["biological"]["vessel_count"]
-        + sections["stars"]["vessel_count"],
-        "water_count": sections["astronomical"]["water_count"]
-        + sections["biological"]["water_count"]
-        + sections["stars"]["water_count"],
-    }
-
-    enrichment = {}
+    non_botanical = pool_sections(
+        sections,
+        ["astronomical", "biological", "stars"],
+        FIELDS,
+        exposure="sentence_count",
+    )
 
-    for term in [
-        "al_count",
-        "botanical_count",
-        "oak_gen_count",
-        "oat_gen_count",
-        "vessel_count",
-        "water_count",
-    ]:
-        bot_freq = (
-            botanical_combined[term] / botanical_combined["sentence_count"]
-            if botanical_combined["sentence_count"] > 0
-            else 0
-        )
-        non_bot_freq = (
-            non_botanical[term] / non_botanical["sentence_count"]
-            if non_botanical["sentence_count"] > 0
-            else 0
-        )
+    # Per-sentence rates of every term in both groups at once
+    bot_freqs, non_bot_freqs, ratios = rate_ratios(
+        botanical_combined, non_botanical, TERMS
+    )
 
-        enrichment[term] = {
+    enrichment = {
+        term: {
             "botanical_freq": bot_freq,
             "non_botanical_freq": non_bot_freq,
-            "enrichment_ratio": bot_freq / non_bot_freq
-            if non_bot_freq > 0
-            else float("inf"),
+            "enrichment_ratio": ratio,
         }
+        for term, bot_freq, non_bot_freq, ratio in zip(
+            TERMS, bot_freqs, non_bot_freqs, ratios
+        )
+    }
 
     return enrichment, botanical_combined, non_botanical
 
@@ -287,7 +257,12 @@ def main():
     print("=" * 80)
     print()
 
-    enrichment, botanical, non_botanical = calculate_enrichment(sections)
+    try:
+        enrichment, botanical, non_botanical = calculate_enrichment(sections)
+    except (KeyError, ValueError) as e:
+        print(f"ERROR: Cannot calculate enrichment - {e.args[0]}")
+        print("This suggests the folio mapping didn't work correctly.")
+        return
 
     print(
         f"BOTANICAL SECTIONS (Herbal + Pharmaceutical): {botanical['sentence_count']} sentences"
@@ -8,16 +8,29 @@ frequency in herbal vs non-herbal sections.
 
 import json
 import re
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.enrichment import pool_sections, rate_ratios
+from common.translation_columns import load_translation
+
+# Per-sentence counts compared between botanical and non-botanical sections
+TERMS = [
+    "al_count",
+    "botanical_count",
+    "oak_gen_count",
+    "oat_gen_count",
+    "vessel_count",
+    "water_count",
+]
+FIELDS = ["sentence_count"] + TERMS
 
 
 def load_translations():
-    """Load translation data"""
-    with open(
-        "COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8"
-    ) as f:
-        data = json.load(f)
-    return data["translations"]
+    """Load translation data (sentence-level fields, shared columnar cache)"""
+    return load_translation("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json").sentence_records()
 
 
 def build_folio_mapping():
@@ -162,82 +175,31 @@ def count_terms_by_section(translations, line_to_folio):
 def calculate_enrichment(sections):
     """Calculate enrichment: botanical sections vs non-botanical"""
 
-    # Combine botanical sections (herbal + pharmaceutical)
-    botanical = {
-        "sentence_count": sections.get("herbal", {}).get("sentence_count", 0)
-        + sections.get("pharmaceutical", {}).get("sentence_count", 0),
-        "al_count": sections.get("herbal", {}).get("al_count", 0)
-        + sections.get("pharmaceutical", {}).get("al_count", 0),
-        "botanical_count": sections.get("herbal", {}).get("botanical_count", 0)
-        + sections.get("pharmaceutical", {}).get("botanical_count", 0),
-        "oak_gen_count": sections.get("herbal", {}).get("oak_gen_count", 0)
-        + sections.get("pharmaceutical", {}).get("oak_gen_count", 0),
-        "oat_gen_count": sections.get("herbal", {}).get("oat_gen_count", 0)
-        + sections.get("pharmaceutical", {}).get("oat_gen_count", 0),
-        "vessel_count": sections.get("herbal", {}).get("vessel_count", 0)
-        + sections.get("pharmaceutical", {}).get("vessel_count", 0),
-        "water_count": sections.get("herbal", {}).get("water_count", 0)
-        + sections.get("pharmaceutical", {}).get("water_count", 0),
-    }
-
-    # Combine non-botanical sections
-    non_botanical = {
-        "sentence_count": sections.get("astronomical", {}).get("sentence_count", 0)
-        + sections.get("biological", {}).get("sentence_count", 0)
-        + sections.get("stars", {}).get("sentence_count", 0),
-        "al_count": sections.get("astronomical", {}).get("al_count", 0)
-        + sections.get("biological", {}).get("al_count", 0)
-        + sections.get("stars", {}).get("al_count", 0),
-        "botanical_count": sections.get("astronomical", {}).get("botanical_count", 0)
-        + sections.get("biological", {}).get("botanical_count", 0)
-        + sections.get("stars", {}).get("botanical_count", 0),
-        "oak_gen_count": sections.get("astronomical", {}).get("oak_gen_count", 0)
-        + sections.get("biological", {}).get("oak_gen_count", 0)
-        + sections.get("stars", {}).get("oak_gen_count", 0),
-        "oat_gen_count": sections.get("astronomical", {}).get("oat_gen_count", 0)
-        + sections.get("biological", {}).get("oat_gen_count", 0)
-        + sections.get("stars", {}).get("oat_gen_count", 0),
-        "vessel_count": sections.get("astronomical", {}).get("vessel_count", 0)
-        + sections.get("biological", {}).get("vessel_count", 0)
-        + sections.get("stars", {}).get("vessel_count", 0),
-        "water_count": sections.get("astronomical", {}).get("water_count", 0)
-        + sections.get("biological", {}).get("water_count", 0)
-        + sections.get("stars", {}).get("water_count", 0),
-    }
+    # Herbal + Pharmaceutical = botanical sections
+    botanical = pool_sections(
+        sections, ["herbal", "pharmaceutical"], FIELDS, allow_missing=True
+    )
 
-    enrichment = {}
-
-    for term in [
-        "al_count",
-        "botanical_count",
-        "oak_gen_count",
-        "oat_gen_count",
-        "vessel_count",
-        "water_count",
-    ]:
-        bot_freq = (
-            botanical[term] / botanical["sentence_count"]
-            if botanical["sentence_count"] > 0
-            else 0
-        )
-        non_bot_freq = (
-            non_botanical[term] / non_botanical["sentence_count"]
-            if non_botanical["sentence_count"] > 0
-            else 0
-        )
+    # Astronomical + Biological + Stars = non-botanical
+    non_botanical = pool_sections(
+        sections, ["astronomical", "biological", "stars"], FIELDS, allow_missing=True
+    )
 
-        if non_bot_freq > 0:
-            ratio = bot_freq / non_bot_freq
-        elif bot_freq > 0:
-            ratio = float("inf")
-        else:
-            ratio = 1.0
+    # Per-sentence rates of every term in both groups at once
+    bot_freqs, non_bot_freqs, ratios = rate_ratios(
+        botanical, non_botanical, TERMS, undefined=1.0
+    )
 
-        enrichment[term] = {
+    enrichment = {
+        term: {
             "botanical_freq": bot_freq,
             "non_botanical_freq": non_bot_freq,
             "enrichment_ratio": ratio,
         }
+        for term, bot_freq, non_bot_freq, ratio in zip(
+            TERMS, bot_freqs, non_bot_freqs, ratios
+        )
+    }
 
     return enrichment, botanical, non_botanical
 
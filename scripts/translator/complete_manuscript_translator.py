@@ -5,11 +5,15 @@ Uses all 47 validated morphological elements + semantic meanings
 Applies reversal hypothesis for enhanced recognition
 """
 
+import os
 import re
 import json
+import shutil
+from itertools import islice
+from multiprocessing import Pool
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 
 # ============================================================================
 # SEMANTIC DICTIONARY - All Known Meanings
@@ -103,6 +107,70 @@ REVERSAL_DICT = {
     "pain": ["pain", "condition"],
 }
 
+# ============================================================================
+# AFFIX TRIES - Built once from PREFIXES / SUFFIXES
+# ============================================================================
+
+# Key marking "an affix ends here" inside a trie node (never a valid EVA char)
+TRIE_END = "$"
+
+
+def build_affix_trie(affixes, reverse: bool = False) -> Dict:
+    """
+    Build a character trie over affixes.
+    With reverse=True the affixes are inserted back-to-front, so the trie
+    can be walked from the end of a word (used for suffixes).
+    """
+    trie = {}
+    for affix in affixes:
+        node = trie
+        for char in reversed(affix) if reverse else affix:
+            node = node.setdefault(char, {})
+        node[TRIE_END] = affix
+    return trie
+
+
+PREFIX_TRIE = build_affix_trie(PREFIXES)
+SUFFIX_TRIE = build_affix_trie(SUFFIXES, reverse=True)
+
+
+def rebuild_affix_tries():
+    """Rebuild the affix tries after PREFIXES or SUFFIXES have been edited."""
+    global PREFIX_TRIE, SUFFIX_TRIE
+    PREFIX_TRIE = build_affix_trie(PREFIXES)
+    SUFFIX_TRIE = build_affix_trie(SUFFIXES, reverse=True)
+
+
+def match_prefix(word: str) -> Optional[str]:
+    """Return the longest prefix of word found in PREFIX_TRIE, or None."""
+    node = PREFIX_TRIE
+    match = None
+    for char in word:
+        node = node.get(char)
+        if node is None:
+            break
+        if TRIE_END in node:
+            match = node[TRIE_END]
+    return match
+
+
+def match_suffix(word: str, start: int, end: int) -> Optional[str]:
+    """
+    Return the longest suffix of word[start:end] found in SUFFIX_TRIE.
+    The suffix must be strictly shorter than word[start:end] so that a
+    non-empty root always remains.
+    """
+    node = SUFFIX_TRIE
+    match = None
+    for i in range(end - 1, start, -1):
+        node = node.get(word[i])
+        if node is None:
+            break
+        if TRIE_END in node:
+            match = node[TRIE_END]
+    return match
+
+
 # ============================================================================
 # TRANSLATION FUNCTIONS
 # ============================================================================
@@ -168,8 +236,6 @@ def segment_morphology(word: str) -> Dict:
         "method": "morphological",
     }
 
-    remaining = word
-
     # Check for known whole words first
     if word in SEMANTIC_MEANINGS:
         result["root"] = word
@@ -177,29 +243,26 @@ def segment_morphology(word: str) -> Dict:
         result["method"] = "whole-word"
         return result
 
-    # Check prefixes (longest first)
-    for prefix in sorted(PREFIXES.keys(), key=len, reverse=True):
-        if remaining.startswith(prefix):
-            result["prefix"] = prefix
-            result["translation"].append(PREFIXES[prefix])
-            remaining = remaining[len(prefix) :]
-            break
-
-    # Check suffixes (longest first, from end)
-    while remaining:
-        suffix_found = False
-        for suffix in sorted(SUFFIXES.keys(), key=len, reverse=True):
-            if remaining.endswith(suffix) and len(remaining) > len(suffix):
-                result["suffixes"].insert(0, suffix)
-                result["translation"].append(SUFFIXES[suffix])
-                remaining = remaining[: -len(suffix)]
-                suffix_found = True
-                break
-
-        if not suffix_found:
+    # Check prefixes (longest first, left-to-right trie walk)
+    start = 0
+    prefix = match_prefix(word)
+    if prefix:
+        result["prefix"] = prefix
+        result["translation"].append(PREFIXES[prefix])
+        start = len(prefix)
+
+    # Check suffixes (longest first, right-to-left trie walk from the end)
+    end = len(word)
+    while start < end:
+        suffix = match_suffix(word, start, end)
+        if suffix is None:
             break
+        result["suffixes"].insert(0, suffix)
+        result["translation"].append(SUFFIXES[suffix])
+        end -= len(suffix)
 
     # What's left is the root
+    remaining = word[start:end]
     if remaining:
         result["root"] = remaining
         if remaining in SEMANTIC_MEANINGS:
@@ -215,7 +278,7 @@ def segment_morphology(word: str) -> Dict:
     return result
 
 
-def translate_word(word: str) -> Dict:
+def translate_word_uncached(word: str) -> Dict:
     """
     Translate a single Voynich word using all available methods.
     Returns dict with translation and metadata.
@@ -261,6 +324,54 @@ def translate_word(word: str) -> Dict:
     return translation
 
 
+# ============================================================================
+# TRANSLATION CACHE - One translation per word type
+# ============================================================================
+
+# The corpus is Zipfian: a few thousand types cover all tokens, so each type
+# is segmented and reversal-checked once. Cached dicts are shared between
+# tokens of the same type and must be treated as read-only.
+TRANSLATION_CACHE: Dict[str, Dict] = {}
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def translate_word(word: str) -> Dict:
+    """
+    Translate a single Voynich word, reusing the cached result for its type.
+    Returns dict with translation and metadata.
+    """
+    translation = TRANSLATION_CACHE.get(word)
+    if translation is not None:
+        CACHE_STATS["hits"] += 1
+        return translation
+
+    CACHE_STATS["misses"] += 1
+    translation = translate_word_uncached(word)
+    TRANSLATION_CACHE[word] = translation
+    return translation
+
+
+def invalidate_translation_cache():
+    """
+    Drop all cached translations and rebuild the affix tries.
+    Must be called after editing SEMANTIC_MEANINGS, PREFIXES, SUFFIXES
+    or REVERSAL_DICT, otherwise stale translations are returned.
+    """
+    TRANSLATION_CACHE.clear()
+    rebuild_affix_tries()
+
+
+def get_cache_stats() -> Dict:
+    """Return hit/miss counters and current size of the translation cache."""
+    lookups = CACHE_STATS["hits"] + CACHE_STATS["misses"]
+    return {
+        "hits": CACHE_STATS["hits"],
+        "misses": CACHE_STATS["misses"],
+        "cached_types": len(TRANSLATION_CACHE),
+        "hit_rate": (CACHE_STATS["hits"] / lookups * 100) if lookups > 0 else 0,
+    }
+
+
 def translate_sentence(sentence: str, folio: str = "") -> Dict:
     """
     Translate a complete sentence.
@@ -303,12 +414,11 @@ def translate_sentence(sentence: str, folio: str = "") -> Dict:
     }
 
 
-def load_manuscript(filepath: Path) -> List[Tuple[str, str]]:
+def iter_manuscript(filepath: Path) -> Iterator[Tuple[str, str]]:
     """
-    Load manuscript from EVA file.
-    Returns list of (folio, text) tuples.
+    Stream manuscript lines from EVA file.
+    Yields (folio, text) tuples one line at a time.
     """
-    sentences = []
     line_number = 0
 
     with open(filepath, "r", encoding="utf-8") as f:
@@ -333,29 +443,25 @@ def load_manuscript(filepath: Path) -> List[Tuple[str, str]]:
             text = re.sub(r"[!%=\-\*\{\}]", "", text)
 
             if text:
-                sentences.append((folio, text))
-
-    return sentences
+                yield (folio, text)
 
 
-def translate_manuscript(
-    input_file: Path, output_file: Path, sample_size: Optional[int] = None
-):
+def load_manuscript(filepath: Path) -> List[Tuple[str, str]]:
     """
-    Translate entire manuscript or sample.
-    Saves results to JSON file with statistics.
+    Load manuscript from EVA file.
+    Returns list of (folio, text) tuples.
     """
-    print(f"Loading manuscript from {input_file}...")
-    sentences = load_manuscript(input_file)
+    return list(iter_manuscript(filepath))
 
-    if sample_size:
-        sentences = sentences[:sample_size]
-        print(f"Processing sample of {sample_size} sentences...")
-    else:
-        print(f"Processing all {len(sentences)} sentences...")
 
-    results = []
-    stats = {
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+
+def new_statistics() -> Dict:
+    """Return empty running statistics for a translation run."""
+    return {
         "total_sentences": 0,
         "total_words": 0,
         "high_confidence_words": 0,
@@ -365,25 +471,34 @@ def translate_manuscript(
         "recognition_rates": [],
     }
 
-    for i, (folio, text) in enumerate(sentences):
-        if (i + 1) % 100 == 0:
-            print(f"  Processed {i + 1}/{len(sentences)} sentences...")
 
-        translation = translate_sentence(text, folio)
-        results.append(translation)
-
-        # Update statistics
-        stats["total_sentences"] += 1
-        stats["total_words"] += translation["statistics"]["total_words"]
-        stats["high_confidence_words"] += translation["statistics"]["high_confidence"]
-        stats["medium_confidence_words"] += translation["statistics"][
-            "medium_confidence"
-        ]
-        stats["reversal_matches"] += translation["statistics"]["reversal_matches"]
-        stats["unknown_words"] += translation["statistics"]["unknown"]
-        stats["recognition_rates"].append(translation["statistics"]["recognition_rate"])
-
-    # Calculate overall statistics
+def merge_statistics(stats: Dict, shard_stats: Dict):
+    """Add the statistics of one translated shard to the running statistics."""
+    for key in (
+        "total_sentences",
+        "total_words",
+        "high_confidence_words",
+        "medium_confidence_words",
+        "reversal_matches",
+        "unknown_words",
+    ):
+        stats[key] += shard_stats[key]
+    stats["recognition_rates"].extend(shard_stats["recognition_rates"])
+
+
+def update_statistics(stats: Dict, translation: Dict):
+    """Add one translated sentence to the running statistics."""
+    stats["total_sentences"] += 1
+    stats["total_words"] += translation["statistics"]["total_words"]
+    stats["high_confidence_words"] += translation["statistics"]["high_confidence"]
+    stats["medium_confidence_words"] += translation["statistics"]["medium_confidence"]
+    stats["reversal_matches"] += translation["statistics"]["reversal_matches"]
+    stats["unknown_words"] += translation["statistics"]["unknown"]
+    stats["recognition_rates"].append(translation["statistics"]["recognition_rate"])
+
+
+def finalize_statistics(stats: Dict):
+    """Calculate overall rates once all sentences have been counted."""
     if stats["total_words"] > 0:
         stats["overall_recognition_rate"] = (
             (stats["high_confidence_words"] + stats["medium_confidence_words"])
@@ -403,24 +518,21 @@ def translate_manuscript(
         else 0
     )
 
-    # Save results
-    output_data = {
-        "metadata": {
-            "source_file": str(input_file),
-            "total_sentences": stats["total_sentences"],
-            "total_words": stats["total_words"],
-            "vocabulary_size": len(SEMANTIC_MEANINGS),
-            "prefix_count": len(PREFIXES),
-            "suffix_count": len(SUFFIXES),
-        },
-        "statistics": stats,
-        "translations": results,
+
+def build_metadata(input_file: Path, stats: Dict) -> Dict:
+    """Return the metadata block describing a translation run."""
+    return {
+        "source_file": str(input_file),
+        "total_sentences": stats["total_sentences"],
+        "total_words": stats["total_words"],
+        "vocabulary_size": len(SEMANTIC_MEANINGS),
+        "prefix_count": len(PREFIXES),
+        "suffix_count": len(SUFFIXES),
     }
 
-    print(f"\nSaving results to {output_file}...")
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
 
+def print_summary(stats: Dict, output_file: Path):
+    """Print the end-of-run summary."""
     print("\n" + "=" * 80)
     print("TRANSLATION COMPLETE")
     print("=" * 80)
@@ -436,51 +548,368 @@ def translate_manuscript(
         f"  Unknown: {(stats['unknown_words'] / stats['total_words'] * 100) if stats['total_words'] > 0 else 0:.1f}%"
     )
     print(f"Average sentence recognition: {stats['average_sentence_recognition']:.1f}%")
+    cache_stats = get_cache_stats()
+    print(
+        f"Translation cache: {cache_stats['hits']} hits / "
+        f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.1f}% hit rate)"
+    )
     print(f"\nResults saved to: {output_file}")
     print("=" * 80)
 
+
+# ============================================================================
+# MANUSCRIPT TRANSLATION
+# ============================================================================
+
+
+def iter_translations(
+    sentences: Iterable[Tuple[str, str]], stats: Dict, total: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Translate sentences one at a time, updating stats as a side effect.
+    Yields one per-sentence translation dict per input sentence.
+    """
+    for i, (folio, text) in enumerate(sentences):
+        if (i + 1) % 100 == 0:
+            if total:
+                print(f"  Processed {i + 1}/{total} sentences...")
+            else:
+                print(f"  Processed {i + 1} sentences...")
+
+        translation = translate_sentence(text, folio)
+        update_statistics(stats, translation)
+        yield translation
+
+
+# ============================================================================
+# PARALLEL TRANSLATION - Folio-sharded process pool
+# ============================================================================
+
+# Sentences per shard; folios are never split, so shards may be slightly larger
+SHARD_SIZE = 250
+
+
+def iter_folio_shards(
+    sentences: Iterable[Tuple[str, str]], shard_size: int = SHARD_SIZE
+) -> Iterator[List[Tuple[str, str]]]:
+    """
+    Group sentences into contiguous shards of whole folios.
+    Shards are yielded in manuscript order.
+    """
+    shard = []
+    for folio, text in sentences:
+        if len(shard) >= shard_size and shard[-1][0] != folio:
+            yield shard
+            shard = []
+        shard.append((folio, text))
+    if shard:
+        yield shard
+
+
+def init_worker(
+    semantic_meanings: Dict, prefixes: Dict, suffixes: Dict, reversal_dict: Dict
+):
+    """
+    Install the parent's dictionaries in a worker process.
+    Workers started with "spawn" re-import this module, so any in-memory
+    dictionary edits made by the caller would otherwise be lost.
+    """
+    for target, source in (
+        (SEMANTIC_MEANINGS, semantic_meanings),
+        (PREFIXES, prefixes),
+        (SUFFIXES, suffixes),
+        (REVERSAL_DICT, reversal_dict),
+    ):
+        # With "fork" the arguments may be the very same dict objects
+        source = dict(source)
+        target.clear()
+        target.update(source)
+    invalidate_translation_cache()
+
+
+def translate_shard(shard: List[Tuple[str, str]]) -> Tuple[List[Dict], Dict, Dict]:
+    """
+    Translate one shard in a worker process.
+    Returns (translations, shard statistics, cache hit/miss delta).
+    """
+    hits, misses = CACHE_STATS["hits"], CACHE_STATS["misses"]
+    stats = new_statistics()
+    translations = [translate_sentence(text, folio) for folio, text in shard]
+    for translation in translations:
+        update_statistics(stats, translation)
+    cache_delta = {
+        "hits": CACHE_STATS["hits"] - hits,
+        "misses": CACHE_STATS["misses"] - misses,
+    }
+    return translations, stats, cache_delta
+
+
+def iter_translations_parallel(
+    sentences: Iterable[Tuple[str, str]],
+    stats: Dict,
+    workers: int,
+    total: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Parallel counterpart of iter_translations().
+    Shards are translated by a process pool and merged back in manuscript
+    order, so output and statistics match the serial run exactly.
+    """
+    with Pool(
+        workers,
+        initializer=init_worker,
+        initargs=(SEMANTIC_MEANINGS, PREFIXES, SUFFIXES, REVERSAL_DICT),
+    ) as pool:
+        for translations, shard_stats, cache_delta in pool.imap(
+            translate_shard, iter_folio_shards(sentences)
+        ):
+            merge_statistics(stats, shard_stats)
+            CACHE_STATS["hits"] += cache_delta["hits"]
+            CACHE_STATS["misses"] += cache_delta["misses"]
+            if total:
+                print(f"  Processed {stats['total_sentences']}/{total} sentences...")
+            else:
+                print(f"  Processed {stats['total_sentences']} sentences...")
+            yield from translations
+
+
+def translate_manuscript(
+    input_file: Path,
+    output_file: Path,
+    sample_size: Optional[int] = None,
+    output_format: str = "json",
+    readable_file: Optional[Path] = None,
+    workers: int = 1,
+):
+    """
+    Translate entire manuscript or sample.
+    Saves results to JSON (or streamed JSONL) file with statistics.
+    If readable_file is given, the human-readable text is written as well.
+    With workers > 1, folio shards are translated in a process pool.
+    """
+    if output_format == "jsonl":
+        return stream_manuscript_translation(
+            input_file, output_file, sample_size, readable_file, workers
+        )
+
+    print(f"Loading manuscript from {input_file}...")
+    sentences = load_manuscript(input_file)
+
+    if sample_size:
+        sentences = sentences[:sample_size]
+        print(f"Processing sample of {sample_size} sentences...")
+    else:
+        print(f"Processing all {len(sentences)} sentences...")
+
+    stats = new_statistics()
+    if workers > 1:
+        print(f"Using {workers} worker processes...")
+        results = list(
+            iter_translations_parallel(sentences, stats, workers, len(sentences))
+        )
+    else:
+        results = list(iter_translations(sentences, stats, len(sentences)))
+    finalize_statistics(stats)
+
+    # Save results
+    output_data = {
+        "metadata": build_metadata(input_file, stats),
+        "statistics": stats,
+        "translations": results,
+    }
+
+    print(f"\nSaving results to {output_file}...")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+    if readable_file:
+        write_readable_translation(
+            output_data["translations"], output_data["metadata"], stats, readable_file
+        )
+
+    print_summary(stats, output_file)
+
     return output_data
 
 
-def create_readable_translation(json_file: Path, output_txt: Path):
+def stream_manuscript_translation(
+    input_file: Path,
+    output_file: Path,
+    sample_size: Optional[int] = None,
+    readable_file: Optional[Path] = None,
+    workers: int = 1,
+) -> Dict:
     """
-    Create human-readable translation file from JSON results.
+    Translate manuscript as a stream, writing one JSONL record per sentence.
+
+    File layout: a {"record": "metadata"} header line, one
+    {"record": "sentence", ...} line per sentence, and a
+    {"record": "statistics"} trailer with the final statistics.
+    Only the running statistics are kept in memory.
+    Returns the final metadata and statistics (without translations).
     """
-    with open(json_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    print(f"Streaming manuscript from {input_file}...")
+    sentences = iter_manuscript(input_file)
+    if sample_size:
+        sentences = islice(sentences, sample_size)
+        print(f"Processing sample of {sample_size} sentences...")
 
-    with open(output_txt, "w", encoding="utf-8") as f:
-        f.write("=" * 80 + "\n")
-        f.write("VOYNICH MANUSCRIPT TRANSLATION\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Total sentences: {data['metadata']['total_sentences']}\n")
-        f.write(
-            f"Overall recognition: {data['statistics'].get('overall_recognition_rate', 0):.1f}%\n"
+    stats = new_statistics()
+    metadata = build_metadata(input_file, stats)
+    del metadata["total_sentences"], metadata["total_words"]
+
+    print(f"Writing records to {output_file}...")
+    with open(output_file, "w", encoding="utf-8") as f:
+        write_jsonl_record(f, {"record": "metadata", **metadata})
+
+        if workers > 1:
+            print(f"Using {workers} worker processes...")
+            translations = iter_translations_parallel(sentences, stats, workers)
+        else:
+            translations = iter_translations(sentences, stats)
+        if readable_file:
+            translations = tee_to_readable_body(translations, readable_file)
+
+        for translation in translations:
+            write_jsonl_record(f, {"record": "sentence", **translation})
+
+        finalize_statistics(stats)
+        metadata = build_metadata(input_file, stats)
+        write_jsonl_record(
+            f, {"record": "statistics", "metadata": metadata, "statistics": stats}
         )
-        f.write("=" * 80 + "\n\n")
 
-        for trans in data["translations"]:
-            f.write(
-                f"[{trans['folio']}] ({trans['statistics']['recognition_rate']:.0f}% recognized)\n"
-            )
-            f.write(f"Original:    {trans['original']}\n")
-            f.write(f"Translation: {trans['final_translation']}\n")
-            f.write("\n")
-
-            # Word-by-word breakdown for sentences with <100% recognition
-            if trans["statistics"]["recognition_rate"] < 100:
-                f.write("  Word breakdown:\n")
-                for word in trans["words"]:
-                    if word["confidence"] != "high":
-                        morph = word["morphology"]
-                        f.write(
-                            f"    {word['original']}: {' '.join(morph['translation'])}\n"
-                        )
-                f.write("\n")
+    if readable_file:
+        finish_readable_translation(metadata, stats, readable_file)
+
+    print_summary(stats, output_file)
+
+    return {"metadata": metadata, "statistics": stats}
+
+
+def write_jsonl_record(f, record: Dict):
+    """Write one compact JSON record per line."""
+    f.write(json.dumps(record, ensure_ascii=False))
+    f.write("\n")
+
+
+def iter_jsonl_translation(jsonl_file: Path) -> Iterator[Dict]:
+    """
+    Lazily read a streamed JSONL translation.
+    Yields every record (metadata header, sentences, statistics trailer).
+    """
+    with open(jsonl_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# ============================================================================
+# READABLE OUTPUT
+# ============================================================================
+
+
+def write_readable_header(f, metadata: Dict, stats: Dict):
+    """Write the summary header of the readable translation."""
+    f.write("=" * 80 + "\n")
+    f.write("VOYNICH MANUSCRIPT TRANSLATION\n")
+    f.write("=" * 80 + "\n")
+    f.write(f"Total sentences: {metadata['total_sentences']}\n")
+    f.write(f"Overall recognition: {stats.get('overall_recognition_rate', 0):.1f}%\n")
+    f.write("=" * 80 + "\n\n")
+
+
+def write_readable_entry(f, trans: Dict):
+    """Write one translated sentence to the readable translation."""
+    f.write(
+        f"[{trans['folio']}] ({trans['statistics']['recognition_rate']:.0f}% recognized)\n"
+    )
+    f.write(f"Original:    {trans['original']}\n")
+    f.write(f"Translation: {trans['final_translation']}\n")
+    f.write("\n")
+
+    # Word-by-word breakdown for sentences with <100% recognition
+    if trans["statistics"]["recognition_rate"] < 100:
+        f.write("  Word breakdown:\n")
+        for word in trans["words"]:
+            if word["confidence"] != "high":
+                morph = word["morphology"]
+                f.write(f"    {word['original']}: {' '.join(morph['translation'])}\n")
+        f.write("\n")
+
+
+def write_readable_translation(
+    translations: Iterable[Dict], metadata: Dict, stats: Dict, output_txt: Path
+):
+    """Write human-readable translation when totals are already known."""
+    with open(output_txt, "w", encoding="utf-8") as f:
+        write_readable_header(f, metadata, stats)
+        for trans in translations:
+            write_readable_entry(f, trans)
 
     print(f"Readable translation saved to: {output_txt}")
 
 
+def readable_body_path(output_txt: Path) -> Path:
+    """Temporary file holding the readable body until totals are known."""
+    return output_txt.with_name(output_txt.name + ".body")
+
+
+def tee_to_readable_body(
+    translations: Iterable[Dict], output_txt: Path
+) -> Iterator[Dict]:
+    """
+    Pass translations through while rendering each one to the readable body.
+    The header needs final totals, so the body goes to a side file first.
+    """
+    with open(readable_body_path(output_txt), "w", encoding="utf-8") as body:
+        for trans in translations:
+            write_readable_entry(body, trans)
+            yield trans
+
+
+def finish_readable_translation(metadata: Dict, stats: Dict, output_txt: Path):
+    """Prepend the header to the streamed readable body."""
+    body_path = readable_body_path(output_txt)
+    with open(output_txt, "w", encoding="utf-8") as f:
+        write_readable_header(f, metadata, stats)
+        with open(body_path, "r", encoding="utf-8") as body:
+            shutil.copyfileobj(body, f)
+    body_path.unlink()
+
+    print(f"Readable translation saved to: {output_txt}")
+
+
+def create_readable_translation(json_file: Path, output_txt: Path):
+    """
+    Create human-readable translation file from saved results.
+    Accepts the monolithic JSON output or a streamed .jsonl file; the
+    latter is read lazily, one record at a time.
+    """
+    if json_file.suffix == ".jsonl":
+        metadata, stats = {}, {}
+
+        def sentences():
+            for record in iter_jsonl_translation(json_file):
+                if record["record"] == "sentence":
+                    yield record
+                elif record["record"] == "statistics":
+                    metadata.update(record["metadata"])
+                    stats.update(record["statistics"])
+
+        for _ in tee_to_readable_body(sentences(), output_txt):
+            pass
+        finish_readable_translation(metadata, stats, output_txt)
+        return
+
+    with open(json_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    write_readable_translation(
+        data["translations"], data["metadata"], data["statistics"], output_txt
+    )
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -498,17 +927,29 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--output",
-        default="COMPLETE_MANUSCRIPT_TRANSLATION.json",
-        help="Output JSON file",
+        default=None,
+        help="Output file (default: COMPLETE_MANUSCRIPT_TRANSLATION.json/.jsonl)",
     )
     parser.add_argument(
         "--readable",
         default="COMPLETE_MANUSCRIPT_TRANSLATION.txt",
         help="Readable translation file",
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        help="json: single JSON document; jsonl: stream one record per sentence",
+    )
     parser.add_argument(
         "--sample", type=int, help="Process only first N sentences (for testing)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Translate folio shards in N processes (0 = one per CPU core)",
+    )
 
     args = parser.parse_args()
 
@@ -516,7 +957,8 @@ if __name__ == "__main__":
     script_dir = Path(__file__).parent
     manuscript_dir = script_dir.parent.parent
     input_path = manuscript_dir / args.input
-    output_json = manuscript_dir / args.output
+    output_name = args.output or f"COMPLETE_MANUSCRIPT_TRANSLATION.{args.format}"
+    output_path = manuscript_dir / output_name
     output_txt = manuscript_dir / args.readable
 
     if not input_path.exists():
@@ -524,12 +966,16 @@ if __name__ == "__main__":
         print("Please provide correct path to EVA transcription file.")
         exit(1)
 
-    # Translate manuscript
-    results = translate_manuscript(input_path, output_json, args.sample)
-
-    # Create readable version
-    create_readable_translation(output_json, output_txt)
+    # Translate manuscript and write readable version in the same pass
+    results = translate_manuscript(
+        input_path,
+        output_path,
+        args.sample,
+        output_format=args.format,
+        readable_file=output_txt,
+        workers=args.workers or os.cpu_count() or 1,
+    )
 
     print("\nTranslation complete! Review files:")
-    print(f"  - Detailed JSON: {output_json}")
+    print(f"  - Detailed {args.format.upper()}: {output_path}")
     print(f"  - Readable text: {output_txt}")
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Persistent Translation Store
+Keeps the manuscript translation in SQLite, indexed by word type, so a
+dictionary change only retranslates the types it can affect instead of
+rerunning the whole manuscript and rewriting the monolithic JSON.
+
+Tables:
+    types       one row per word type: segmentation, confidence and the
+                full translate_word() dict (JSON)
+    tokens      (sentence, position) -> word type
+    sentences   folio, original text and per-sentence statistics
+    dictionary  the SEMANTIC_MEANINGS / PREFIXES / SUFFIXES / REVERSAL_DICT
+                entries the stored translations were made with
+    meta        source file
+
+Given the translator's current dictionaries, update() diffs them against
+the stored ones and retranslates only the types whose result could change:
+    SEMANTIC_MEANINGS key k   types equal to k or with root k
+    PREFIXES key p            types starting with p
+    SUFFIXES key s            types containing s
+    REVERSAL_DICT key r       types in the e↔o class of r or of r reversed
+then recomputes the statistics of the sentences containing them.
+
+Usage:
+    python scripts/translator/translation_store.py build
+    (edit the dictionaries in complete_manuscript_translator.py)
+    python scripts/translator/translation_store.py update
+    python scripts/translator/translation_store.py export --output OUT.json
+"""
+
+import sys
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import DEFAULT_CACHE_DIR
+from common.transform_index import eo_key
+from translator import complete_manuscript_translator as translator
+
+DEFAULT_STORE = DEFAULT_CACHE_DIR / "translation_store.sqlite"
+
+# Dictionary kinds, in the order init_worker() takes them
+DICTIONARY_KINDS = ("semantic", "prefix", "suffix", "reversal")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dictionary (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS types (
+    word TEXT PRIMARY KEY,
+    prefix TEXT,
+    root TEXT,
+    eo_key TEXT NOT NULL,
+    confidence TEXT NOT NULL,
+    final_translation TEXT NOT NULL,
+    translation TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS types_root ON types (root);
+CREATE INDEX IF NOT EXISTS types_eo_key ON types (eo_key);
+CREATE TABLE IF NOT EXISTS sentences (
+    id INTEGER PRIMARY KEY,
+    folio TEXT NOT NULL,
+    original TEXT NOT NULL,
+    total_words INTEGER NOT NULL,
+    high_confidence INTEGER NOT NULL,
+    medium_confidence INTEGER NOT NULL,
+    reversal_matches INTEGER NOT NULL,
+    unknown INTEGER NOT NULL,
+    recognition_rate REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    sentence INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    PRIMARY KEY (sentence, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tokens_word ON tokens (word);
+"""
+
+
+def current_dictionaries() -> Dict[str, Dict]:
+    """The translator's dictionaries as they are now."""
+    return {
+        "semantic": translator.SEMANTIC_MEANINGS,
+        "prefix": translator.PREFIXES,
+        "suffix": translator.SUFFIXES,
+        "reversal": translator.REVERSAL_DICT,
+    }
+
+
+def dictionary_diff(old: Dict[str, Dict], new: Dict[str, Dict]) -> Dict[str, Set[str]]:
+    """Keys added, removed or changed, per dictionary kind."""
+    diff = {}
+    for kind in DICTIONARY_KINDS:
+        before, after = old.get(kind, {}), new.get(kind, {})
+        diff[kind] = {
+            key
+            for key in before.keys() | after.keys()
+            if key not in before or key not in after or before[key] != after[key]
+        }
+    return diff
+
+
+def sentence_statistics(confidences: List[str]) -> Tuple:
+    """Per-sentence statistics, as computed by translate_sentence()."""
+    total = len(confidences)
+    high = confidences.count("high")
+    medium = confidences.count("medium")
+    reversal = confidences.count("reversal-hypothesis")
+    unknown = confidences.count("unknown")
+    rate = ((high + medium) / total * 100) if total > 0 else 0
+    return total, high, medium, reversal, unknown, rate
+
+
+class TranslationStore:
+    """SQLite-backed, type-indexed manuscript translation."""
+
+    def __init__(self, path=DEFAULT_STORE):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def build(self, input_file: Path, sample_size: Optional[int] = None) -> int:
+        """
+        Translate a manuscript from scratch with the current dictionaries,
+        replacing any stored translation. Returns the number of sentences.
+        """
+        translator.invalidate_translation_cache()
+        sentences = list(translator.iter_manuscript(Path(input_file)))
+        if sample_size:
+            sentences = sentences[:sample_size]
+
+        with self.db:
+            for table in ("tokens", "sentences", "types", "dictionary", "meta"):
+                self.db.execute(f"DELETE FROM {table}")
+            self.db.execute(
+                "INSERT INTO meta VALUES ('source_file', ?)", (str(input_file),)
+            )
+            self._save_dictionaries(current_dictionaries())
+
+            token_rows = []
+            for sentence_id, (folio, text) in enumerate(sentences):
+                words = [w.lower() for w in text.split()]
+                token_rows.extend(
+                    (sentence_id, position, word) for position, word in enumerate(words)
+                )
+                self.db.execute(
+                    "INSERT INTO sentences VALUES (?, ?, ?, 0, 0, 0, 0, 0, 0)",
+                    (sentence_id, folio, text),
+                )
+            self.db.executemany("INSERT INTO tokens VALUES (?, ?, ?)", token_rows)
+
+            types = list(dict.fromkeys(word for _, _, word in token_rows))
+            self._store_types(types)
+            self._refresh_sentences(range(len(sentences)))
+        return len(sentences)
+
+    def _save_dictionaries(self, dictionaries: Dict[str, Dict]):
+        self.db.execute("DELETE FROM dictionary")
+        self.db.executemany(
+            "INSERT INTO dictionary VALUES (?, ?, ?)",
+            (
+                (kind, key, json.dumps(value, ensure_ascii=False))
+                for kind in DICTIONARY_KINDS
+                for key, value in dictionaries[kind].items()
+            ),
+        )
+
+    def _store_types(self, words: Iterable[str]):
+        """(Re)translate word types with the translator's current dictionaries."""
+        rows = []
+        for word in words:
+            translation = translator.translate_word(word)
+            morphology = translation["morphology"]
+            rows.append(
+                (
+                    word,
+                    morphology["prefix"],
+                    morphology["root"],
+                    eo_key(word),
+                    translation["confidence"],
+                    translation["final_translation"],
+                    json.dumps(translation, ensure_ascii=False),
+                )
+            )
+        self.db.executemany("INSERT OR REPLACE INTO types VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _refresh_sentences(self, sentence_ids: Iterable[int]):
+        """Recompute the statistics of the given sentences from their types."""
+        rows = []
+        for sentence_id in sentence_ids:
+            confidences = [
+                confidence
+                for (confidence,) in self.db.execute(
+                    "SELECT types.confidence FROM tokens JOIN types USING (word) "
+                    "WHERE tokens.sentence = ? ORDER BY tokens.position",
+                    (sentence_id,),
+                )
+            ]
+            rows.append((*sentence_statistics(confidences), sentence_id))
+        self.db.executemany(
+            "UPDATE sentences SET total_words = ?, high_confidence = ?, "
+            "medium_confidence = ?, reversal_matches = ?, unknown = ?, "
+            "recognition_rate = ? WHERE id = ?",
+            rows,
+        )
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+
+    def stored_dictionaries(self) -> Dict[str, Dict]:
+        """The dictionaries the stored translations were made with."""
+        dictionaries = {kind: {} for kind in DICTIONARY_KINDS}
+        for kind, key, value in self.db.execute("SELECT kind, key, value FROM dictionary"):
+            dictionaries[kind][key] = json.loads(value)
+        return dictionaries
+
+    def affected_types(self, diff: Dict[str, Set[str]]) -> Set[str]:
+        """Stored word types whose translation a dictionary diff could change."""
+        affected: Set[str] = set()
+
+        def collect(query: str, params: Tuple):
+            affected.update(word for (word,) in self.db.execute(query, params))
+
+        for key in diff["semantic"]:
+            collect("SELECT word FROM types WHERE word = ?1 OR root = ?1", (key,))
+        for key in diff["prefix"]:
+            collect(
+                "SELECT word FROM types WHERE substr(word, 1, length(?1)) = ?1", (key,)
+            )
+        for key in diff["suffix"]:
+            collect("SELECT word FROM types WHERE instr(word, ?) > 0", (key,))
+        for key in diff["reversal"]:
+            collect(
+                "SELECT word FROM types WHERE eo_key IN (?, ?)",
+                (eo_key(key), eo_key(key)[::-1]),
+            )
+        return affected
+
+    def update(self, dictionaries: Optional[Dict[str, Dict]] = None) -> Dict:
+        """
+        Bring the store in line with new dictionaries (default: the
+        translator's current ones), retranslating only affected types.
+        Returns counts of changed keys, retranslated types and sentences.
+        """
+        dictionaries = dictionaries or current_dictionaries()
+        diff = dictionary_diff(self.stored_dictionaries(), dictionaries)
+        affected = sorted(self.affected_types(diff))
+
+        # Install the new dictionaries in the translator (clears its cache)
+        translator.init_worker(*(dictionaries[kind] for kind in DICTIONARY_KINDS))
+
+        sentence_ids: Set[int] = set()
+        with self.db:
+            if affected:
+                self._store_types(affected)
+                for start in range(0, len(affected), 500):
+                    batch = affected[start : start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    sentence_ids.update(
+                        sentence_id
+                        for (sentence_id,) in self.db.execute(
+                            f"SELECT DISTINCT sentence FROM tokens WHERE word IN ({placeholders})",
+                            batch,
+                        )
+                    )
+                self._refresh_sentences(sorted(sentence_ids))
+            self._save_dictionaries(dictionaries)
+
+        return {
+            "changed_keys": sum(len(keys) for keys in diff.values()),
+            "retranslated_types": len(affected),
+            "updated_sentences": len(sentence_ids),
+        }
+
+    # ------------------------------------------------------------------
+    # Reading back
+    # ------------------------------------------------------------------
+
+    def statistics(self) -> Dict:
+        """Run statistics, as translate_manuscript() reports them."""
+        stats = translator.new_statistics()
+        for row in self.db.execute(
+            "SELECT total_words, high_confidence, medium_confidence, "
+            "reversal_matches, unknown, recognition_rate FROM sentences ORDER BY id"
+        ):
+            total, high, medium, reversal, unknown, rate = row
+            stats["total_sentences"] += 1
+            stats["total_words"] += total
+            stats["high_confidence_words"] += high
+            stats["medium_confidence_words"] += medium
+            stats["reversal_matches"] += reversal
+            stats["unknown_words"] += unknown
+            stats["recognition_rates"].append(rate)
+        translator.finalize_statistics(stats)
+        return stats
+
+    def iter_translations(self) -> Iterator[Dict]:
+        """Per-sentence translation dicts, in manuscript order."""
+        types = {
+            word: json.loads(translation)
+            for word, translation in self.db.execute("SELECT word, translation FROM types")
+        }
+        tokens = self.db.execute("SELECT sentence, word FROM tokens ORDER BY sentence, position")
+        pending = next(tokens, None)
+        for row in self.db.execute("SELECT * FROM sentences ORDER BY id"):
+            sentence_id, folio, original, total, high, medium, reversal, unknown, rate = row
+            words = []
+            while pending is not None and pending[0] == sentence_id:
+                words.append(types[pending[1]])
+                pending = next(tokens, None)
+            yield {
+                "folio": folio,
+                "original": original,
+                "words": words,
+                "final_translation": " ".join(w["final_translation"] for w in words),
+                "statistics": {
+                    "total_words": total,
+                    "high_confidence": high,
+                    "medium_confidence": medium,
+                    "reversal_matches": reversal,
+                    "unknown": unknown,
+                    "recognition_rate": rate,
+                },
+            }
+
+    def export_json(self, output_file: Path) -> Dict:
+        """Write the monolithic translation JSON (same layout as the translator)."""
+        (source_file,) = self.db.execute(
+            "SELECT value FROM meta WHERE key = 'source_file'"
+        ).fetchone()
+        stats = self.statistics()
+        dictionaries = self.stored_dictionaries()
+        metadata = {
+            "source_file": source_file,
+            "total_sentences": stats["total_sentences"],
+            "total_words": stats["total_words"],
+            "vocabulary_size": len(dictionaries["semantic"]),
+            "prefix_count": len(dictionaries["prefix"]),
+            "suffix_count": len(dictionaries["suffix"]),
+        }
+        output_data = {
+            "metadata": metadata,
+            "statistics": stats,
+            "translations": list(self.iter_translations()),
+        }
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        return output_data
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Build, incrementally update or export the translation store"
+    )
+    parser.add_argument("command", choices=["build", "update", "export"])
+    parser.add_argument("--store", default=str(DEFAULT_STORE), help="SQLite file")
+    parser.add_argument(
+        "--input",
+        default="data/voynich/eva_transcription/voynich_eva_takahashi.txt",
+        help="Input EVA file (build)",
+    )
+    parser.add_argument(
+        "--output",
+        default="COMPLETE_MANUSCRIPT_TRANSLATION.json",
+        help="Output JSON (export)",
+    )
+    parser.add_argument("--sample", type=int, help="Only the first N sentences (build)")
+    args = parser.parse_args()
+
+    manuscript_dir = Path(__file__).resolve().parent.parent.parent
+    start = time.perf_counter()
+    with TranslationStore(args.store) as store:
+        if args.command == "build":
+            count = store.build(manuscript_dir / args.input, args.sample)
+            print(f"Translated {count} sentences into {args.store}")
+        elif args.command == "update":
+            result = store.update()
+            print(f"Changed dictionary keys: {result['changed_keys']}")
+            print(f"Retranslated types: {result['retranslated_types']}")
+            print(f"Updated sentences: {result['updated_sentences']}")
+        else:
+            output_path = manuscript_dir / args.output
+            store.export_json(output_path)
+            print(f"Exported translation to {output_path}")
+        stats = store.statistics()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Overall recognition rate: {stats.get('overall_recognition_rate', 0):.1f}%")
+    print(f"Done in {elapsed:.1f} ms")
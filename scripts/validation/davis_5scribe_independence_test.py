@@ -13,8 +13,12 @@ Key test:
 - Special focus: 4 scribes (2,3,4,5) all write Dialect B - do they show consistent grammar?
 """
 
-import re
+import sys
 from collections import defaultdict, Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import base_folio, load_corpus
 
 # Phase 9 validated vocabulary (28 terms)
 VALIDATED_ROOTS = [
@@ -84,60 +88,41 @@ def load_voynich_by_scribe(eva_filepath, davis_filepath):
     # Load Davis attributions
     attributions = load_davis_attributions(davis_filepath)
 
-    # Load EVA data grouped by scribe
+    # Load EVA data grouped by scribe (shared parsed-corpus cache)
     data = {1: [], 2: [], 3: [], 4: [], 5: []}
-    current_folio = None
-    current_scribe = None
-
-    with open(eva_filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line_stripped = line.strip()
-
-            # Skip comments and metadata
-            if line_stripped.startswith("#") or not line_stripped:
-                continue
-
-            # Extract folio
-            folio_match = re.match(r"<f(\d+[rv])>", line_stripped)
-            if folio_match:
-                current_folio = f"f{folio_match.group(1)}"
-                if current_folio in attributions:
-                    current_scribe = attributions[current_folio]["scribe"]
-                else:
-                    current_scribe = None
-                continue
+    corpus = load_corpus(eva_filepath)
+    skipped_words = 0
+    skipped_folios = set()
+
+    for folio, _, words in corpus.iter_lines():
+        # Foldout panels (f85r1, f85r2, ...) inherit their folio's attribution
+        attribution = attributions.get(folio) or attributions.get(base_folio(folio))
+        if not attribution:
+            # Pages whose base folio has no Davis attribution (f85r1, fRos, ...)
+            skipped_words += sum(1 for word in words if len(word) >= 2)
+            skipped_folios.add(folio)
+            continue
+
+        for i, word in enumerate(words):
+            if len(word) >= 2:
+                position = (
+                    "initial"
+                    if i == 0
+                    else ("final" if i == len(words) - 1 else "medial")
+                )
+                data[attribution["scribe"]].append(
+                    {
+                        "word": word,
+                        "folio": folio,
+                        "position": position,
+                    }
+                )
 
-            # Parse text line
-            if current_folio and current_scribe and line_stripped.startswith("<"):
-                # Extract words from line
-                text_match = re.search(r">\s+(.+)$", line_stripped)
-                if text_match:
-                    text = text_match.group(1)
-                    # Clean text
-                    text = re.sub(r"<[^>]+>", "", text)  # Remove tags
-                    text = re.sub(r"\[.*?\]", "", text)  # Remove uncertain readings
-                    text = re.sub(
-                        r"[{}!@#\$%^&*()<>]", "", text
-                    )  # Remove special chars
-                    text = re.sub(
-                        r"[.,;:\-]", " ", text
-                    )  # Replace punctuation with space
-
-                    words = text.split()
-                    for i, word in enumerate(words):
-                        if word and len(word) >= 2:
-                            position = (
-                                "initial"
-                                if i == 0
-                                else ("final" if i == len(words) - 1 else "medial")
-                            )
-                            data[current_scribe].append(
-                                {
-                                    "word": word,
-                                    "folio": current_folio,
-                                    "position": position,
-                                }
-                            )
+    if skipped_folios:
+        print(
+            f"  Skipped {skipped_words} words on {len(skipped_folios)} pages "
+            f"with no Davis attribution: {', '.join(sorted(skipped_folios))}"
+        )
 
     return data
 
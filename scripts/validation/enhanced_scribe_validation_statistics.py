@@ -15,8 +15,12 @@ import seaborn as sns
 from scipy.stats import chi2_contingency, power_divergence
 from scipy.stats import norm
 import pandas as pd
-import re
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import base_folio, load_corpus
 
 # Phase 9 validated vocabulary
 VALIDATED_ROOTS = [
@@ -62,46 +66,37 @@ def load_voynich_by_scribe(eva_filepath, davis_filepath):
     attributions = load_davis_attributions(davis_filepath)
 
     data = {1: [], 2: [], 3: [], 4: [], 5: []}
-    current_folio = None
-    current_scribe = None
-
-    with open(eva_filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line_stripped = line.strip()
-
-            if line_stripped.startswith("#") or not line_stripped:
-                continue
+    corpus = load_corpus(eva_filepath)
+    skipped_words = 0
+    skipped_folios = set()
+
+    for folio, _, words in corpus.iter_lines():
+        attribution = attributions.get(folio) or attributions.get(base_folio(folio))
+        if not attribution:
+            skipped_words += sum(1 for word in words if len(word) >= 2)
+            skipped_folios.add(folio)
+            continue
 
-            folio_match = re.match(r"<f(\d+[rv])>", line_stripped)
-            if folio_match:
-                current_folio = f"f{folio_match.group(1)}"
-                current_scribe = attributions.get(current_folio, {}).get("scribe")
-                continue
+        for i, word in enumerate(words):
+            if len(word) >= 2:
+                position = (
+                    "initial"
+                    if i == 0
+                    else ("final" if i == len(words) - 1 else "medial")
+                )
+                data[attribution["scribe"]].append(
+                    {
+                        "word": word,
+                        "folio": folio,
+                        "position": position,
+                    }
+                )
 
-            if current_folio and current_scribe and line_stripped.startswith("<"):
-                text_match = re.search(r">\s+(.+)$", line_stripped)
-                if text_match:
-                    text = text_match.group(1)
-                    text = re.sub(r"<[^>]+>", "", text)
-                    text = re.sub(r"\[.*?\]", "", text)
-                    text = re.sub(r"[{}!@#\$%^&*()<>]", "", text)
-                    text = re.sub(r"[.,;:\-]", " ", text)
-
-                    words = text.split()
-                    for i, word in enumerate(words):
-                        if word and len(word) >= 2:
-                            position = (
-                                "initial"
-                                if i == 0
-                                else ("final" if i == len(words) - 1 else "medial")
-                            )
-                            data[current_scribe].append(
-                                {
-                                    "word": word,
-                                    "folio": current_folio,
-                                    "position": position,
-                                }
-                            )
+    if skipped_folios:
+        print(
+            f"  Skipped {skipped_words} words on {len(skipped_folios)} pages "
+            f"with no Davis attribution: {', '.join(sorted(skipped_folios))}"
+        )
 
     return data
 
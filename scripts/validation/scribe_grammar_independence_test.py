@@ -15,8 +15,12 @@ This provides INDEPENDENT validation that the grammar is real linguistic structu
 not just patterns specific to one scribe's writing habits.
 """
 
-import re
+import sys
 from collections import defaultdict, Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.eva_corpus import base_folio, load_corpus
 
 # Phase 9 validated vocabulary (28 terms)
 VALIDATED_SUFFIXES = {
@@ -82,57 +86,41 @@ def load_voynich_with_currier(eva_filepath, currier_filepath):
                 folio, language = parts[0], parts[1]
                 currier_map[folio] = language
 
-    # Now load EVA data grouped by Currier language
+    # Now load EVA data grouped by Currier language (shared parsed-corpus cache)
     data = {"A": [], "B": []}
-    current_folio = None
-    current_language = None
-
-    with open(eva_filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line_stripped = line.strip()
-
-            # Skip comments and metadata
-            if line_stripped.startswith("#") or not line_stripped:
-                continue
-
-            # Extract folio
-            folio_match = re.match(r"<f(\d+[rv])>", line_stripped)
-            if folio_match:
-                current_folio = f"f{folio_match.group(1)}"
-                current_language = currier_map.get(current_folio)
-                continue
+    corpus = load_corpus(eva_filepath)
+    skipped_words = 0
+    skipped_folios = set()
+
+    for folio, _, words in corpus.iter_lines():
+        # Foldout panels (f85r1, f85r2, ...) inherit their folio's language
+        language = currier_map.get(folio) or currier_map.get(base_folio(folio))
+        if language not in data:
+            # Pages whose base folio has no A/B classification (f85r1, fRos, ...)
+            skipped_words += sum(1 for word in words if len(word) >= 2)
+            skipped_folios.add(folio)
+            continue
+
+        for i, word in enumerate(words):
+            if len(word) >= 2:
+                position = (
+                    "initial"
+                    if i == 0
+                    else ("final" if i == len(words) - 1 else "medial")
+                )
+                data[language].append(
+                    {
+                        "word": word,
+                        "folio": folio,
+                        "position": position,
+                    }
+                )
 
-            # Parse text line
-            if current_folio and current_language and line_stripped.startswith("<"):
-                # Extract words from line
-                text_match = re.search(r">\s+(.+)$", line_stripped)
-                if text_match:
-                    text = text_match.group(1)
-                    # Clean text
-                    text = re.sub(r"<[^>]+>", "", text)  # Remove tags
-                    text = re.sub(r"\[.*?\]", "", text)  # Remove uncertain readings
-                    text = re.sub(
-                        r"[{}!@#\$%^&*()<>]", "", text
-                    )  # Remove special chars
-                    text = re.sub(
-                        r"[.,;:\-]", " ", text
-                    )  # Replace punctuation with space
-
-                    words = text.split()
-                    for i, word in enumerate(words):
-                        if word and len(word) >= 2:
-                            position = (
-                                "initial"
-                                if i == 0
-                                else ("final" if i == len(words) - 1 else "medial")
-                            )
-                            data[current_language].append(
-                                {
-                                    "word": word,
-                                    "folio": current_folio,
-                                    "position": position,
-                                }
-                            )
+    if skipped_folios:
+        print(
+            f"  Skipped {skipped_words} words on {len(skipped_folios)} pages "
+            f"with no Currier language: {', '.join(sorted(skipped_folios))}"
+        )
 
     return data
 
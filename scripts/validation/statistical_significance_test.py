@@ -14,157 +14,172 @@ Target: p < 0.05 for statistical significance
 """
 
 import re
-from scipy.stats import chi2_contingency
-import numpy as np
+import sys
+from pathlib import Path
 
+import numpy as np
 
-def load_voynich_data():
-    """Load Voynich manuscript data with section labels"""
-    filepath = "data/voynich/eva_transcription/ZL3b-n.txt"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.enrichment import SectionEnrichment, chi_square_2x2
+from common.token_array import TokenArray, UNKNOWN_SECTION, intern_words
 
-    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-        lines = f.readlines()
+SECTIONS = ["herbal", "biological", "pharmaceutical", "astronomical"]
 
-    words_with_context = []
-    current_section = "unknown"
 
-    for line_num, line in enumerate(lines, 1):
-        line_stripped = line.strip()
+def load_voynich_data():
+    """
+    Load Voynich manuscript data with section labels
+    Returns a TokenArray (line = file line number); per-token context is
+    available lazily through words_with_context.record(i)
+    """
+    filepath = "data/voynich/eva_transcription/ZL3b-n.txt"
 
-        if not line_stripped or line_stripped.startswith("#"):
-            continue
+    words = []
+    line_numbers = []
+    token_sections = []
+    section_names = SECTIONS + [UNKNOWN_SECTION]
+    current_section = section_names.index(UNKNOWN_SECTION)
 
-        # Extract folio/section info from line
-        # Format: <f1r> or <f1r.1,@P0>
-        folio_match = re.search(r"<f(\d+)[rv]", line_stripped)
-        if folio_match:
-            folio_num = int(folio_match.group(1))
-
-            # Section ranges (based on Voynich manuscript structure)
-            if 1 <= folio_num <= 66:
-                current_section = "herbal"
-            elif 67 <= folio_num <= 73:
-                current_section = "astronomical"
-            elif 75 <= folio_num <= 84:
-                current_section = "biological"
-            elif 85 <= folio_num <= 116:
-                current_section = "pharmaceutical"
-            else:
-                current_section = "unknown"
-
-        # Extract words from line (remove markup)
-        # Remove everything in brackets, angle brackets, special chars
-        text = re.sub(r"\[.*?\]", "", line_stripped)  # Remove [...]
-        text = re.sub(r"\{.*?\}", "", text)  # Remove {...}
-        text = re.sub(r"<.*?>", "", text)  # Remove <...>
-        text = re.sub(r"[!*=\-@$%,.:;()']", " ", text)  # Replace punctuation with space
-        words = re.findall(r"[a-z]{2,}", text.lower())  # Only words 2+ chars
-
-        for i, word in enumerate(words):
-            context_before = " ".join(words[max(0, i - 3) : i])
-            context_after = " ".join(words[i + 1 : min(len(words), i + 4)])
-
-            words_with_context.append(
-                {
-                    "word": word,
-                    "line": line_num,
-                    "section": current_section,
-                    "context_before": context_before,
-                    "context_after": context_after,
-                    "full_sentence": " ".join(words),
-                }
-            )
-
-    return words_with_context
+    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        for line_num, line in enumerate(f, 1):
+            line_stripped = line.strip()
+
+            if not line_stripped or line_stripped.startswith("#"):
+                continue
+
+            # Extract folio/section info from line
+            # Format: <f1r> or <f1r.1,@P0>
+            folio_match = re.search(r"<f(\d+)[rv]", line_stripped)
+            if folio_match:
+                folio_num = int(folio_match.group(1))
+
+                # Section ranges (based on Voynich manuscript structure)
+                if 1 <= folio_num <= 66:
+                    section = "herbal"
+                elif 67 <= folio_num <= 73:
+                    section = "astronomical"
+                elif 75 <= folio_num <= 84:
+                    section = "biological"
+                elif 85 <= folio_num <= 116:
+                    section = "pharmaceutical"
+                else:
+                    section = UNKNOWN_SECTION
+                current_section = section_names.index(section)
+
+            # Extract words from line (remove markup)
+            # Remove everything in brackets, angle brackets, special chars
+            text = re.sub(r"\[.*?\]", "", line_stripped)  # Remove [...]
+            text = re.sub(r"\{.*?\}", "", text)  # Remove {...}
+            text = re.sub(r"<.*?>", "", text)  # Remove <...>
+            text = re.sub(r"[!*=\-@$%,.:;()']", " ", text)  # Replace punctuation with space
+            line_words = re.findall(r"[a-z]{2,}", text.lower())  # Only words 2+ chars
+
+            words.extend(line_words)
+            line_numbers.extend([line_num] * len(line_words))
+            token_sections.extend([current_section] * len(line_words))
+
+    vocab, tokens = intern_words(words)
+    return TokenArray(
+        vocab,
+        tokens,
+        line=np.asarray(line_numbers, dtype=np.int32),
+        section=np.asarray(token_sections, dtype=np.int16),
+        sections=section_names,
+    )
 
 
 def count_by_section(words_with_context):
     """Count total words in each section"""
+    totals = words_with_context.section_totals()
     section_counts = {
-        "herbal": 0,
-        "biological": 0,
-        "pharmaceutical": 0,
-        "astronomical": 0,
+        section: int(totals[words_with_context.sections.index(section)])
+        for section in ["herbal", "biological", "pharmaceutical", "astronomical"]
     }
 
-    for entry in words_with_context:
-        section = entry.get("section", "unknown")
-        if section in section_counts:
-            section_counts[section] += 1
-
     total = sum(section_counts.values())
     return section_counts, total
 
 
-def count_term_by_section(term, words_with_context):
-    """Count term occurrences in each section"""
-    term_counts = {"herbal": 0, "biological": 0, "pharmaceutical": 0, "astronomical": 0}
+def count_terms_by_section(terms, words_with_context):
+    """
+    Count occurrences of every term in each section
+    One grouped count over the whole corpus, shared by all terms
+    Returns {term: (term_counts, term_total)}
+    """
+    matrix = words_with_context.section_counts()
+    columns = [words_with_context.sections.index(section) for section in SECTIONS]
 
-    for entry in words_with_context:
-        word = entry["word"].lower()
-        section = entry.get("section", "unknown")
+    results = {}
+    for term, type_id in zip(terms, words_with_context.ids(terms).tolist()):
+        if type_id >= 0:
+            row = matrix[type_id, columns].tolist()
+        else:
+            row = [0] * len(SECTIONS)
+        term_counts = dict(zip(SECTIONS, row))
+        results[term] = (term_counts, sum(row))
+    return results
 
-        if word == term and section in term_counts:
-            term_counts[section] += 1
 
-    term_total = sum(term_counts.values())
-    return term_counts, term_total
+def count_term_by_section(term, words_with_context):
+    """Count term occurrences in each section"""
+    return count_terms_by_section([term], words_with_context)[term]
 
 
 def chi_square_test(term, term_counts, section_counts, total_words):
     """
     Perform chi-square test for term enrichment in each section
+    All four 2x2 tables (term vs other words, in vs not in section) are
+    tested at once
 
     Returns: dictionary with p-values for each section
     """
-    results = {}
-
-    for section in ["herbal", "biological", "pharmaceutical", "astronomical"]:
-        # Observed frequencies
-        obs_term_in_section = term_counts[section]
-        obs_term_not_in_section = sum(term_counts.values()) - obs_term_in_section
-        obs_other_in_section = section_counts[section] - obs_term_in_section
-        obs_other_not_in_section = (
-            total_words - sum(term_counts.values()) - obs_other_in_section
-        )
-
-        # Create contingency table
-        # Rows: [term, other words]
-        # Cols: [in section, not in section]
-        observed = np.array(
-            [
-                [obs_term_in_section, obs_term_not_in_section],
-                [obs_other_in_section, obs_other_not_in_section],
-            ]
-        )
+    term_total = sum(term_counts.values())
 
-        # Expected frequency if term followed overall distribution
-        expected_term_in_section = (
-            sum(term_counts.values()) * section_counts[section]
-        ) / total_words
+    # Observed frequencies
+    # Rows: [term, other words]
+    # Cols: [in section, not in section]
+    obs_term_in_section = np.array([term_counts[s] for s in SECTIONS])
+    obs_term_not_in_section = term_total - obs_term_in_section
+    section_sizes = np.array([section_counts[s] for s in SECTIONS])
+    obs_other_in_section = section_sizes - obs_term_in_section
+    obs_other_not_in_section = total_words - term_total - obs_other_in_section
+
+    # Expected frequency if term followed overall distribution
+    expected_term_in_section = (term_total * section_sizes) / total_words
+
+    chi2, p_values = chi_square_2x2(
+        obs_term_in_section,
+        obs_term_not_in_section,
+        obs_other_in_section,
+        obs_other_not_in_section,
+    )
 
+    results = {}
+    for i, section in enumerate(SECTIONS):
+        expected = float(expected_term_in_section[i])
+        observed = int(obs_term_in_section[i])
         # Enrichment ratio (observed / expected)
-        enrichment = (
-            obs_term_in_section / expected_term_in_section
-            if expected_term_in_section > 0
-            else 0
-        )
-
-        # Chi-square test
-        chi2, p_value, dof, expected = chi2_contingency(observed)
-
         results[section] = {
-            "observed": obs_term_in_section,
-            "expected": expected_term_in_section,
-            "enrichment": enrichment,
-            "chi2": chi2,
-            "p_value": p_value,
-            "significant": p_value < 0.05,
+            "observed": observed,
+            "expected": expected,
+            "enrichment": observed / expected if expected > 0 else 0,
+            "chi2": float(chi2[i]),
+            "p_value": float(p_values[i]),
+            "significant": bool(p_values[i] < 0.05),
         }
 
     return results
 
 
+def screen_lexicon(words_with_context, test="g", alpha=0.05, min_count=10):
+    """
+    Test every word type for enrichment in every section at once
+    Benjamini-Hochberg FDR control over all tested (term, section) cells
+    """
+    engine = SectionEnrichment.from_token_array(words_with_context, sections=SECTIONS)
+    return engine, engine.screen(test=test, alpha=alpha, min_count=min_count)
+
+
 def print_term_analysis(term, term_counts, section_counts, total_words):
     """Print detailed analysis for a term"""
     term_total = sum(term_counts.values())
@@ -246,9 +261,10 @@ def main():
     }
 
     all_results = {}
+    claim_counts = count_terms_by_section(list(terms_to_test), words_with_context)
 
     for term, expected_section in terms_to_test.items():
-        term_counts, term_total = count_term_by_section(term, words_with_context)
+        term_counts, term_total = claim_counts[term]
         results = print_term_analysis(term, term_counts, section_counts, total_words)
         all_results[term] = results
 
@@ -319,9 +335,10 @@ def main():
     ]
 
     enrichment_summary = {}
+    term_section_counts = count_terms_by_section(all_terms, words_with_context)
 
     for term in all_terms:
-        term_counts, term_total = count_term_by_section(term, words_with_context)
+        term_counts, term_total = term_section_counts[term]
         if term_total == 0:
             continue
         results = chi_square_test(term, term_counts, section_counts, total_words)
@@ -372,6 +389,30 @@ def main():
         print("✗ Most terms show universal distribution")
         print("  This may indicate terms are grammatical rather than semantic")
 
+    # Lexicon-wide screen: every type x section, FDR controlled
+    print(f"\n\n{'=' * 70}")
+    print("LEXICON-WIDE SCREEN: ALL WORD TYPES (G-test, Benjamini-Hochberg)")
+    print("=" * 70)
+
+    engine, screened = screen_lexicon(words_with_context)
+    tested_types = int((engine.term_totals >= 10).sum())
+    print(f"\nTypes tested (>= 10 instances): {tested_types:,}")
+    print(f"Enriched (term, section) cells at FDR 5%: {len(screened):,}")
+    print(f"\n  {'Section':<15} {'Enriched types':<15}")
+    print(f"  {'-' * 30}")
+    for section in SECTIONS:
+        n = sum(1 for row in screened if row["section"] == section)
+        print(f"  {section:<15} {n:<15}")
+
+    print(
+        f"\n{'Term':<10} {'Section':<16} {'Observed':<10} {'Expected':<10} {'Enrichment':<12} {'q-value':<12}"
+    )
+    print(f"{'-' * 70}")
+    for row in screened[:20]:
+        print(
+            f"{row['word']:<10} {row['section']:<16} {row['observed']:<10} {row['expected']:<10.1f} {row['enrichment']:<11.2f}× {row['q_value']:<12.2e}"
+        )
+
     print("\n" + "=" * 70)
     print("STATISTICAL SIGNIFICANCE TESTING COMPLETE")
     print("=" * 70)
@@ -8,9 +8,15 @@ Verify:
 """
 
 import json
+import sys
 from collections import Counter
+from pathlib import Path
 import random
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.cooccurrence import CooccurrenceMatrix
+from common.translation_columns import load_translation
+
 print("=" * 80)
 print("TASK 4: STATISTICAL ROBUSTNESS CHECK")
 print("=" * 80)
@@ -18,12 +24,10 @@ print()
 
 # Load data
 print("Loading Phase 17 data...")
-with open("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json", "r", encoding="utf-8") as f:
-    data = json.load(f)
+tr = load_translation("COMPLETE_MANUSCRIPT_TRANSLATION_PHASE17.json")
 
-translations = data.get("translations", [])
-total_words = data.get("metadata", {}).get("total_words", 37125)
-print(f"✓ Loaded {len(translations)} sentences, {total_words:,} words")
+total_words = tr.metadata.get("total_words", 37125)
+print(f"✓ Loaded {tr.sentence_count} sentences, {total_words:,} words")
 print()
 
 # ============================================================================
@@ -44,19 +48,15 @@ CLAIMED_RATES = [
 ]
 
 
-def calculate_verb_rate(root_name, translations):
+# Tokens carrying a VERB suffix (any suffix containing dy/edy/ody)
+verb_tokens = tr.suffix_mask(lambda s: any(vs in s for vs in ["dy", "edy", "ody"]))
+
+
+def calculate_verb_rate(root_name, tr):
     """Calculate actual VERB suffix rate for a root"""
-    total = 0
-    verb_count = 0
-
-    for sentence in translations:
-        for word in sentence.get("words", []):
-            morphology = word.get("morphology", {})
-            if morphology.get("root") == root_name:
-                total += 1
-                suffixes = morphology.get("suffixes", [])
-                if any(vs in s for s in suffixes for vs in ["dy", "edy", "ody"]):
-                    verb_count += 1
+    root_tokens = tr.mask("root", root_name)
+    total = int(root_tokens.sum())
+    verb_count = int((root_tokens & verb_tokens).sum())
 
     return (verb_count / total * 100) if total > 0 else 0, total
 
@@ -64,7 +64,7 @@ def calculate_verb_rate(root_name, translations):
 suffix_results = []
 
 for root, claimed_rate, suffix_type in CLAIMED_RATES:
-    actual_rate, instances = calculate_verb_rate(root, translations)
+    actual_rate, instances = calculate_verb_rate(root, tr)
     difference = abs(actual_rate - claimed_rate)
 
     # Allow ±5% tolerance
@@ -113,39 +113,15 @@ CLAIMED_CONTEXTS = [
 ]
 
 
-def calculate_cooccurrence(root1, root2, translations, window=5):
-    """Calculate how often root1 appears near root2 (within window)"""
-    root1_instances = 0
-    cooccur_count = 0
-
-    for sentence in translations:
-        words = sentence.get("words", [])
-        for i, word in enumerate(words):
-            if word.get("morphology", {}).get("root") == root1:
-                root1_instances += 1
-
-                # Check window
-                start = max(0, i - window)
-                end = min(len(words), i + window + 1)
-
-                nearby_roots = [
-                    words[j].get("morphology", {}).get("root")
-                    for j in range(start, end)
-                    if j != i
-                ]
-
-                if root2 in nearby_roots:
-                    cooccur_count += 1
-
-    return (
-        cooccur_count / root1_instances * 100
-    ) if root1_instances > 0 else 0, root1_instances
+# One pass builds the root x root window matrix (sentence-bounded);
+# each claimed context is then a lookup instead of a full rescan
+cooccurrence = CooccurrenceMatrix(tr.sentence_labels("root"), window=5)
 
 
 cooccur_results = []
 
 for root1, root2, claimed_pct, description in CLAIMED_CONTEXTS:
-    actual_pct, instances = calculate_cooccurrence(root1, root2, translations)
+    actual_pct, instances = cooccurrence.rate(root1, root2)
     difference = abs(actual_pct - claimed_pct)
 
     # Allow ±10% tolerance for co-occurrence (less precise)
@@ -185,13 +161,13 @@ print()
 
 # Sample 1000 random words
 random.seed(42)
-sample_words = []
-
-for sentence in translations[:200]:  # Sample from first 200 sentences
-    sample_words.extend(sentence.get("words", []))
+# Token indices of the first 200 sentences
+sample_words = list(range(int(tr.sentence_offsets[min(200, tr.sentence_count)])))
 
 if len(sample_words) > 1000:
     sample_words = random.sample(sample_words, 1000)
+sample_roots = tr.decode("root", tr.root[sample_words])
+sample_originals = tr.decode("word", tr.word[sample_words])
 
 # Count pattern matches in real data
 known_roots_65 = {
@@ -256,9 +232,7 @@ known_roots_65 = {
     "ee",
 }
 
-real_matches = sum(
-    1 for w in sample_words if w.get("morphology", {}).get("root") in known_roots_65
-)
+real_matches = sum(1 for root in sample_roots if root in known_roots_65)
 real_rate = real_matches / len(sample_words) * 100
 
 print(
@@ -277,8 +251,7 @@ def scramble_word(word):
 
 # Count "matches" in scrambled (should be very low)
 scrambled_matches = 0
-for word in sample_words:
-    original = word.get("original", "")
+for original in sample_originals:
     scrambled = scramble_word(original)
 
     # Check if scrambled happens to match any known pattern (very unlikely)
@@ -0,0 +1,102 @@
+"""
+Query engine checks against a brute-force scan of a small translation.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from common.corpus_query import CorpusIndex
+from common.translation_columns import TranslationColumns, columns_from_translation
+
+SENTENCES = [
+    ["ch", "ch", "sh", "ch", "al"],
+    ["sh", "ch", "ch", "ch"],
+    ["al", "ch", "sh", "ok", "ch", "ch", "sh"],
+    ["ch"],
+]
+
+
+def make_translation(sentences):
+    """Minimal translator output with one word per root."""
+    translations = []
+    for i, roots in enumerate(sentences):
+        words = [
+            {
+                "original": root,
+                "morphology": {
+                    "original": root,
+                    "prefix": None,
+                    "root": root,
+                    "suffixes": [],
+                    "translation": [f"[?{root}]"],
+                    "method": "morphological",
+                },
+                "reversal": None,
+                "final_translation": f"[?{root}]",
+                "confidence": "unknown",
+            }
+            for root in roots
+        ]
+        translations.append(
+            {
+                "folio": f"f{i + 1}r",
+                "original": " ".join(roots),
+                "words": words,
+                "statistics": {"recognition_rate": 0.0},
+            }
+        )
+    return {"translations": translations}
+
+
+def build_index():
+    return CorpusIndex(TranslationColumns(*columns_from_translation(make_translation(SENTENCES))))
+
+
+def brute_force_tokens():
+    """(token, sentence, start, end, root) for every token."""
+    tokens, start = [], 0
+    for s, roots in enumerate(SENTENCES):
+        for pos, root in enumerate(roots):
+            tokens.append((start + pos, s, start, start + len(roots), root))
+        start += len(roots)
+    return tokens
+
+
+def test_window_where_keeps_every_context_hit():
+    index = build_index()
+    tokens = brute_force_tokens()
+    root = {t: r for t, _, _, _, r in tokens}
+
+    expected = []
+    for t, _, start, end, r in tokens:
+        if r != "ch":
+            continue
+        for offset in (-2, -1, 1, 2):
+            u = t + offset
+            if start <= u < end and root[u] == "ch":
+                expected.append(u)
+
+    got = index.query(root="ch").window(2).where(root="ch")
+    assert list(got) == expected
+    assert len(set(got)) < len(got)
+
+
+def test_near_and_set_operators_accept_context_queries():
+    index = build_index()
+    tokens = brute_force_tokens()
+    context = index.query(root="ch").window(2).where(root="ch")
+    hits = set(context)
+
+    expected = [
+        t
+        for t, _, start, end, r in tokens
+        if r == "sh" and any(start <= t + o < end and t + o in hits for o in (-1, 1))
+    ]
+    assert list(index.query(root="sh").near(context, window=1)) == expected
+
+    ch = index.query(root="ch")
+    assert list(ch & context) == sorted(hits)
+    assert list(ch - context) == sorted(set(ch) - hits)
+    assert list(context & ch) == list(context)
+    assert len(context - ch) == 0
@@ -0,0 +1,38 @@
+"""
+Pooling checks for the section enrichment helpers.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from common.enrichment import pool_sections, rate_ratios
+
+SECTIONS = {
+    "herbal": {"sentence_count": 10, "al_count": 4},
+    "stars": {"sentence_count": 5, "al_count": 1},
+    "empty": {"sentence_count": 0, "al_count": 0},
+}
+FIELDS = ["sentence_count", "al_count"]
+
+
+def test_pool_sections_sums_fields():
+    pooled = pool_sections(SECTIONS, ["herbal", "stars"], FIELDS, exposure="sentence_count")
+    assert pooled == {"sentence_count": 15, "al_count": 5}
+    _, _, ratios = rate_ratios(pooled, SECTIONS["stars"], ["al_count"])
+    assert ratios == [pytest.approx((5 / 15) / (1 / 5))]
+
+
+def test_pool_sections_rejects_missing_section():
+    with pytest.raises(KeyError, match="pharmaceutical"):
+        pool_sections(SECTIONS, ["herbal", "pharmaceutical"], FIELDS)
+    pooled = pool_sections(SECTIONS, ["herbal", "pharmaceutical"], FIELDS, allow_missing=True)
+    assert pooled == {"sentence_count": 10, "al_count": 4}
+
+
+def test_pool_sections_rejects_empty_exposure():
+    with pytest.raises(ValueError, match="sentence_count"):
+        pool_sections(SECTIONS, ["empty"], FIELDS, exposure="sentence_count")
+    assert pool_sections(SECTIONS, ["empty"], FIELDS)["sentence_count"] == 0
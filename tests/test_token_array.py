@@ -0,0 +1,31 @@
+"""
+TokenArray index-width checks.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from common.eva_corpus import load_corpus
+from common.token_array import TokenArray
+
+
+def test_from_corpus_keeps_folio_ids_past_int16(tmp_path):
+    # Plain text: every line is its own folio
+    lines = 40000
+    source = tmp_path / "plain.txt"
+    source.write_text("".join(f"daiin ol{i % 7} chedy\n" for i in range(lines)), encoding="utf-8")
+
+    tokens = TokenArray.from_corpus(load_corpus(source, cache_dir=None))
+    assert len(tokens.folios) == lines
+    assert tokens.folio.min() == 0
+    assert tokens.folio.max() == lines - 1
+    assert tokens.folios[tokens.folio[-1]] == f"line{lines}"
+
+
+def test_rejects_section_ids_past_int16():
+    with pytest.raises(ValueError, match="sections"):
+        TokenArray(["a"], np.zeros(1, dtype=np.int32), section=np.asarray([40000]))